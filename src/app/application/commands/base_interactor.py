@@ -1,44 +1,112 @@
 import hashlib
+import time
 from datetime import datetime, timezone
+from typing import Any
 
+import orjson
 from sqlalchemy import text
 
-from app.application.common.exceptions.event import EventProcessedError, EventProcessingError
+from app.application.common.exceptions.event import (
+    EventDeadLetteredError,
+    EventProcessedError,
+    EventProcessingError,
+)
+from app.application.common.ports.event_finaliser import EventFinaliser
+from app.application.common.ports.event_metrics import EventMetrics
 from app.application.common.ports.unit_of_work import UnitOfWork
-from app.domain.entities.pub_sub.entity import Event, PubSubMessage
+from app.application.common.services.inline_event_finaliser import INLINE_EVENT_FINALISER
+from app.application.common.services.null_event_metrics import NULL_EVENT_METRICS
+from app.application.common.services.payload_storage_policy import (
+    DEFAULT_PAYLOAD_STORAGE_POLICY,
+    PayloadStoragePolicy,
+)
+from app.application.common.services.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from app.domain.entities.pub_sub.entity import Event, EventOutcome, PubSubMessage
 from app.domain.entities.pub_sub.value_objects import EventStatus
 
+_TRY_LOCK = text("SELECT pg_try_advisory_xact_lock(:topic_key, :message_key)")
+
 
 class BaseEventInteractor:
-    def __init__(self, unit_of_work: UnitOfWork):
+    def __init__(
+        self,
+        unit_of_work: UnitOfWork,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        payload_storage_policy: PayloadStoragePolicy = DEFAULT_PAYLOAD_STORAGE_POLICY,
+        finaliser: EventFinaliser = INLINE_EVENT_FINALISER,
+        metrics: EventMetrics = NULL_EVENT_METRICS,
+    ):
         self.unit_of_work = unit_of_work
+        self.retry_policy = retry_policy
+        self.payload_storage_policy = payload_storage_policy
+        self.finaliser = finaliser
+        self.metrics = metrics
+
+    @classmethod
+    def decode(cls, data: dict[str, Any]) -> object:
+        """
+        The typed message `process_event` works on, built from a payload.
+        Raises `TypeError` for a payload it cannot handle, which the consumer
+        treats as poison and the batch ingestion endpoint rejects up front.
+        """
+        return data
 
-    async def process_event(self, message: PubSubMessage):
+    async def process_event(self, message: PubSubMessage) -> None:
         """Override this in a subclass"""
         raise NotImplementedError
 
-    async def lock_db(self, uow: UnitOfWork, topic: str, message_id: str):
+    async def lock_db(self, uow: UnitOfWork, topic: str, message_id: str) -> None:
         topic_hash = int(hashlib.md5(topic.encode()).hexdigest(), 16) % (2**31)
         message_hash = int(hashlib.md5(message_id.encode()).hexdigest(), 16) % (2**31)
 
         lock_result = await uow.session.execute(
-            text("SELECT pg_try_advisory_xact_lock(:topic_key, :message_key)"),
+            _TRY_LOCK,
             {"topic_key": topic_hash, "message_key": message_hash},
         )
         if not lock_result.scalar():
             raise EventProcessingError(f"Message {message_id} is already being processed")
 
-    async def __call__(self, message: PubSubMessage):
+    async def __call__(self, message: PubSubMessage) -> None:
+        claim_started = time.perf_counter()
+        try:
+            payload_stored = await self.claim(message)
+        finally:
+            self.metrics.observe_claim(time.perf_counter() - claim_started)
+
+        error: Exception | None = None
+        process_started = time.perf_counter()
+        try:
+            await self.process_event(message)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            finalise_started = time.perf_counter()
+            # Set by the claim above.
+            outcome = self.outcome(message, message.delivery_attempt or 1, payload_stored, error)
+            # Returns once the outcome is committed, so the caller only settles the message after that.
+            await self.finaliser.finalise(outcome, self.unit_of_work)
+            self.metrics.observe_outcome(
+                outcome.status, finalise_started - process_started, time.perf_counter() - finalise_started
+            )
+
+    async def claim(self, message: PubSubMessage) -> bool:
+        """
+        Moves the event to PROCESSING, creating its row on first delivery.
+        Returns whether its payload is already stored.
+        """
         message_id = message.message.message_id
         topic = message.topic
+        published_at = message.publish_time
 
         async with self.unit_of_work as uow:
             try:
                 await self.lock_db(uow, topic, message_id)
             except EventProcessingError:
+                self.metrics.observe_rejected(EventStatus.PROCESSING)
                 raise
 
-            event = await uow.events.get_by_id_and_topic(message_id, topic, for_update=True)
+            event = await uow.events.get_by_id_and_topic(message_id, topic, published_at, for_update=True)
 
             if not event:
                 event = Event(
@@ -47,23 +115,48 @@ class BaseEventInteractor:
                     event_type=message.event_type,
                     status=EventStatus.PROCESSING,
                     processing_started_at=datetime.now(timezone.utc),
+                    published_at=published_at,
+                    attempts=1,
+                    payload=self.encode_payload(message) if self.payload_storage_policy.store_on_claim else None,
                 )
                 await uow.events.add(event)
             elif event.status == EventStatus.PROCESSED:
+                self.metrics.observe_rejected(event.status)
                 raise EventProcessedError("Already processed")
             elif event.status == EventStatus.PROCESSING:
+                self.metrics.observe_rejected(event.status)
                 raise EventProcessingError("Already being processed")
+            elif event.status == EventStatus.DEAD_LETTERED:
+                self.metrics.observe_rejected(event.status)
+                raise EventDeadLetteredError(f"Message {message_id} is quarantined")
             elif event.status == EventStatus.FAILED:
                 event.change_status(EventStatus.PROCESSING)
+                event.processing_started_at = datetime.now(timezone.utc)
+                event.attempts += 1
+                if event.payload is None and self.payload_storage_policy.store_on_claim:
+                    event.payload = self.encode_payload(message)
 
-        try:
-            await self.process_event(message)
-            final_status = EventStatus.PROCESSED
-        except Exception:
-            final_status = EventStatus.FAILED
-            raise
-        finally:
-            async with self.unit_of_work as uow:
-                event = await uow.events.get_by_id_and_topic(message_id, topic, for_update=True)
-                if event:
-                    event.change_status(final_status)
+            message.delivery_attempt = event.attempts
+            return event.payload is not None
+
+    def outcome(
+        self, message: PubSubMessage, attempts: int, payload_stored: bool, error: Exception | None
+    ) -> EventOutcome:
+        """
+        A retryable failure is left for the retry worker, which re-runs it from the
+        stored payload instead of waiting for the broker to redeliver it.
+        """
+        message_id, topic, published_at = message.message.message_id, message.topic, message.publish_time
+        if error is None:
+            return EventOutcome(message_id, topic, published_at, EventStatus.PROCESSED)
+        next_attempt_at = self.retry_policy.next_attempt_at(error, attempts, datetime.now(timezone.utc))
+        payload = None
+        if next_attempt_at is not None and not payload_stored:
+            payload = self.encode_payload(message)
+        return EventOutcome(
+            message_id, topic, published_at, EventStatus.FAILED, next_attempt_at=next_attempt_at, payload=payload
+        )
+
+    @staticmethod
+    def encode_payload(message: PubSubMessage) -> bytes:
+        return orjson.dumps(message.data)
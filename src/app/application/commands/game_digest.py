@@ -1,9 +1,19 @@
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from app.application.commands.base_interactor import BaseEventInteractor
 from app.application.common.ports.email_sender import EmailSender
+from app.application.common.ports.event_finaliser import EventFinaliser
+from app.application.common.ports.event_metrics import EventMetrics
 from app.application.common.ports.unit_of_work import UnitOfWork
+from app.application.common.services.inline_event_finaliser import INLINE_EVENT_FINALISER
+from app.application.common.services.null_event_metrics import NULL_EVENT_METRICS
+from app.application.common.services.payload_storage_policy import (
+    DEFAULT_PAYLOAD_STORAGE_POLICY,
+    PayloadStoragePolicy,
+)
+from app.application.common.services.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
 from app.domain.entities.pub_sub.entity import PubSubMessage
 
 
@@ -60,17 +70,30 @@ class GameDigestEventMessage:
     username: str
     incorrect_words: list[dict]
 
+    def __post_init__(self):
+        if not isinstance(self.username, str) or not isinstance(self.incorrect_words, list):
+            raise TypeError("username must be a string and incorrect_words a list")
+
 
 class GameDigestInteractor(BaseEventInteractor):
-    def __init__(self, smtp_sender: EmailSender, unit_of_work: UnitOfWork):
-        super().__init__(unit_of_work)
+    def __init__(
+        self,
+        smtp_sender: EmailSender,
+        unit_of_work: UnitOfWork,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        payload_storage_policy: PayloadStoragePolicy = DEFAULT_PAYLOAD_STORAGE_POLICY,
+        finaliser: EventFinaliser = INLINE_EVENT_FINALISER,
+        metrics: EventMetrics = NULL_EVENT_METRICS,
+    ):
+        super().__init__(unit_of_work, retry_policy, payload_storage_policy, finaliser, metrics)
         self.smtp_sender = smtp_sender
 
+    @classmethod
+    def decode(cls, data: dict[str, Any]) -> GameDigestEventMessage:
+        return GameDigestEventMessage(**data)
+
     async def process_event(self, message: PubSubMessage):
-        try:
-            game_digest_event_message = GameDigestEventMessage(**message.data)
-        except TypeError:
-            raise
+        game_digest_event_message = self.decode(message.data)
         await self.smtp_sender.send(
             game_digest_event_message.username,
             "Game completed! Make sure to learn these words!",
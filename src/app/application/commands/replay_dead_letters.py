@@ -0,0 +1,81 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from app.application.common.ports.event_replayer import EventReplayer
+from app.application.common.ports.unit_of_work import UnitOfWork
+from app.domain.entities.pub_sub.entity import PubSubMessage
+from app.domain.entities.pub_sub.value_objects import EventStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayResult:
+    replayed: list[int] = field(default_factory=list)
+    failed: dict[int, str] = field(default_factory=dict)
+
+
+class ReplayDeadLettersInteractor:
+    """
+    Puts quarantined messages back through their handlers.
+
+    The selected dead letters have their events moved from DEAD_LETTERED back to
+    FAILED with a fresh attempt budget, and the messages are dispatched from the
+    stored payload. Only dead letters whose replay succeeded are marked as
+    replayed; the others stay pending so they can be inspected and replayed again.
+
+    The rows are selected with SKIP LOCKED, but those locks end when the
+    transition commits, before dispatch. A replay started meanwhile can pick the
+    same dead letters and dispatch them again: the handlers' idempotency (the
+    event claim) is the only guard against a second delivery.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWork, replayer: EventReplayer):
+        self.unit_of_work = unit_of_work
+        self.replayer = replayer
+
+    async def __call__(self, ids: Sequence[int] | None = None, limit: int = 100) -> ReplayResult:
+        async with self.unit_of_work as uow:
+            if ids:
+                dead_letters = await uow.dead_letters.get_pending_by_ids(ids)
+            else:
+                dead_letters = await uow.dead_letters.list_pending(limit, for_update=True)
+            await uow.events.transition_many(
+                [
+                    (dead_letter.message_id, dead_letter.topic, dead_letter.published_at)
+                    for dead_letter in dead_letters
+                    if dead_letter.published_at is not None
+                ],
+                from_status=EventStatus.DEAD_LETTERED,
+                to_status=EventStatus.FAILED,
+                attempts=0,
+            )
+
+        if not dead_letters:
+            return ReplayResult()
+
+        messages = []
+        result = ReplayResult()
+        for dead_letter in dead_letters:
+            assert dead_letter.id is not None
+            try:
+                message = PubSubMessage.from_stored(dead_letter.to_stored_message(), dead_letter.topic)
+            except Exception as e:
+                result.failed[dead_letter.id] = repr(e)
+            else:
+                messages.append((dead_letter.id, message))
+
+        outcomes = await self.replayer.replay([message for _, message in messages])
+        for (dead_letter_id, _), error in zip(messages, outcomes, strict=True):
+            if error is None:
+                result.replayed.append(dead_letter_id)
+            else:
+                result.failed[dead_letter_id] = repr(error)
+
+        async with self.unit_of_work as uow:
+            await uow.dead_letters.mark_replayed(result.replayed, datetime.now(timezone.utc))
+
+        logger.info("Replayed %s dead letters, %s failed.", len(result.replayed), len(result.failed))
+        return result
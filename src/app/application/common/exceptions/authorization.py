@@ -0,0 +1,9 @@
+from app.application.common.exceptions.base import ApplicationError
+
+
+class AuthenticationError(ApplicationError):
+    pass
+
+
+class AuthorizationError(ApplicationError):
+    pass
@@ -7,3 +7,7 @@ class EventProcessingError(InfrastructureError):
 
 class EventProcessedError(InfrastructureError):
     pass
+
+
+class EventDeadLetteredError(InfrastructureError):
+    pass
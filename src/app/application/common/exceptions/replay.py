@@ -0,0 +1,9 @@
+from app.application.common.exceptions.base import ApplicationError
+
+
+class ReplayInProgressError(ApplicationError):
+    pass
+
+
+class ReplayJobNotFoundError(ApplicationError):
+    pass
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    size: int
+    # `size` plus MAX_OVERFLOW: the most connections the pool will open.
+    capacity: int
+    checked_out: int
+    # Connections open beyond `size`, borrowed from MAX_OVERFLOW.
+    overflow: int
+    checkouts: int
+    overflow_connects: int
+    timeouts: int
+    invalidated: int
+    # Cumulative counts of checkouts that got a connection within each bound, in seconds ("+Inf" last).
+    wait_buckets: dict[str, int]
+    wait_count: int
+    wait_sum_s: float
+
+    @property
+    def saturation(self) -> float:
+        """The share of the pool's capacity checked out, 1.0 when checkouts have to wait."""
+        return self.checked_out / self.capacity if self.capacity else 0.0
+
+
+class PoolMonitor(Protocol):
+    """
+    Read side of the database connection pool's instrumentation, for sizing
+    the pool against the consumer's concurrency.
+    """
+
+    def stats(self) -> PoolStats:
+        """
+        Returns the current pool state and counters since start-up, cheap enough to be called per HTTP request.
+        """
@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from app.application.common.ports.unit_of_work import UnitOfWork
+from app.domain.entities.pub_sub.entity import EventOutcome
+
+
+class EventFinaliser(Protocol):
+    """
+    Port interface for recording how a claimed event ended.
+
+    The message is settled with the broker once `finalise` returns, so an
+    implementation must not return before the outcome is durable; a raised error
+    leaves the event PROCESSING for the broker or the reaper to pick up again.
+    """
+
+    async def finalise(self, outcome: EventOutcome, unit_of_work: UnitOfWork) -> None:
+        """
+        Records the outcome of a PROCESSING event.
+
+        Args:
+            outcome: The status to move the event to, with its retry schedule.
+            unit_of_work: The interactor's unit of work, for implementations that
+                write inline; batching implementations use their own sessions.
+        """
@@ -0,0 +1,19 @@
+from typing import Protocol
+
+from app.domain.entities.pub_sub.value_objects import EventStatus
+
+
+class EventMetrics(Protocol):
+    """
+    Port interface for timing the stages an interactor takes an event through.
+    Implementations are called on every message and must not block.
+    """
+
+    def observe_claim(self, seconds: float) -> None:
+        """Time spent locking and claiming the event row, whether or not the claim succeeded."""
+
+    def observe_rejected(self, status: EventStatus) -> None:
+        """A delivery turned away because the event already was in `status`."""
+
+    def observe_outcome(self, status: EventStatus, process_seconds: float, finalise_seconds: float) -> None:
+        """A claimed event ended in `status`, after being processed and finalised for the given times."""
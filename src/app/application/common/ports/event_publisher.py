@@ -1,6 +1,21 @@
+from collections.abc import AsyncIterable
+from dataclasses import dataclass, field
 from typing import Protocol
 
 
+@dataclass(frozen=True, slots=True)
+class OutgoingMessage:
+    data: bytes
+    ordering_key: str = ""
+    attributes: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class BatchPublishResult:
+    published: int = 0
+    failed: int = 0
+
+
 class EventPublisher(Protocol):
     """
     Event Publisher is an interface for sending domain events
@@ -12,11 +27,19 @@ class EventPublisher(Protocol):
     by other services.
     """
 
-    async def publish(self, topic_name: str, message: str, **attrs) -> None:
-        """ """
+    async def publish(self, topic_name: str, message: str, ordering_key: str = "", **attrs) -> None:
+        """
+        Messages sharing a non-empty `ordering_key` (e.g. the recipient's username)
+        are delivered in publish order, provided ordering is enabled.
+        """
 
-    async def publish_many(self) -> None:
-        """ """
+    async def publish_many(self, topic_name: str, messages: AsyncIterable[OutgoingMessage]) -> BatchPublishResult:
+        """
+        Publishes messages as they are produced, with a bounded number awaiting
+        the broker, and returns once every one of them is settled. `messages`
+        is only pulled from while there is room, so a slow broker slows the
+        producer down instead of piling messages up in memory.
+        """
 
     async def _ensure_topic(self, topic_name: str) -> None:
         """ """
@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.domain.entities.pub_sub.entity import PubSubMessage
+
+
+class EventReplayer(Protocol):
+    """
+    Port interface for re-running events outside of the broker.
+
+    Messages rebuilt from the database (e.g. dead letters) go through the same
+    dispatcher and interactors as live Pub/Sub deliveries, so idempotency and
+    status tracking behave exactly as they would for a redelivery.
+
+    Implementations belong in the infrastructure layer and are responsible for
+    scoping dependencies per message and bounding how many run at once.
+    """
+
+    async def replay(self, messages: Sequence[PubSubMessage]) -> list[BaseException | None]:
+        """
+        Dispatches every message and waits for all of them to finish.
+
+        Returns:
+            One entry per message, in order: `None` when it was handled,
+            otherwise the exception its handler raised.
+        """
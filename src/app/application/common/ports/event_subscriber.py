@@ -1,6 +1,35 @@
+from dataclasses import dataclass
+from enum import StrEnum
 from typing import Protocol
 
 
+class SubscriberState(StrEnum):
+    STARTING = "starting"
+    RUNNING = "running"
+    BACKOFF = "backoff"
+    STOPPED = "stopped"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriberHealth:
+    state: SubscriberState
+    restarts: int
+    last_error: str | None = None
+    # Messages received and waiting for a worker, i.e. for their email to be sent.
+    backlog: int = 0
+    # Messages received and not settled yet, including the backlog.
+    in_flight: int = 0
+
+    @property
+    def healthy(self) -> bool:
+        """
+        A subscriber backing off between restarts is still considered healthy,
+        only an exhausted restart budget or a stopped listener is not.
+        """
+        return self.state in (SubscriberState.STARTING, SubscriberState.RUNNING, SubscriberState.BACKOFF)
+
+
 class EventConsumer(Protocol):
     """
     Event Subscriber is an interface for consuming domain events
@@ -18,8 +47,20 @@ class EventConsumer(Protocol):
     async def _ensure_subscription(self) -> None:
         """ """
 
-    async def subscribe(self, loop, retry: bool = False) -> None:
-        """ """
+    async def subscribe(self, loop) -> None:
+        """
+        Starts consuming in the background on the given loop and returns immediately.
+        """
+
+    async def stop(self) -> None:
+        """
+        Stops consuming and releases the underlying broker connection.
+        """
+
+    def health(self) -> SubscriberHealth:
+        """
+        Returns the cached listener state, cheap enough to be called per HTTP request.
+        """
 
     async def _ensure_topic(self) -> None:
         """ """
@@ -1,21 +1,53 @@
+from types import TracebackType
 from typing import Protocol, runtime_checkable
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 
+from app.infrastructure.adapters.database.repositories.dead_letter_repository import DeadLetterRepository
 from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
+from app.infrastructure.adapters.database.repositories.event_stats_repository import EventStatsRepository
 
 
 @runtime_checkable
 class UnitOfWork(Protocol):
     events: EventRepository
+    dead_letters: DeadLetterRepository
+    event_stats: EventStatsRepository
     session: AsyncSession
 
     async def __aenter__(self) -> "UnitOfWork": ...
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None: ...
 
     async def commit(self) -> None: ...
 
     async def rollback(self) -> None: ...
+
+
+@runtime_checkable
+class ReadOnlyUnitOfWork(Protocol):
+    """
+    For queries that can tolerate replication lag; may be served by a read
+    replica, and nothing it does is committed.
+    """
+
+    events: EventRepository
+    dead_letters: DeadLetterRepository
+    event_stats: EventStatsRepository
+    session: AsyncSession
+
+    async def __aenter__(self) -> "ReadOnlyUnitOfWork": ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None: ...
@@ -0,0 +1,16 @@
+from app.application.common.ports.unit_of_work import UnitOfWork
+from app.domain.entities.pub_sub.entity import EventOutcome
+
+
+class InlineEventFinaliser:
+    """
+    Writes each outcome in its own transaction on the interactor's unit of work.
+    The fallback when outcomes are not batched.
+    """
+
+    async def finalise(self, outcome: EventOutcome, unit_of_work: UnitOfWork) -> None:
+        async with unit_of_work as uow:
+            await uow.events.finalise_many([outcome])
+
+
+INLINE_EVENT_FINALISER = InlineEventFinaliser()
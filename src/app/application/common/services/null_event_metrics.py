@@ -0,0 +1,17 @@
+from app.domain.entities.pub_sub.value_objects import EventStatus
+
+
+class NullEventMetrics:
+    """Records nothing. The default when interactors are built without metrics."""
+
+    def observe_claim(self, seconds: float) -> None:
+        pass
+
+    def observe_rejected(self, status: EventStatus) -> None:
+        pass
+
+    def observe_outcome(self, status: EventStatus, process_seconds: float, finalise_seconds: float) -> None:
+        pass
+
+
+NULL_EVENT_METRICS = NullEventMetrics()
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class PayloadStoragePolicy:
+    """
+    Whether the message payload is kept on the event row when the event is
+    claimed, so it can be replayed later without the broker.
+
+    Payloads of events scheduled for a retry are always kept, whatever this says,
+    since the retry worker has nothing else to run them from.
+    """
+
+    store_on_claim: bool = True
+
+
+DEFAULT_PAYLOAD_STORAGE_POLICY = PayloadStoragePolicy()
@@ -0,0 +1,89 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from app.domain.entities.pub_sub.value_objects import Priority
+
+# The priority of the notification the current task is handling. Set around a
+# handler run, so the mail sender and the database session below it know which
+# share of their capacity they may use without it being passed down.
+current_priority: ContextVar[Priority] = ContextVar("current_priority", default=Priority.BULK)
+
+
+@contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+class PrioritySlots:
+    """
+    A concurrency limit with a share held back for urgent work.
+
+    Bulk callers get at most `capacity - reserved` slots and urgent callers any
+    of the `capacity`, so however deep the bulk backlog, `reserved` slots are
+    free or about to be for urgent work. Waiting urgent callers are served
+    before waiting bulk ones, each in arrival order.
+
+    Must only be used from one event loop.
+    """
+
+    def __init__(self, capacity: int, reserved: int):
+        if not 0 <= reserved < capacity:
+            raise ValueError(f"Reserved slots must be fewer than the {capacity} there are, got {reserved}.")
+        self._capacity = capacity
+        self._reserved = reserved
+        self._in_use = 0
+        self._waiters: dict[Priority, deque[asyncio.Future[None]]] = {Priority.URGENT: deque(), Priority.BULK: deque()}
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiters in self._waiters.values() for fut in waiters if not fut.done())
+
+    def limit(self, priority: Priority) -> int:
+        return self._capacity if priority is Priority.URGENT else self._capacity - self._reserved
+
+    @asynccontextmanager
+    async def acquire(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Holds a slot for the block, at `priority` or else at the current task's."""
+        await self._take(priority or current_priority.get())
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _take(self, priority: Priority) -> None:
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(fut)
+        self._grant()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():  # granted as it was cancelled
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._in_use -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        for priority in (Priority.URGENT, Priority.BULK):
+            waiters = self._waiters[priority]
+            while waiters and self._in_use < self.limit(priority):
+                fut = waiters.popleft()
+                if not fut.done():
+                    fut.set_result(None)
+                    self._in_use += 1
+            # Drops the cancelled waiters left at the head.
+            while waiters and waiters[0].done():
+                waiters.popleft()
@@ -0,0 +1,39 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.application.common.exceptions.email import EmailDeliveryError
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """
+    Decides whether, and when, a failed event is retried by the database-driven
+    retry worker rather than by a broker redelivery.
+
+    Delays grow exponentially from `initial_delay_s` up to `max_delay_s`, with
+    equal jitter so a burst of failures (e.g. a Gmail outage) does not come back
+    as a burst of retries. Only errors listed in `retry_on` are retried; every
+    other failure is left to the broker.
+    """
+
+    max_attempts: int = 5
+    initial_delay_s: float = 30.0
+    max_delay_s: float = 3600.0
+    multiplier: float = 2.0
+    retry_on: tuple[type[Exception], ...] = (EmailDeliveryError,)
+
+    def should_retry(self, error: BaseException, attempts: int) -> bool:
+        return isinstance(error, self.retry_on) and attempts < self.max_attempts
+
+    def delay_s(self, attempts: int) -> float:
+        ceiling = min(self.max_delay_s, self.initial_delay_s * self.multiplier ** max(attempts - 1, 0))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def next_attempt_at(self, error: BaseException, attempts: int, now: datetime) -> datetime | None:
+        if not self.should_retry(error, attempts):
+            return None
+        return now + timedelta(seconds=self.delay_s(attempts))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -1,3 +1,5 @@
+from typing import Any
+
 from app.domain.entities.pub_sub.entity import PubSubMessage
 
 
@@ -9,6 +11,13 @@ class EventDispatcher:
     def register(self, event_type: str, interactor) -> None:
         self._handlers[event_type] = interactor
 
+    def decode(self, event_type: str, data: dict[str, Any]) -> object:
+        """Decodes a payload as the handler of `event_type` would, raising `TypeError` when it could not."""
+        interactor_cls = self._handlers.get(event_type)
+        if interactor_cls is None:
+            raise TypeError(f"No handler for event type {event_type!r}")
+        return interactor_cls.decode(data)
+
     async def dispatch(self, message: PubSubMessage):
         interactor_cls = self._handlers.get(message.event_type)
         async with self.container() as request:
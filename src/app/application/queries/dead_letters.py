@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+
+from app.application.common.ports.unit_of_work import ReadOnlyUnitOfWork
+from app.domain.entities.pub_sub.entity import DeadLetter
+
+
+class ListDeadLettersQuery:
+    """
+    Pages through dead letters that have not been replayed yet, oldest first.
+    Pass the last `id` of a page as `after_id` to get the next one.
+    """
+
+    def __init__(self, unit_of_work: ReadOnlyUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    async def __call__(self, limit: int, after_id: int | None = None) -> Sequence[DeadLetter]:
+        async with self.unit_of_work as uow:
+            return await uow.dead_letters.list_pending(limit, after_id)
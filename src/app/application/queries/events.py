@@ -0,0 +1,99 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.application.common.exceptions.query import QueryRangeError
+from app.application.common.ports.unit_of_work import ReadOnlyUnitOfWork
+from app.domain.entities.pub_sub.entity import DeliveryCount, Event, EventCount
+from app.domain.entities.pub_sub.value_objects import EventStatus, TimeBucket
+
+MAX_BUCKETS = 1_000
+
+
+def _check_range(bucket: TimeBucket, published_from: datetime, published_until: datetime) -> None:
+    span_s = (published_until - published_from).total_seconds()
+    if span_s <= 0:
+        raise QueryRangeError("published_until must be later than published_from.")
+    if span_s / bucket.seconds > MAX_BUCKETS:
+        raise QueryRangeError(f"The range spans more than {MAX_BUCKETS} {bucket.value} buckets.")
+
+
+class ListEventsQuery:
+    """
+    Pages through events matching the filters in id order. Pass the last `id`
+    of a page as `after_id` to get the next one.
+    """
+
+    def __init__(self, unit_of_work: ReadOnlyUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    async def __call__(
+        self,
+        limit: int,
+        after_id: int | None = None,
+        message_id: str | None = None,
+        topic: str | None = None,
+        status: EventStatus | None = None,
+        event_type: str | None = None,
+        published_from: datetime | None = None,
+        published_until: datetime | None = None,
+    ) -> Sequence[Event]:
+        async with self.unit_of_work as uow:
+            return [
+                event
+                async for event in uow.events.list(
+                    message_id=message_id,
+                    status=status,
+                    topic=topic,
+                    event_type=event_type,
+                    published_from=published_from,
+                    published_until=published_until,
+                    after_id=after_id,
+                    limit=limit,
+                    page_size=limit,
+                )
+            ]
+
+
+class CountEventsQuery:
+    """
+    Counts events per time bucket, topic and status over a publish-time range,
+    from the events themselves. The range may span at most `MAX_BUCKETS`
+    buckets, which bounds both the scan and the response.
+    """
+
+    def __init__(self, unit_of_work: ReadOnlyUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    async def __call__(
+        self,
+        bucket: TimeBucket,
+        published_from: datetime,
+        published_until: datetime,
+        topic: str | None = None,
+    ) -> Sequence[EventCount]:
+        _check_range(bucket, published_from, published_until)
+        async with self.unit_of_work as uow:
+            return await uow.events.count_by_bucket(bucket, published_from, published_until, topic)
+
+
+class DeliveryStatsQuery:
+    """
+    Handler-run outcomes per time bucket, topic, event type and status over a
+    publish-time range, read from the `event_stats` rollup rather than the
+    events, so dashboards cost the same however busy the range was.
+    """
+
+    def __init__(self, unit_of_work: ReadOnlyUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    async def __call__(
+        self,
+        bucket: TimeBucket,
+        published_from: datetime,
+        published_until: datetime,
+        topic: str | None = None,
+        event_type: str | None = None,
+    ) -> Sequence[DeliveryCount]:
+        _check_range(bucket, published_from, published_until)
+        async with self.unit_of_work as uow:
+            return await uow.event_stats.count_by_bucket(bucket, published_from, published_until, topic, event_type)
@@ -1,20 +1,47 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from google.cloud import pubsub_v1
 
-from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.domain.entities.pub_sub.value_objects import EventStatus, Priority
+
+
+@dataclass(frozen=True, slots=True)
+class StoredMessage:
+    """
+    Stand-in for a broker message when an event is re-run from the database
+    (dead-letter replay) rather than delivered by Pub/Sub. There is no lease
+    to settle, so acknowledgement is a no-op.
+    """
+
+    message_id: str
+    data: bytes
+    attributes: dict[str, str]
+    publish_time: datetime
+    ordering_key: str = ""
+
+    def ack(self) -> None:
+        pass
+
+    def nack(self) -> None:
+        pass
+
+    def modify_ack_deadline(self, seconds: int) -> None:
+        pass
 
 
 @dataclass
 class PubSubMessage:
-    message: pubsub_v1.subscriber.message.Message
+    message: pubsub_v1.subscriber.message.Message | StoredMessage
     data: dict
     attributes: dict
     event_type: str
     publish_time: datetime
     topic: str
+    ordering_key: str | None = None
+    # Set by the interactor from the event's attempt counter once the event is claimed.
+    delivery_attempt: int | None = None
 
     @classmethod
     def from_pubsub(cls, message: pubsub_v1.subscriber.message.Message, topic: str) -> "PubSubMessage":
@@ -24,9 +51,26 @@ class PubSubMessage:
         assert isinstance(event_type, str)
         publish_time = message.publish_time
         return cls(
-            message=message, data=data, attributes=attrs, event_type=event_type, publish_time=publish_time, topic=topic
+            message=message,
+            data=data,
+            attributes=attrs,
+            event_type=event_type,
+            publish_time=publish_time,
+            topic=topic,
+            ordering_key=message.ordering_key or None,
         )
 
+    @classmethod
+    def from_stored(cls, message: StoredMessage, topic: str) -> "PubSubMessage":
+        return cls.from_pubsub(message, topic)
+
+    @property
+    def priority(self) -> Priority:
+        """From the `priority` attribute; anything but URGENT is bulk."""
+        if self.attributes.get("priority", "").upper() == Priority.URGENT.value:
+            return Priority.URGENT
+        return Priority.BULK
+
 
 # id, message_id, status = (processing, processed), topic, event_type
 @dataclass
@@ -36,9 +80,93 @@ class Event:
     event_type: str
     status: EventStatus
     processing_started_at: datetime
+    # Broker publish time: stable across redeliveries, so it doubles as the partition key.
+    published_at: datetime
+    attempts: int = 0
+    # Set while a FAILED event is waiting for the retry worker, together with the payload to re-run it from.
+    next_attempt_at: datetime | None = None
+    payload: bytes | None = None
     id: int | None = None
 
     def change_status(self, new_status: EventStatus):
         if not self.status.can_transition_to(new_status):
             raise ValueError(f"Invalid transition from {self.status} to {new_status}")
         self.status = new_status
+
+    def to_stored_message(self) -> StoredMessage:
+        if self.payload is None:
+            raise ValueError(f"Event {self.message_id} has no stored payload")
+        return StoredMessage(
+            message_id=self.message_id,
+            data=self.payload,
+            attributes={"event_type": self.event_type},
+            publish_time=self.published_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EventOutcome:
+    """
+    How a claimed event ended: the terminal status of the handler run, plus the
+    retry schedule and payload to keep when it failed retryably.
+    """
+
+    message_id: str
+    topic: str
+    published_at: datetime
+    status: EventStatus
+    next_attempt_at: datetime | None = None
+    payload: bytes | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class EventCount:
+    """How many events of a topic, published within one time bucket, are in a status."""
+
+    bucket: datetime
+    topic: str
+    status: EventStatus
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryCount:
+    """
+    How many handler runs for events of a topic and type, published within one
+    time bucket, ended in a status: PROCESSED or FAILED, or DEAD_LETTERED for
+    quarantined events. An event retried until it succeeded counts once per run.
+    """
+
+    bucket: datetime
+    topic: str
+    event_type: str
+    status: EventStatus
+    count: int
+
+
+@dataclass
+class DeadLetter:
+    """
+    A quarantined message: either a payload that can never be handled, or an
+    event that kept failing until it ran out of delivery attempts.
+    """
+
+    message_id: str
+    topic: str
+    event_type: str | None
+    payload: bytes
+    error: str
+    attempts: int
+    dead_lettered_at: datetime
+    attributes: dict[str, str] = field(default_factory=dict)
+    published_at: datetime | None = None
+    replayed_at: datetime | None = None
+    id: int | None = None
+
+    def to_stored_message(self) -> StoredMessage:
+        return StoredMessage(
+            message_id=self.message_id,
+            data=self.payload,
+            attributes=self.attributes,
+            publish_time=self.published_at or self.dead_lettered_at,
+        )
@@ -5,11 +5,37 @@ class EventStatus(Enum):
     PROCESSING = "PROCESSING"
     FAILED = "FAILED"
     PROCESSED = "PROCESSED"
+    DEAD_LETTERED = "DEAD_LETTERED"
 
     def can_transition_to(self, new_status: "EventStatus") -> bool:
         allowed = {
             EventStatus.PROCESSING: [EventStatus.FAILED, EventStatus.PROCESSED],
-            EventStatus.FAILED: [EventStatus.PROCESSING],
+            EventStatus.FAILED: [EventStatus.PROCESSING, EventStatus.DEAD_LETTERED],
             EventStatus.PROCESSED: [],
+            # Replaying a quarantined event puts it back up for retry.
+            EventStatus.DEAD_LETTERED: [EventStatus.FAILED],
         }
         return new_status in allowed[self]
+
+
+class TimeBucket(Enum):
+    """The width of the time buckets events are counted in; values are Postgres `date_trunc` fields."""
+
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+
+    @property
+    def seconds(self) -> int:
+        return {TimeBucket.MINUTE: 60, TimeBucket.HOUR: 3600, TimeBucket.DAY: 86400}[self]
+
+
+class Priority(Enum):
+    """
+    How urgently a notification has to go out. Urgent work (a password reset)
+    is served before bulk work (the daily digest) wherever the two queue for
+    the same workers, mail slots or database connections.
+    """
+
+    URGENT = "URGENT"
+    BULK = "BULK"
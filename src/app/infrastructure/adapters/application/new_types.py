@@ -2,5 +2,12 @@ from typing import NewType
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.common.services.priority_slots import PrioritySlots
+
 # database
 UserAsyncSession = NewType("UserAsyncSession", AsyncSession)
+ReplicaAsyncSession = NewType("ReplicaAsyncSession", AsyncSession)
+
+# priority lanes
+SessionSlots = NewType("SessionSlots", PrioritySlots)
+EmailSendSlots = NewType("EmailSendSlots", PrioritySlots)
@@ -0,0 +1,37 @@
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.ports.unit_of_work import UnitOfWork
+from app.domain.entities.pub_sub.entity import EventOutcome
+from app.infrastructure.adapters.database.batch_writer import BatchWriter
+from app.setup.config.settings import PubSubSettings
+
+log = logging.getLogger(__name__)
+
+
+class BatchEventFinaliser(BatchWriter[EventOutcome]):
+    """
+    Settles the outcomes of many handler runs with one `UPDATE ... FROM (VALUES ...)`
+    per flush instead of a transaction per message.
+
+    `finalise` waits for the flush holding its outcome to commit, so the consumer
+    acks the message only once its status is durable; if the flush fails, the
+    interactor raises and the message is nacked.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], settings: PubSubSettings):
+        super().__init__(
+            session_maker,
+            flush_interval_s=settings.finalise_flush_interval_s,
+            max_batch_size=settings.finalise_batch_size,
+        )
+
+    async def finalise(self, outcome: EventOutcome, unit_of_work: UnitOfWork) -> None:
+        await self.write(outcome)
+
+    async def _write_batch(self, uow: UnitOfWork, items: Sequence[EventOutcome]) -> None:
+        updated = await uow.events.finalise_many(items)
+        if updated < len(items):
+            log.warning("%s of %s finalised events were no longer PROCESSING.", len(items) - updated, len(items))
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from typing import Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.ports.unit_of_work import UnitOfWork
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+OnFlushed = Callable[[bool], None]
+
+
+class BatchWriter(ABC, Generic[T]):
+    """
+    Buffers items and writes them in a single transaction per flush, either every
+    `flush_interval_s` or as soon as `max_batch_size` items are waiting.
+
+    `submit` is thread-safe, so it can be called from Pub/Sub callback threads as
+    well as from the event loop. Its `on_flushed` callback runs on the event loop
+    once the batch transaction has committed (`True`) or failed (`False`), which
+    is where callers ack or nack the messages the items came from.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], flush_interval_s: float, max_batch_size: int):
+        self._session_maker = session_maker
+        self._flush_interval_s = flush_interval_s
+        self._max_batch_size = max_batch_size
+        self._buffer: list[tuple[T, OnFlushed | None]] = []
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def submit(self, item: T, on_flushed: OnFlushed | None = None) -> None:
+        with self._lock:
+            self._buffer.append((item, on_flushed))
+            full = len(self._buffer) >= self._max_batch_size
+        if full and self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def write(self, item: T) -> None:
+        """
+        Submits the item and waits until the batch holding it is committed.
+        Starts the flush loop on first use if nobody has.
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None:
+            self.start(loop)
+        flushed: asyncio.Future[bool] = loop.create_future()
+
+        def on_flushed(ok: bool) -> None:
+            if not flushed.done():
+                flushed.set_result(ok)
+
+        self.submit(item, on_flushed)
+        if not await flushed:
+            raise RuntimeError(f"{type(self).__name__} failed to flush")
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Not cancelled: a batch taken off the buffer must reach its callbacks,
+        # or `write` callers would wait on it forever.
+        if self._task is not None:
+            self._stopping = True
+            if self._wakeup is not None:
+                self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return 0
+
+        ok = True
+        try:
+            async with self._session_maker() as session:
+                async with SqlAlchemyUnitOfWork(session) as uow:
+                    await self._write_batch(uow, [item for item, _ in batch])
+        except Exception as e:
+            ok = False
+            log.error("%s failed to write %s items: %s", type(self).__name__, len(batch), e, exc_info=True)
+
+        for _, on_flushed in batch:
+            if on_flushed is None:
+                continue
+            try:
+                on_flushed(ok)
+            except Exception as e:
+                log.error("Flush callback failed: %s", e, exc_info=True)
+        return len(batch)
+
+    @abstractmethod
+    async def _write_batch(self, uow: UnitOfWork, items: Sequence[T]) -> None:
+        raise NotImplementedError
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.ports.event_replayer import EventReplayer
+from app.domain.entities.pub_sub.entity import Event, PubSubMessage
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.setup.config.settings import PubSubSettings
+
+log = logging.getLogger(__name__)
+
+REPLAYABLE_STATUSES = (EventStatus.FAILED, EventStatus.DEAD_LETTERED)
+
+
+@dataclass(slots=True)
+class BulkReplayResult:
+    replayed: int = 0
+    failed: int = 0
+
+
+class BulkEventReplayer:
+    """
+    Re-dispatches every stored event matching a filter, without the broker.
+
+    Matching events are read a keyset page of `replay_page_size` at a time, each
+    page in a short session of its own, so memory stays flat however many events
+    match and no connection sits idle in a transaction while the page is being
+    replayed. At most `concurrency` replays are in flight; the next page is read
+    once the last event of this one has been handed out.
+
+    DEAD_LETTERED events are first moved back to FAILED with a fresh attempt
+    budget, the same reset the dead-letter replay endpoint performs, and their
+    dead letters are marked as replayed once the replay succeeds.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        replayer: EventReplayer,
+        settings: PubSubSettings,
+    ):
+        self._session_maker = session_maker
+        self._replayer = replayer
+        self._concurrency = settings.replay_concurrency
+        self._page_size = settings.replay_page_size
+
+    async def run(
+        self,
+        status: EventStatus = EventStatus.FAILED,
+        topic: str | None = None,
+        limit: int | None = None,
+        concurrency: int | None = None,
+        event_type: str | None = None,
+        published_from: datetime | None = None,
+        published_until: datetime | None = None,
+        progress: BulkReplayResult | None = None,
+    ) -> BulkReplayResult:
+        """
+        Pass `progress` to watch the counts grow while the replay runs; it is
+        also what is returned.
+        """
+        if status not in REPLAYABLE_STATUSES:
+            raise ValueError(f"Only {', '.join(s.value for s in REPLAYABLE_STATUSES)} events can be replayed")
+
+        result = progress if progress is not None else BulkReplayResult()
+        slots = asyncio.Semaphore(concurrency or self._concurrency)
+        in_flight: set[asyncio.Task[None]] = set()
+
+        async def replay(event: Event) -> None:
+            try:
+                if event.status == EventStatus.DEAD_LETTERED:
+                    await self._reset(event)
+                message = PubSubMessage.from_stored(event.to_stored_message(), event.topic)
+                (error,) = await self._replayer.replay([message])
+                if error is None and event.status == EventStatus.DEAD_LETTERED:
+                    await self._mark_dead_letter_replayed(event)
+            except Exception as e:
+                error = e
+            finally:
+                slots.release()
+            if error is None:
+                result.replayed += 1
+            else:
+                result.failed += 1
+                log.warning("Replay of event %s failed: %r", event.message_id, error)
+
+        after_id: int | None = None
+        remaining = limit
+        try:
+            while remaining is None or remaining > 0:
+                page_size = self._page_size if remaining is None else min(self._page_size, remaining)
+                async with self._session_maker() as session:
+                    page = [
+                        event
+                        async for event in EventRepository(session).list(
+                            status=status,
+                            topic=topic,
+                            event_type=event_type,
+                            published_from=published_from,
+                            published_until=published_until,
+                            after_id=after_id,
+                            limit=page_size,
+                            page_size=page_size,
+                            with_payload=True,
+                        )
+                    ]
+                for event in page:
+                    await slots.acquire()
+                    task = asyncio.create_task(replay(event))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                if len(page) < page_size:
+                    break
+                after_id = page[-1].id
+                if remaining is not None:
+                    remaining -= len(page)
+        finally:
+            # Cancelling the run stops reading more events, but the replays already
+            # started finish, rather than leaving their events in PROCESSING.
+            await asyncio.gather(*in_flight)
+
+        log.info("Bulk replay finished: %s replayed, %s failed.", result.replayed, result.failed)
+        return result
+
+    async def _reset(self, event: Event) -> None:
+        async with self._session_maker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.events.transition_many(
+                    [(event.message_id, event.topic, event.published_at)],
+                    from_status=EventStatus.DEAD_LETTERED,
+                    to_status=EventStatus.FAILED,
+                    attempts=0,
+                )
+
+    async def _mark_dead_letter_replayed(self, event: Event) -> None:
+        async with self._session_maker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                await uow.dead_letters.mark_replayed_by_message(
+                    event.message_id, event.topic, datetime.now(timezone.utc)
+                )
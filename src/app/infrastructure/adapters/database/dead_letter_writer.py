@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.ports.unit_of_work import UnitOfWork
+from app.domain.entities.pub_sub.entity import DeadLetter
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.batch_writer import BatchWriter
+from app.setup.config.settings import PubSubSettings
+
+
+class DeadLetterWriter(BatchWriter[DeadLetter]):
+    """
+    Quarantines poison messages in bulk: one multi-row insert into `dead_letter`
+    plus one update moving the matching FAILED events to DEAD_LETTERED, so that
+    redeliveries are acked without running the handler again.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], settings: PubSubSettings):
+        super().__init__(
+            session_maker,
+            flush_interval_s=settings.dead_letter_flush_interval_s,
+            max_batch_size=settings.dead_letter_batch_size,
+        )
+
+    async def _write_batch(self, uow: UnitOfWork, items: Sequence[DeadLetter]) -> None:
+        await uow.dead_letters.add_many(items)
+        await uow.events.transition_many(
+            [
+                (dead_letter.message_id, dead_letter.topic, dead_letter.published_at)
+                for dead_letter in items
+                if dead_letter.published_at is not None
+            ],
+            from_status=EventStatus.FAILED,
+            to_status=EventStatus.DEAD_LETTERED,
+        )
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.database.repositories.event_stats_repository import EventStatsRepository
+from app.infrastructure.sqla_persistence.mappings.event import EVENT_DEFAULT_PARTITION, event_table
+from app.setup.config.settings import PartitionSettings
+
+log = logging.getLogger(__name__)
+
+# Arbitrary constant; only one replica runs maintenance at a time.
+_LOCK_KEY = 0x6576656E74
+_BOUNDS = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    name: str
+    start: datetime
+    end: datetime
+
+
+@dataclass(slots=True)
+class MaintenanceResult:
+    created: list[str] = field(default_factory=list)
+    expired: list[str] = field(default_factory=list)
+    stats_compacted: int = 0
+
+
+class EventPartitionMaintainer:
+    """
+    Keeps the range partitions of `event` ahead of the clock and behind the
+    retention window, and folds the `event_stats` minute buckets older than
+    `stats_compact_after_days` into hours.
+
+    Every run creates the partitions for the current period and the next `premake`
+    ones, skipping any range an existing partition already covers (so changing
+    INTERVAL between day and week is safe), and drops or detaches partitions that
+    ended more than `retention_days` ago. Detached partitions stay behind as plain
+    tables to be archived and dropped by hand.
+
+    DDL runs under a transaction-scoped advisory lock, so only one replica does the
+    work, and with a short lock timeout, so a long transaction on `event` makes the
+    run fail and retry later rather than queue every writer behind it.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], settings: PartitionSettings):
+        self._session_maker = session_maker
+        self._settings = settings
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if not self._settings.enabled:
+            log.info("Event partition maintenance is disabled.")
+            return
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                log.error("Event partition maintenance failed: %s", e, exc_info=True)
+            await asyncio.sleep(self._settings.check_interval_s)
+
+    def period_start(self, moment: datetime) -> datetime:
+        start = moment.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        if self._settings.interval == "week":
+            start -= timedelta(days=start.weekday())
+        return start
+
+    @property
+    def period(self) -> timedelta:
+        return timedelta(days=7 if self._settings.interval == "week" else 1)
+
+    def wanted(self, now: datetime) -> list[tuple[datetime, datetime]]:
+        start = self.period_start(now)
+        return [(start + i * self.period, start + (i + 1) * self.period) for i in range(self._settings.premake + 1)]
+
+    async def run_once(self, now: datetime | None = None) -> MaintenanceResult:
+        now = now or datetime.now(timezone.utc)
+        result = MaintenanceResult()
+        async with self._session_maker() as session:
+            async with session.begin():
+                if not await session.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _LOCK_KEY}):
+                    log.debug("Partition maintenance is running elsewhere.")
+                    return result
+                await session.execute(text("SET LOCAL TimeZone = 'UTC'"))
+                await session.execute(text("SET LOCAL lock_timeout = '5s'"))
+
+                partitions = await self.partitions(session)
+                for start, end in self.wanted(now):
+                    if any(p.start < end and start < p.end for p in partitions):
+                        continue
+                    name = f"{event_table.name}_p{start:%Y%m%d}"
+                    await session.execute(
+                        text(
+                            f"CREATE TABLE {name} PARTITION OF {event_table.name} "
+                            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                        )
+                    )
+                    result.created.append(name)
+
+                cutoff = now - timedelta(days=self._settings.retention_days)
+                for partition in partitions:
+                    if partition.end > cutoff:
+                        continue
+                    if self._settings.expire_mode == "drop":
+                        await session.execute(text(f"DROP TABLE {partition.name}"))
+                    else:
+                        await session.execute(text(f"ALTER TABLE {event_table.name} DETACH PARTITION {partition.name}"))
+                    result.expired.append(partition.name)
+
+                result.stats_compacted = await EventStatsRepository(session).compact(
+                    now - timedelta(days=self._settings.stats_compact_after_days)
+                )
+
+                if await session.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {EVENT_DEFAULT_PARTITION})")):
+                    log.warning(
+                        "Rows landed in %s; a partition was missing for their publish time.", EVENT_DEFAULT_PARTITION
+                    )
+
+        if result.created or result.expired:
+            log.info(
+                "Event partitions created: %s; %s: %s.",
+                result.created or "none",
+                "dropped" if self._settings.expire_mode == "drop" else "detached",
+                result.expired or "none",
+            )
+        if result.stats_compacted:
+            log.info("Folded %s event stats minute buckets into hours.", result.stats_compacted)
+        return result
+
+    @staticmethod
+    async def partitions(session: AsyncSession) -> list[Partition]:
+        rows = await session.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                "FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :parent"
+            ),
+            {"parent": event_table.name},
+        )
+        partitions = []
+        for name, bound in rows:
+            match = _BOUNDS.search(bound)
+            if match is None:  # the DEFAULT partition
+                continue
+            start, end = (datetime.fromisoformat(value).astimezone(timezone.utc) for value in match.groups())
+            partitions.append(Partition(name, start, end))
+        return sorted(partitions, key=lambda p: p.start)
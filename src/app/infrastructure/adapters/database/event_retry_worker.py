@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.exceptions.event import (
+    EventDeadLetteredError,
+    EventProcessedError,
+    EventProcessingError,
+)
+from app.application.common.ports.event_replayer import EventReplayer
+from app.application.common.services.retry_policy import RetryPolicy
+from app.domain.entities.pub_sub.entity import DeadLetter, Event, PubSubMessage
+from app.infrastructure.adapters.database.dead_letter_writer import DeadLetterWriter
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.setup.config.settings import RetrySettings
+
+log = logging.getLogger(__name__)
+
+# Another consumer or worker got to the event first; there is nothing to retry.
+_RACES = (EventProcessingError, EventProcessedError, EventDeadLetteredError)
+
+
+class EventRetryWorker:
+    """
+    Re-runs FAILED events whose `next_attempt_at` is due, straight from the
+    payload stored on the event row, without a round-trip through Pub/Sub.
+
+    Each pass claims a batch with `FOR UPDATE SKIP LOCKED`, so several replicas
+    can poll concurrently without picking the same rows, and leases the batch by
+    pushing `next_attempt_at` forward before dispatching it. The interactor
+    reschedules or clears the event once it has run; a failure that the retry
+    policy gives up on is dead-lettered.
+
+    Each pass first reaps events left in PROCESSING for longer than
+    `stale_processing_s` by a handler that died, turning them into due retries.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        replayer: EventReplayer,
+        dead_letters: DeadLetterWriter,
+        retry_policy: RetryPolicy,
+        settings: RetrySettings,
+    ):
+        self._session_maker = session_maker
+        self._replayer = replayer
+        self._dead_letters = dead_letters
+        self._retry_policy = retry_policy
+        self._settings = settings
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if not self._settings.enabled:
+            log.info("Event retry worker is disabled.")
+            return
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                log.error("Event retry pass failed: %s", e, exc_info=True)
+                claimed = 0
+            # A full batch means there is likely more due work, so go again straight away.
+            if claimed < self._settings.batch_size:
+                await asyncio.sleep(self._settings.poll_interval_s)
+
+    async def run_once(self) -> int:
+        now = datetime.now(timezone.utc)
+        async with self._session_maker() as session:
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                reaped = await uow.events.reap_stale_processing(
+                    now - timedelta(seconds=self._settings.stale_processing_s),
+                    now,
+                    limit=self._settings.batch_size,
+                )
+            if reaped:
+                log.warning("Reaped %s events stuck in PROCESSING.", reaped)
+            async with SqlAlchemyUnitOfWork(session) as uow:
+                events = await uow.events.claim_due_retries(
+                    now,
+                    limit=self._settings.batch_size,
+                    lease_until=now + timedelta(seconds=self._settings.lease_s),
+                )
+        if not events:
+            return 0
+
+        messages = [PubSubMessage.from_stored(event.to_stored_message(), event.topic) for event in events]
+        outcomes = await self._replayer.replay(messages)
+
+        quarantined = 0
+        for event, message, error in zip(events, messages, outcomes, strict=True):
+            if error is None or isinstance(error, _RACES):
+                continue
+            attempts = message.delivery_attempt or event.attempts
+            if self._retry_policy.should_retry(error, attempts):
+                continue
+            self._dead_letters.submit(self._dead_letter(event, error, attempts))
+            quarantined += 1
+        if quarantined:
+            await self._dead_letters.flush()
+
+        log.info("Retried %s events, %s dead-lettered.", len(events), quarantined)
+        return len(events)
+
+    @staticmethod
+    def _dead_letter(event: Event, error: BaseException, attempts: int) -> DeadLetter:
+        assert event.payload is not None
+        return DeadLetter(
+            message_id=event.message_id,
+            topic=event.topic,
+            event_type=event.event_type,
+            payload=event.payload,
+            error=repr(error),
+            attempts=attempts,
+            dead_lettered_at=datetime.now(timezone.utc),
+            attributes={"event_type": event.event_type},
+            published_at=event.published_at,
+        )
@@ -0,0 +1,112 @@
+import bisect
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection, QueuePool
+
+from app.application.common.ports.connection_pool import PoolMonitor, PoolStats
+
+WAIT_BUCKETS_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics(PoolMonitor):
+    """
+    Counters and a checkout wait-time histogram for one engine's pool.
+
+    Occupancy is read off the pool itself; the counters come from pool events.
+    There is no event for the start of a checkout, so the wait is timed by the
+    pool class from `pool_class()`, which the engine must be created with.
+    """
+
+    def __init__(self) -> None:
+        self._pool: QueuePool | None = None
+        self._max_overflow = 0
+        self.checkouts = 0
+        self.overflow_connects = 0
+        self.timeouts = 0
+        self.invalidated = 0
+        self._wait_counts = [0] * (len(WAIT_BUCKETS_S) + 1)
+        self._wait_sum_s = 0.0
+
+    def pool_class(self) -> type[AsyncAdaptedQueuePool]:
+        metrics = self
+
+        class TimedQueuePool(AsyncAdaptedQueuePool):
+            # `connect` is entered once per checkout (`_do_get` may recurse), and includes the pre-ping.
+            def connect(self) -> PoolProxiedConnection:
+                started = time.perf_counter()
+                try:
+                    return super().connect()
+                except PoolTimeoutError:
+                    metrics.timeouts += 1
+                    raise
+                finally:
+                    metrics.observe_wait(time.perf_counter() - started)
+
+        return TimedQueuePool
+
+    def instrument(self, engine: AsyncEngine, max_overflow: int) -> None:
+        """Watches `engine`'s pool, created with `pool_class()` and `max_overflow` (MAX_OVERFLOW)."""
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, QueuePool):
+            raise TypeError(f"Expected the engine's pool to be a QueuePool, got {type(pool).__name__}")
+        self._pool = pool
+        self._max_overflow = max_overflow
+        target = engine.sync_engine
+        event.listen(target, "checkout", self._on_checkout)
+        event.listen(target, "connect", self._on_connect)
+        event.listen(target, "invalidate", self._on_invalidate)
+
+    def observe_wait(self, seconds: float) -> None:
+        self._wait_counts[bisect.bisect_left(WAIT_BUCKETS_S, seconds)] += 1
+        self._wait_sum_s += seconds
+
+    def _on_checkout(
+        self,
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: PoolProxiedConnection,
+    ) -> None:
+        self.checkouts += 1
+
+    def _on_connect(self, dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry) -> None:
+        # The pool counts a new connection against its overflow before opening it.
+        if self._overflow() > 0:
+            self.overflow_connects += 1
+
+    def _on_invalidate(
+        self,
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+        exception: BaseException | None,
+    ) -> None:
+        self.invalidated += 1
+
+    def _overflow(self) -> int:
+        if self._pool is None:
+            return 0
+        return max(self._pool.overflow(), 0)
+
+    def stats(self) -> PoolStats:
+        pool = self._pool
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip((*map(str, WAIT_BUCKETS_S), "+Inf"), self._wait_counts):
+            running += count
+            cumulative[bound] = running
+        return PoolStats(
+            size=pool.size() if pool is not None else 0,
+            capacity=pool.size() + self._max_overflow if pool is not None else 0,
+            checked_out=pool.checkedout() if pool is not None else 0,
+            overflow=self._overflow(),
+            checkouts=self.checkouts,
+            overflow_connects=self.overflow_connects,
+            timeouts=self.timeouts,
+            invalidated=self.invalidated,
+            wait_buckets=cumulative,
+            wait_count=running,
+            wait_sum_s=self._wait_sum_s,
+        )
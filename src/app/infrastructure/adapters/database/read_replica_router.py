@@ -0,0 +1,31 @@
+import itertools
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+class ReadReplicaRouter:
+    """
+    Hands out sessions for read-only paths, round-robin over the replica
+    engines, or on the primary when there are none. Either way transactions
+    are begun READ ONLY, so a write slipping onto this path fails loudly
+    instead of landing on the primary unnoticed.
+
+    Replicas lag the primary: anything that must see its own writes, such as
+    claiming and finalising events, stays on the primary's session maker.
+    """
+
+    def __init__(self, engines: Sequence[AsyncEngine]):
+        self._session_makers = [
+            async_sessionmaker(
+                bind=engine.execution_options(postgresql_readonly=True),
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+            for engine in engines
+        ]
+        self._next = itertools.cycle(self._session_makers)
+
+    def session(self) -> AsyncSession:
+        return next(self._next)()
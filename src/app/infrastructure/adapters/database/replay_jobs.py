@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+
+from app.application.common.exceptions.replay import ReplayInProgressError, ReplayJobNotFoundError
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.bulk_event_replayer import BulkEventReplayer, BulkReplayResult
+
+log = logging.getLogger(__name__)
+
+
+class ReplayJobState(Enum):
+    RUNNING = "RUNNING"
+    FINISHED = "FINISHED"
+    CANCELLED = "CANCELLED"
+    FAILED = "FAILED"
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayFilter:
+    status: EventStatus = EventStatus.FAILED
+    topic: str | None = None
+    event_type: str | None = None
+    published_from: datetime | None = None
+    published_until: datetime | None = None
+    limit: int | None = None
+
+
+@dataclass(slots=True)
+class ReplayJob:
+    id: str
+    filter: ReplayFilter
+    concurrency: int | None
+    started_at: datetime
+    state: ReplayJobState = ReplayJobState.RUNNING
+    progress: BulkReplayResult = field(default_factory=BulkReplayResult)
+    finished_at: datetime | None = None
+    error: str | None = None
+    _started: float = field(default_factory=time.monotonic, repr=False)
+    _elapsed_s: float | None = field(default=None, repr=False)
+
+    @property
+    def processed(self) -> int:
+        return self.progress.replayed + self.progress.failed
+
+    @property
+    def elapsed_s(self) -> float:
+        return self._elapsed_s if self._elapsed_s is not None else time.monotonic() - self._started
+
+    @property
+    def rate_per_s(self) -> float:
+        elapsed_s = self.elapsed_s
+        return self.processed / elapsed_s if elapsed_s > 0 else 0.0
+
+    def end(self, state: ReplayJobState, error: str | None = None) -> None:
+        self.state = state
+        self.error = error
+        self.finished_at = datetime.now(timezone.utc)
+        self._elapsed_s = time.monotonic() - self._started
+
+
+class ReplayJobs:
+    """
+    Runs bulk replays in the background for the admin API, one at a time, and
+    keeps the last `KEEP` of them around so their progress can be polled.
+
+    Jobs live in this process only: a job id is known to the pod that started
+    it, and a job still running at shutdown is cancelled, which lets its
+    in-flight replays finish first.
+    """
+
+    KEEP = 20
+
+    def __init__(self, replayer: BulkEventReplayer):
+        self._replayer = replayer
+        self._jobs: OrderedDict[str, ReplayJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def start(self, replay_filter: ReplayFilter, concurrency: int | None = None) -> ReplayJob:
+        running = next((job for job in self._jobs.values() if job.state is ReplayJobState.RUNNING), None)
+        if running is not None:
+            raise ReplayInProgressError(f"Replay job {running.id} is still running.")
+
+        job = ReplayJob(
+            id=uuid.uuid4().hex, filter=replay_filter, concurrency=concurrency, started_at=datetime.now(timezone.utc)
+        )
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.KEEP:
+            self._jobs.popitem(last=False)
+        self._tasks[job.id] = asyncio.create_task(self._run(job))
+        log.info("Replay job %s started: %s", job.id, replay_filter)
+        return job
+
+    def get(self, job_id: str) -> ReplayJob:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ReplayJobNotFoundError(f"No replay job {job_id}.")
+        return job
+
+    async def cancel(self, job_id: str) -> ReplayJob:
+        job = self.get(job_id)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if job.state is ReplayJobState.RUNNING:  # cancelled before it got to run
+            job.end(ReplayJobState.CANCELLED)
+            self._tasks.pop(job_id, None)
+        return job
+
+    async def stop(self) -> None:
+        for job_id in list(self._tasks):
+            await self.cancel(job_id)
+
+    async def _run(self, job: ReplayJob) -> None:
+        replay_filter = job.filter
+        try:
+            await self._replayer.run(
+                status=replay_filter.status,
+                topic=replay_filter.topic,
+                limit=replay_filter.limit,
+                concurrency=job.concurrency,
+                event_type=replay_filter.event_type,
+                published_from=replay_filter.published_from,
+                published_until=replay_filter.published_until,
+                progress=job.progress,
+            )
+        except asyncio.CancelledError:
+            job.end(ReplayJobState.CANCELLED)
+            raise
+        except Exception as e:
+            log.error("Replay job %s failed: %s", job.id, e, exc_info=True)
+            job.end(ReplayJobState.FAILED, repr(e))
+        else:
+            job.end(ReplayJobState.FINISHED)
+        finally:
+            self._tasks.pop(job.id, None)
+            log.info(
+                "Replay job %s %s: %s replayed, %s failed.",
+                job.id,
+                job.state.value.lower(),
+                job.progress.replayed,
+                job.progress.failed,
+            )
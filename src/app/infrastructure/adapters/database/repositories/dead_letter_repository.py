@@ -0,0 +1,74 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.pub_sub.entity import DeadLetter
+from app.infrastructure.sqla_persistence.mappings.dead_letter import dead_letter_table
+
+
+class DeadLetterRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add_many(self, dead_letters: Sequence[DeadLetter]) -> None:
+        if not dead_letters:
+            return
+        await self.session.execute(
+            insert(dead_letter_table),
+            [
+                {
+                    "message_id": dead_letter.message_id,
+                    "topic": dead_letter.topic,
+                    "event_type": dead_letter.event_type,
+                    "payload": dead_letter.payload,
+                    "attributes": dead_letter.attributes,
+                    "error": dead_letter.error,
+                    "attempts": dead_letter.attempts,
+                    "published_at": dead_letter.published_at,
+                    "dead_lettered_at": dead_letter.dead_lettered_at,
+                }
+                for dead_letter in dead_letters
+            ],
+        )
+
+    async def list_pending(
+        self, limit: int, after_id: int | None = None, for_update: bool = False
+    ) -> Sequence[DeadLetter]:
+        stmt = select(DeadLetter).where(dead_letter_table.c.replayed_at.is_(None))
+        if after_id is not None:
+            stmt = stmt.where(dead_letter_table.c.id > after_id)
+        stmt = stmt.order_by(dead_letter_table.c.id).limit(limit)
+        if for_update:
+            stmt = stmt.with_for_update(skip_locked=True)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_pending_by_ids(self, ids: Sequence[int]) -> Sequence[DeadLetter]:
+        stmt = (
+            select(DeadLetter)
+            .where(dead_letter_table.c.id.in_(ids), dead_letter_table.c.replayed_at.is_(None))
+            .order_by(dead_letter_table.c.id)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def mark_replayed(self, ids: Sequence[int], replayed_at: datetime) -> None:
+        if not ids:
+            return
+        await self.session.execute(
+            update(dead_letter_table).where(dead_letter_table.c.id.in_(ids)).values(replayed_at=replayed_at)
+        )
+
+    async def mark_replayed_by_message(self, message_id: str, topic: str, replayed_at: datetime) -> None:
+        await self.session.execute(
+            update(dead_letter_table)
+            .where(
+                dead_letter_table.c.message_id == message_id,
+                dead_letter_table.c.topic == topic,
+                dead_letter_table.c.replayed_at.is_(None),
+            )
+            .values(replayed_at=replayed_at)
+        )
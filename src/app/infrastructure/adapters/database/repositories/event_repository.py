@@ -1,42 +1,348 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+from sqlalchemy import (
+    SMALLINT,
+    DateTime,
+    Insert,
+    Select,
+    String,
+    bindparam,
+    case,
+    cast,
+    column,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.pub_sub.entity import Event
-from app.infrastructure.sqla_persistence.mappings.event import event_table
+from app.domain.entities.pub_sub.entity import Event, EventCount, EventOutcome
+from app.domain.entities.pub_sub.value_objects import EventStatus, TimeBucket
+from app.infrastructure.adapters.database.repositories.event_stats_repository import EventStatsRepository
+from app.infrastructure.sqla_persistence.mappings.event import (
+    event_columns,
+    event_table,
+    event_topic_table,
+    event_topics,
+    event_types,
+)
+
+# The per-message statements are built once, with bind parameters in place of
+# values: a statement object memoizes its cache key, so executing it again skips
+# both construction and the compiled-cache key walk, and its SQL text stays
+# identical, which lets psycopg prepare it server-side (`PREPARE_THRESHOLD`).
+# Built lazily because ORM selects need the mappers configured first.
+
+
+@cache
+def _insert_event() -> Insert:
+    return (
+        insert(event_table)
+        .on_conflict_do_nothing(index_elements=["message_id", "topic_id", "published_at"])
+        .returning(event_table.c.id)
+    )
+
+
+@cache
+def _select_event(by_published_at: bool, for_update: bool) -> Select[tuple[Event]]:
+    stmt = select(Event).where(
+        event_table.c.message_id == bindparam("message_id"),
+        event_table.c.topic_id == event_topics.id_of(bindparam("topic")),
+    )
+    if by_published_at:
+        stmt = stmt.where(event_table.c.published_at == bindparam("published_at"))
+    if for_update:
+        stmt = stmt.with_for_update()
+    return stmt
+
+
+# What the `event_stats` rollup is fed from every status change that ends a handler run.
+_CHANGED = (event_table.c.published_at, event_table.c.topic_id, event_table.c.event_type_id, event_table.c.status)
 
 
 class EventRepository:
+    """
+    Status changes that settle an event (out of PROCESSING, or into
+    DEAD_LETTERED) are also counted into `event_stats`, in the same
+    transaction, so the rollup cannot drift from the rows it summarises.
+    """
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._stats = EventStatsRepository(session)
 
     async def add(self, event: Event):
         await self.add_if_not_exists(event)
 
     async def add_if_not_exists(self, event: Event):
+        result = await self.session.execute(
+            _insert_event(),
+            {
+                "message_id": event.message_id,
+                "topic_id": await event_topics.id_for(self.session, event.topic),
+                "event_type_id": await event_types.id_for(self.session, event.event_type),
+                "status": event.status,
+                "processing_started_at": event.processing_started_at,
+                "published_at": event.published_at,
+                "attempts": event.attempts,
+                "next_attempt_at": event.next_attempt_at,
+                "payload": event.payload,
+            },
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_id_and_topic(
+        self, message_id: str, topic: str, published_at: datetime | None = None, for_update: bool = False
+    ) -> Event | None:
+        """
+        Pass `published_at` whenever it is known: it is the partition key, so the
+        lookup then touches a single partition instead of probing all of them.
+        """
+        params: dict[str, str | datetime] = {"message_id": message_id, "topic": topic}
+        if published_at is not None:
+            params["published_at"] = published_at
+        result = await self.session.execute(_select_event(published_at is not None, for_update), params)
+        return result.scalar_one_or_none()
+
+    async def transition_many(
+        self,
+        keys: Sequence[tuple[str, str, datetime]],
+        from_status: EventStatus,
+        to_status: EventStatus,
+        **values: Any,
+    ) -> None:
+        """
+        Bulk status change for (message_id, topic, published_at) keys, bypassing the
+        ORM identity map. Keys carry the partition key so only the partitions holding
+        them are scanned. Rows not currently in `from_status` are left untouched.
+        """
+        if not keys:
+            return
+        if not from_status.can_transition_to(to_status):
+            raise ValueError(f"Invalid transition from {from_status} to {to_status}")
         stmt = (
-            insert(Event)
+            update(event_table)
+            .where(
+                event_topic_table.c.id == event_table.c.topic_id,
+                tuple_(event_table.c.message_id, event_topic_table.c.name, event_table.c.published_at).in_(keys),
+                event_table.c.status == from_status,
+            )
+            .values(status=to_status, **values)
+            .execution_options(synchronize_session=False)
+        )
+        if to_status is not EventStatus.DEAD_LETTERED:
+            await self.session.execute(stmt)
+            return
+        result = await self.session.execute(stmt.returning(*_CHANGED))
+        await self._stats.add(result.all())
+
+    async def finalise_many(self, outcomes: Sequence[EventOutcome]) -> int:
+        """
+        Settles PROCESSING events with a single `UPDATE ... FROM (VALUES ...)`.
+        A payload is only written to rows that have none yet. Rows that are no
+        longer PROCESSING (reaped in the meantime) are left untouched.
+
+        Returns:
+            The number of events updated.
+        """
+        if not outcomes:
+            return 0
+        rows = [
+            (
+                outcome.message_id,
+                await event_topics.id_for(self.session, outcome.topic),
+                outcome.published_at,
+                outcome.status,
+                outcome.next_attempt_at,
+                outcome.payload,
+            )
+            for outcome in outcomes
+        ]
+        outcome = values(
+            column("message_id", String),
+            column("topic_id", SMALLINT),
+            column("published_at", DateTime(timezone=True)),
+            column("status", event_table.c.status.type),
+            column("next_attempt_at", DateTime(timezone=True)),
+            column("payload", event_table.c.payload.type),
+            name="outcome",
+        ).data(rows)
+        # A VALUES column that is NULL on every row is typed text, hence the casts.
+        result = await self.session.execute(
+            update(event_table)
+            .where(
+                event_table.c.message_id == outcome.c.message_id,
+                event_table.c.topic_id == outcome.c.topic_id,
+                event_table.c.published_at == cast(outcome.c.published_at, DateTime(timezone=True)),
+                event_table.c.status == EventStatus.PROCESSING,
+            )
             .values(
-                message_id=event.message_id,
-                topic=event.topic,
-                event_type=event.event_type,
-                status=event.status,
-                processing_started_at=event.processing_started_at,
+                status=cast(outcome.c.status, event_table.c.status.type),
+                next_attempt_at=cast(outcome.c.next_attempt_at, DateTime(timezone=True)),
+                payload=func.coalesce(event_table.c.payload, cast(outcome.c.payload, event_table.c.payload.type)),
             )
-            .on_conflict_do_nothing(
-                index_elements=["message_id", "topic"]
+            .returning(*_CHANGED)
+            .execution_options(synchronize_session=False)
+        )
+        changed = result.all()
+        await self._stats.add(changed)
+        return len(changed)
+
+    async def claim_due_retries(self, now: datetime, limit: int, lease_until: datetime) -> Sequence[Event]:
+        """
+        Locks up to `limit` FAILED events whose retry is due, skipping rows another
+        worker holds, and pushes their `next_attempt_at` to `lease_until`. The push
+        is committed with the claim, so a worker dying mid-retry only delays the
+        events until the lease runs out.
+        """
+        stmt = (
+            select(Event)
+            .where(
+                event_table.c.status == EventStatus.FAILED,
+                event_table.c.next_attempt_at <= now,
             )
+            .order_by(event_table.c.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        events = result.scalars().all()
+        for event in events:
+            event.next_attempt_at = lease_until
+        return events
+
+    async def reap_stale_processing(self, started_before: datetime, now: datetime, limit: int) -> int:
+        """
+        Fails up to `limit` events stuck in PROCESSING since before `started_before`,
+        i.e. whose handler died without settling them. Those with a stored payload are
+        made due for the retry worker; the rest wait for the broker to redeliver them.
+        """
+        stale = (
+            select(event_table.c.id, event_table.c.published_at)
+            .where(
+                event_table.c.status == EventStatus.PROCESSING,
+                event_table.c.processing_started_at < started_before,
+            )
+            .order_by(event_table.c.processing_started_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(event_table)
+            .where(tuple_(event_table.c.id, event_table.c.published_at).in_(stale.scalar_subquery()))
+            .values(
+                status=EventStatus.FAILED,
+                next_attempt_at=case((event_table.c.payload.is_not(None), now)),
+            )
+            .returning(*_CHANGED)
+            .execution_options(synchronize_session=False)
+        )
+        changed = result.all()
+        await self._stats.add(changed)
+        return len(changed)
 
-    async def get_by_id_and_topic(self, message_id: int, topic: str, for_update: bool = False):
-        stmt = select(Event).where(event_table.c.message_id == message_id, event_table.c.topic == topic)
-        if for_update:
-            stmt = stmt.with_for_update()
+    async def list(
+        self,
+        message_id: str | None = None,
+        status: EventStatus | None = None,
+        topic: str | None = None,
+        event_type: str | None = None,
+        published_from: datetime | None = None,
+        published_until: datetime | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+        page_size: int = 10_000,
+        yield_per: int = 500,
+        with_payload: bool = False,
+    ) -> AsyncIterator[Event]:
+        """
+        Yields matching events in id order, published in `[published_from,
+        published_until)` when given, starting after `after_id`. With
+        `with_payload`, only events that have a stored payload to replay from.
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        The walk is split into keyset pages of `page_size` rows, each its own
+        `id > last seen` query, so no cursor stays open for the whole walk and an
+        interrupted export can resume from the last id it got. Within a page rows
+        come from a server-side cursor `yield_per` at a time as detached `Event`s,
+        so memory stays flat however many events there are.
+        """
+        stmt = select(*event_columns()).order_by(event_table.c.id).execution_options(yield_per=yield_per)
+        if message_id is not None:
+            stmt = stmt.where(event_table.c.message_id == message_id)
+        if status is not None:
+            stmt = stmt.where(event_table.c.status == status)
+        if topic is not None:
+            stmt = stmt.where(event_table.c.topic_id == event_topics.id_of(topic))
+        if event_type is not None:
+            stmt = stmt.where(event_table.c.event_type_id == event_types.id_of(event_type))
+        if published_from is not None:
+            stmt = stmt.where(event_table.c.published_at >= published_from)
+        if published_until is not None:
+            stmt = stmt.where(event_table.c.published_at < published_until)
+        if with_payload:
+            stmt = stmt.where(event_table.c.payload.is_not(None))
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page = stmt.limit(page_size if remaining is None else min(page_size, remaining))
+            if after_id is not None:
+                page = page.where(event_table.c.id > after_id)
+            fetched = 0
+            result = await self.session.stream(page)
+            try:
+                async for row in result:
+                    event = Event(**row._asdict())
+                    fetched += 1
+                    after_id = event.id
+                    yield event
+            finally:
+                # Releases the cursor when the caller stops early.
+                await result.close()
+            if remaining is not None:
+                remaining -= fetched
+            if fetched < page_size:
+                return
 
-    async def list(self):
-        return self.session.select(Event).all()
+    async def count_by_bucket(
+        self,
+        bucket: TimeBucket,
+        published_from: datetime,
+        published_until: datetime,
+        topic: str | None = None,
+    ) -> Sequence[EventCount]:
+        """
+        Counts the events published in `[published_from, published_until)` per
+        UTC time bucket, topic and status, in a single grouped query. Rows are
+        grouped on the topic id and only the groups get their topic name, and
+        the time range keeps the scan to the partitions covering it.
+        Buckets with no events are left out.
+        """
+        counts = (
+            select(
+                func.date_trunc(bucket.value, event_table.c.published_at, "UTC").label("bucket"),
+                event_table.c.topic_id,
+                event_table.c.status,
+                func.count().label("count"),
+            )
+            .where(event_table.c.published_at >= published_from, event_table.c.published_at < published_until)
+            # By position: the bucket expression binds its field as a parameter, and Postgres
+            # does not see two separately bound copies of it as the same expression.
+            .group_by(literal_column("1"), event_table.c.topic_id, event_table.c.status)
+        )
+        if topic is not None:
+            counts = counts.where(event_table.c.topic_id == event_topics.id_of(topic))
+        grouped = counts.subquery()
+        topic_name = event_topics.name_of(grouped.c.topic_id).label("topic")
+        result = await self.session.execute(
+            select(grouped.c.bucket, topic_name, grouped.c.status, grouped.c.count).order_by(
+                grouped.c.bucket, topic_name, grouped.c.status
+            )
+        )
+        return [EventCount(**row._asdict()) for row in result]
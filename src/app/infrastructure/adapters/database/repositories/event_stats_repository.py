@@ -0,0 +1,125 @@
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Row, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.pub_sub.entity import DeliveryCount
+from app.domain.entities.pub_sub.value_objects import TimeBucket
+from app.infrastructure.sqla_persistence.mappings.event import event_topics, event_types
+from app.infrastructure.sqla_persistence.mappings.event_stats import event_stats_table
+
+
+def _minute(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(second=0, microsecond=0)
+
+
+class EventStatsRepository:
+    """
+    Reads and maintains the `event_stats` rollup. Reading it costs the number of
+    buckets asked for, however many events they hold.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, changed: Iterable[Row[Any]]) -> None:
+        """
+        Counts status changes, given as `(published_at, topic_id, event_type_id,
+        status)` rows, into their minute buckets with a single upsert in the
+        caller's transaction. Rows are upserted in key order, so concurrent
+        writers bumping the same buckets queue on them instead of deadlocking.
+        """
+        counts = Counter(
+            (_minute(published_at), topic_id, event_type_id, status)
+            for published_at, topic_id, event_type_id, status in changed
+        )
+        if not counts:
+            return
+        stmt = insert(event_stats_table).values(
+            [
+                {"bucket": bucket, "topic_id": topic_id, "event_type_id": event_type_id, "status": status, "count": n}
+                for (bucket, topic_id, event_type_id, status), n in sorted(
+                    counts.items(), key=lambda item: (*item[0][:3], item[0][3].value)
+                )
+            ]
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                constraint="pk_event_stats",
+                set_={"count": event_stats_table.c.count + stmt.excluded.count},
+            )
+        )
+
+    async def count_by_bucket(
+        self,
+        bucket: TimeBucket,
+        published_from: datetime,
+        published_until: datetime,
+        topic: str | None = None,
+        event_type: str | None = None,
+    ) -> Sequence[DeliveryCount]:
+        """
+        Outcome counts per UTC time bucket, topic, event type and status for
+        events published in `[published_from, published_until)`, summed from
+        the rollup rows. Buckets finer than what the rollup still holds for a
+        range (minutes, once compacted into hours) come back at its resolution.
+        """
+        c = event_stats_table.c
+        counts = (
+            select(
+                func.date_trunc(bucket.value, c.bucket, "UTC").label("bucket"),
+                c.topic_id,
+                c.event_type_id,
+                c.status,
+                func.sum(c.count).label("count"),
+            )
+            .where(c.bucket >= published_from, c.bucket < published_until)
+            # By position, as in EventRepository.count_by_bucket.
+            .group_by(literal_column("1"), c.topic_id, c.event_type_id, c.status)
+        )
+        if topic is not None:
+            counts = counts.where(c.topic_id == event_topics.id_of(topic))
+        if event_type is not None:
+            counts = counts.where(c.event_type_id == event_types.id_of(event_type))
+        grouped = counts.subquery()
+        topic_name = event_topics.name_of(grouped.c.topic_id).label("topic")
+        event_type_name = event_types.name_of(grouped.c.event_type_id).label("event_type")
+        result = await self.session.execute(
+            select(grouped.c.bucket, topic_name, event_type_name, grouped.c.status, grouped.c.count).order_by(
+                grouped.c.bucket, topic_name, event_type_name, grouped.c.status
+            )
+        )
+        return [DeliveryCount(**row._asdict()) for row in result]
+
+    async def compact(self, before: datetime) -> int:
+        """
+        Folds the minute buckets of hours that ended before `before` into their
+        hour's first bucket, in one statement. Late outcomes for a compacted
+        hour land in a minute bucket again and are folded in by the next run.
+
+        Returns:
+            The number of minute buckets folded.
+        """
+        before = before.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        result = await self.session.execute(
+            text(
+                "WITH folded AS ("
+                " DELETE FROM event_stats"
+                " WHERE bucket < :before AND bucket <> date_trunc('hour', bucket, 'UTC')"
+                " RETURNING bucket, topic_id, event_type_id, status, count"
+                "), merged AS ("
+                " INSERT INTO event_stats (bucket, topic_id, event_type_id, status, count)"
+                " SELECT date_trunc('hour', bucket, 'UTC'), topic_id, event_type_id, status, sum(count)"
+                " FROM folded GROUP BY 1, 2, 3, 4 ORDER BY 1, 2, 3, 4"
+                " ON CONFLICT ON CONSTRAINT pk_event_stats"
+                " DO UPDATE SET count = event_stats.count + excluded.count"
+                ") SELECT count(*) FROM folded"
+            ),
+            {"before": before},
+        )
+        folded: int = result.scalar_one()
+        return folded
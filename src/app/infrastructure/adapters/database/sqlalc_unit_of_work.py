@@ -2,8 +2,11 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 
-from app.application.common.ports.unit_of_work import UnitOfWork
+from app.application.common.ports.unit_of_work import ReadOnlyUnitOfWork, UnitOfWork
+from app.infrastructure.adapters.application.new_types import ReplicaAsyncSession
+from app.infrastructure.adapters.database.repositories.dead_letter_repository import DeadLetterRepository
 from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
+from app.infrastructure.adapters.database.repositories.event_stats_repository import EventStatsRepository
 
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
@@ -15,6 +18,8 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
 
     async def __aenter__(self):
         self.events = EventRepository(self.session)
+        self.dead_letters = DeadLetterRepository(self.session)
+        self.event_stats = EventStatsRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -28,3 +33,21 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
 
     async def rollback(self):
         await self.session.rollback()
+
+
+class SqlAlchemyReadOnlyUnitOfWork(ReadOnlyUnitOfWork):
+    def __init__(
+        self,
+        session: ReplicaAsyncSession,
+    ):
+        self.session = session
+
+    async def __aenter__(self):
+        self.events = EventRepository(self.session)
+        self.dead_letters = DeadLetterRepository(self.session)
+        self.event_stats = EventStatsRepository(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Ends the read-only transaction without a rollback, which would expire what was just read.
+        await self.session.close()
@@ -0,0 +1,17 @@
+from app.application.common.ports.email_sender import EmailSender
+from app.infrastructure.adapters.application.new_types import EmailSendSlots
+
+
+class PriorityEmailSender(EmailSender):
+    """
+    Bounds the sends in flight, keeping EMAIL_RESERVED of them for urgent
+    notifications: a digest backlog can fill the rest, never those.
+    """
+
+    def __init__(self, sender: EmailSender, slots: EmailSendSlots):
+        self._sender = sender
+        self._slots = slots
+
+    async def send(self, to: str, subject: str, body: str) -> None:
+        async with self._slots.acquire():
+            await self._sender.send(to, subject, body)
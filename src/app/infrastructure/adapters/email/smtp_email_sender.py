@@ -1,4 +1,5 @@
 import base64
+import logging
 from email.message import EmailMessage
 
 from google.oauth2.credentials import Credentials
@@ -8,6 +9,10 @@ from googleapiclient.errors import HttpError
 from app.application.common.exceptions.email import EmailDeliveryError
 from app.application.common.ports.email_sender import EmailSender
 from app.config import Config
+from app.infrastructure.observability.pipeline_metrics import EMAIL_SEND_ERRORS, EMAIL_SEND_SECONDS
+from app.infrastructure.observability.tracing import span
+
+log = logging.getLogger(__name__)
 
 
 class SmtpEmailSender(EmailSender):
@@ -16,39 +21,40 @@ class SmtpEmailSender(EmailSender):
 
     async def send(self, to: str, subject: str, body: str):
         try:
-            self.gmail_send_message(to, subject, body)
+            with EMAIL_SEND_SECONDS.time(), span("email.send"):
+                self.gmail_send_message(to, subject, body)
         except HttpError:
+            EMAIL_SEND_ERRORS.labels(HttpError.__name__).inc()
             raise EmailDeliveryError
+        except Exception as e:
+            EMAIL_SEND_ERRORS.labels(type(e).__name__).inc()
+            raise
 
     def gmail_send_message(self, to: str, subject: str, body: str):
         """Create and send an email message
-        Print the returned  message id
         Returns: Message object, including message id
+        Raises: HttpError when the Gmail API rejects the request
 
         Load pre-authorized user credentials from the environment.
         TODO(developer) - See https://developers.google.com/identity
         for guides on implementing OAuth2 for the application.
         """
-        try:
-            creds = Credentials.from_authorized_user_file("token.json")
+        creds = Credentials.from_authorized_user_file("token.json")
 
-            service = build("gmail", "v1", credentials=creds)
-            message = EmailMessage()
+        service = build("gmail", "v1", credentials=creds)
+        message = EmailMessage()
 
-            message.add_alternative(body, subtype="html")
+        message.add_alternative(body, subtype="html")
 
-            message["To"] = to
-            message["From"] = self.config.EMAIL_USERNAME
-            message["Subject"] = subject
+        message["To"] = to
+        message["From"] = self.config.EMAIL_USERNAME
+        message["Subject"] = subject
 
-            # encoded message
-            encoded_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        # encoded message
+        encoded_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
-            create_message = {"raw": encoded_message}
-            # pylint: disable=E1101
-            send_message = service.users().messages().send(userId="me", body=create_message).execute()
-            print(f"Message Id: {send_message['id']}")
-        except HttpError as error:
-            print(f"An error occurred: {error}")
-            send_message = None
+        create_message = {"raw": encoded_message}
+        # pylint: disable=E1101
+        send_message = service.users().messages().send(userId="me", body=create_message).execute()
+        log.debug("Message Id: %s", send_message["id"])
         return send_message
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from dishka import AsyncContainer, Scope
+
+from app.application.common.ports.event_replayer import EventReplayer
+from app.application.events.event_dispatcher import EventDispatcher
+from app.domain.entities.pub_sub.entity import PubSubMessage
+from app.setup.config.settings import PubSubSettings
+
+logger = logging.getLogger(__name__)
+
+
+class ContainerEventReplayer(EventReplayer):
+    """
+    Replays messages through the `EventDispatcher`, mirroring what the consumer
+    does for live deliveries: every message gets its own request scope (and so
+    its own session and unit of work), and at most `replay_concurrency` of them
+    run at the same time.
+    """
+
+    def __init__(self, container: AsyncContainer, settings: PubSubSettings):
+        self._container = container
+        self._concurrency = settings.replay_concurrency
+
+    async def replay(self, messages: Sequence[PubSubMessage]) -> list[BaseException | None]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def run(message: PubSubMessage) -> BaseException | None:
+            async with semaphore:
+                try:
+                    await self._dispatch(message)
+                except Exception as e:
+                    logger.warning("Replay of message %s failed: %r", message.message.message_id, e)
+                    return e
+                return None
+
+        return list(await asyncio.gather(*(run(message) for message in messages)))
+
+    async def _dispatch(self, message: PubSubMessage) -> None:
+        async with self._container(scope=Scope.REQUEST) as request_container:
+            dispatcher = await request_container.get(EventDispatcher)
+            dispatcher.container = request_container
+            await dispatcher.dispatch(message)
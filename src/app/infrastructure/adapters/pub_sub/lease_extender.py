@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from google.cloud import pubsub_v1
+
+from app.setup.config.settings import PubSubSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Lease:
+    message: pubsub_v1.subscriber.message.Message
+    received_at: float
+    next_extension_at: float
+    # Cleared once `max_lease_extension_s` is reached; the lease stays registered until released.
+    extending: bool = True
+
+
+class LeaseExtender:
+    """
+    Keeps in-flight messages leased while their handlers run.
+
+    Every message is registered when the subscriber callback receives it and
+    released once it is acked or nacked. A background task periodically pushes
+    the ack deadline of messages that are still being processed, so a slow Gmail
+    call does not make Pub/Sub redeliver a message that is still in flight.
+    Extension stops after `max_lease_extension_s`; such a message is assumed
+    to be stuck and is left to expire and be redelivered. It still counts as in
+    flight until its handler releases it, so health sees the stuck messages.
+
+    The client's own leaser also extends these messages, but sizes each extension
+    from its ack-latency percentile and silently drops a message once the
+    consumer's `max_lease_duration` (set to the same `max_lease_extension_s`) is
+    reached. This keeps the deadline at `ack_deadline_s`, logs the messages it
+    gives up on, and is the in-flight registry the health check reads.
+
+    Registration happens on the Pub/Sub callback thread pool, while releases and
+    extensions happen on the event loop, hence the lock. Leases are only read or
+    changed under it; the Pub/Sub calls are made after it is released.
+    """
+
+    def __init__(self, settings: PubSubSettings):
+        self._settings = settings
+        self._leases: dict[str, _Lease] = {}
+        self._lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    def register(self, message: pubsub_v1.subscriber.message.Message) -> None:
+        now = time.monotonic()
+        lease = _Lease(message=message, received_at=now, next_extension_at=now + self._settings.ack_deadline_s / 2)
+        with self._lock:
+            self._leases[message.ack_id] = lease
+
+    def release(self, message: pubsub_v1.subscriber.message.Message) -> None:
+        with self._lock:
+            self._leases.pop(message.ack_id, None)
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._leases)
+
+    def oldest_in_flight_s(self) -> float:
+        with self._lock:
+            oldest = min((lease.received_at for lease in self._leases.values()), default=None)
+        return 0.0 if oldest is None else time.monotonic() - oldest
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._settings.lease_check_interval_s)
+            try:
+                self.extend_due(time.monotonic())
+            except Exception as e:
+                logger.error("Failed to extend message leases: %s", e, exc_info=True)
+
+    def extend_due(self, now: float) -> int:
+        due: list[_Lease] = []
+        expired: list[_Lease] = []
+        with self._lock:
+            for lease in self._leases.values():
+                if not lease.extending or lease.next_extension_at > now:
+                    continue
+                if now - lease.received_at >= self._settings.max_lease_extension_s:
+                    lease.extending = False
+                    expired.append(lease)
+                else:
+                    lease.next_extension_at = now + self._settings.ack_deadline_s / 2
+                    due.append(lease)
+        for lease in expired:
+            logger.warning(
+                "Message %s still in flight after %.0fs, no longer extending its lease.",
+                lease.message.message_id,
+                now - lease.received_at,
+            )
+        # A message released in the meantime gets one needless, harmless extension.
+        for lease in due:
+            lease.message.modify_ack_deadline(self._settings.ack_deadline_s)
+        if due:
+            logger.debug("Extended ack deadline of %s in-flight messages.", len(due))
+        return len(due)
@@ -1,6 +1,9 @@
 import asyncio
+import concurrent.futures
+import dataclasses
 import logging
 import time
+from datetime import datetime, timezone
 
 import sqlalchemy
 from dishka import AsyncContainer, Scope
@@ -8,17 +11,43 @@ from google.api_core.exceptions import NotFound
 from google.cloud import pubsub_v1
 
 from app.application.common.exceptions.email import EmailDeliveryError
-from app.application.common.exceptions.event import EventProcessedError, EventProcessingError
-from app.application.common.ports.event_subscriber import EventConsumer
+from app.application.common.exceptions.event import (
+    EventDeadLetteredError,
+    EventProcessedError,
+    EventProcessingError,
+)
+from app.application.common.ports.event_subscriber import EventConsumer, SubscriberHealth
+from app.application.common.services.priority_slots import priority_scope
 from app.application.events.event_dispatcher import EventDispatcher
 from app.config import Config
-from app.domain.entities.pub_sub.entity import PubSubMessage
+from app.domain.entities.pub_sub.entity import DeadLetter, PubSubMessage
+from app.infrastructure.adapters.database.dead_letter_writer import DeadLetterWriter
+from app.infrastructure.adapters.pub_sub.lease_extender import LeaseExtender
+from app.infrastructure.adapters.pub_sub.subscription_supervisor import SubscriptionSupervisor
+from app.infrastructure.adapters.pub_sub.worker_pool import KeyedWorkerPool
+from app.infrastructure.observability.pipeline_metrics import (
+    MESSAGE_HANDLE_SECONDS,
+    MESSAGES_ACKED,
+    MESSAGES_DEAD_LETTERED,
+    MESSAGES_IN_FLIGHT,
+    MESSAGES_NACKED,
+    MESSAGES_RECEIVED,
+    WORKER_QUEUE_DEPTH,
+)
+from app.infrastructure.observability.tracing import Context, Span, context_of, end_span, span, start_root_span
+from app.setup.config.settings import PubSubSettings
 
 logger = logging.getLogger(__name__)
 
 
 class PubSubEventConsumer(EventConsumer):
-    def __init__(self, container: AsyncContainer, config: Config):
+    def __init__(
+        self,
+        container: AsyncContainer,
+        config: Config,
+        settings: PubSubSettings,
+        dead_letters: DeadLetterWriter,
+    ):
         self._container = container
         self.project_id = config.GOOGLE_PROJECT_ID
         self.subscriber = pubsub_v1.SubscriberClient()
@@ -29,6 +58,11 @@ class PubSubEventConsumer(EventConsumer):
         self.topic_path = self.publisher.topic_path(self.project_id, self.topic_id)
         self.sub_path = self.subscriber.subscription_path(self.project_id, self.subscription_id)
         self.loop = None
+        self._settings = settings
+        self._supervisor = SubscriptionSupervisor(self._open_stream, settings)
+        self._leases = LeaseExtender(settings)
+        self._workers = KeyedWorkerPool(settings.worker_pool_size)
+        self._dead_letters = dead_letters
 
     def ensure_subscription(self):
         """
@@ -46,86 +80,207 @@ class PubSubEventConsumer(EventConsumer):
         try:
             self.subscriber.get_subscription(request={"subscription": self.sub_path})
         except NotFound:
-            self.subscriber.create_subscription(request={"name": self.sub_path, "topic": self.topic_path})
+            self.subscriber.create_subscription(
+                request={
+                    "name": self.sub_path,
+                    "topic": self.topic_path,
+                    "ack_deadline_seconds": self._settings.ack_deadline_s,
+                    "enable_message_ordering": self._settings.enable_message_ordering,
+                }
+            )
             logger.info("Created subscription: %s", self.sub_path)
 
-    async def _handle_message(self, message: PubSubMessage):
-        async with self._container(scope=Scope.REQUEST) as request_container:
-            dispatcher = await request_container.get(EventDispatcher)
-            dispatcher.container = request_container
-            try:
-                assert message.event_type
-                await dispatcher.dispatch(message)
-            except TypeError:
-                raise
+    async def _handle_message(
+        self, message: PubSubMessage, trace_context: Context | None = None, received_at: float | None = None
+    ):
+        attributes = {"queue_wait_s": time.perf_counter() - received_at} if received_at is not None else None
+        # The request scope is opened under the message's priority: its session and mail slots depend on it.
+        with span("pubsub.handle", attributes, context=trace_context), priority_scope(message.priority):
+            async with self._container(scope=Scope.REQUEST) as request_container:
+                dispatcher = await request_container.get(EventDispatcher)
+                dispatcher.container = request_container
+                try:
+                    assert message.event_type
+                    with span("event.dispatch", {"event_type": message.event_type}):
+                        await dispatcher.dispatch(message)
+                except TypeError:
+                    raise
 
-    def _on_done(self, fut: asyncio.Future, event: PubSubMessage):
+    def _quarantine(
+        self,
+        message: pubsub_v1.subscriber.message.Message,
+        event_type: str | None,
+        error: BaseException,
+        attempts: int,
+    ) -> None:
+        """
+        Hands the message to the dead-letter writer. It is only acked once the
+        quarantine row is committed, and nacked if the write fails, so a poison
+        message is never lost.
+        """
+        dead_letter = DeadLetter(
+            message_id=message.message_id,
+            topic=self.topic_id,
+            event_type=event_type,
+            payload=bytes(message.data),
+            error=repr(error),
+            attempts=attempts,
+            dead_lettered_at=datetime.now(timezone.utc),
+            attributes=dict(message.attributes),
+            published_at=message.publish_time,
+        )
+
+        def settle(written: bool) -> None:
+            if written:
+                MESSAGES_DEAD_LETTERED.inc()
+                _ack(message)
+            else:
+                _nack(message)
+
+        self._dead_letters.submit(dead_letter, settle)
+
+    def _on_done(
+        self,
+        fut: asyncio.Future,
+        event: PubSubMessage,
+        received_at: float | None = None,
+        root_span: Span | None = None,
+    ):
         """
         Handles acknowledgement of message after processing.
         """
+        self._leases.release(event.message)
+        MESSAGES_IN_FLIGHT.dec()
+        if received_at is not None:
+            MESSAGE_HANDLE_SECONDS.observe(time.perf_counter() - received_at)
         try:
             fut.result()  # raises if failed
-            event.message.ack()
+            _ack(event.message)
         except TypeError as e:
             logger.error(f"Invalid message for event_type: {event.event_type}%s", e, exc_info=True)
-            event.message.ack()
+            self._quarantine(event.message, event.event_type, e, event.delivery_attempt or 1)
         except EmailDeliveryError as e:
             logger.error(f"Email error from Google API: {event.event_type}%s", e, exc_info=True)
-            event.message.ack()
+            attempts = event.delivery_attempt
+            if attempts is not None and attempts >= self._settings.max_delivery_attempts:
+                self._quarantine(event.message, event.event_type, e, attempts)
+            else:
+                # The interactor has scheduled a retry on the event row; the retry worker owns it from here.
+                _ack(event.message)
         except EventProcessedError as e:
             logger.error(f"Message already processed and email sent: {event.event_type}%s", e, exc_info=True)
-            event.message.ack()
+            _ack(event.message)
+        except EventDeadLetteredError as e:
+            logger.warning("Redelivered quarantined message: %s", e)
+            _ack(event.message)
         except EventProcessingError:
-            event.message.nack()
+            _nack(event.message)
         except sqlalchemy.exc.IntegrityError:
-            event.message.ack()
+            _ack(event.message)
         except Exception as e:
             logger.error("Error in handle_message: %s", e, exc_info=True)
-            event.message.nack()
+            attempts = event.delivery_attempt
+            if attempts is not None and attempts >= self._settings.max_delivery_attempts:
+                logger.error("Message %s failed %s times, dead-lettering it.", event.message.message_id, attempts)
+                self._quarantine(event.message, event.event_type, e, attempts)
+            else:
+                _nack(event.message)
         except KeyboardInterrupt:
             fut.cancel()
+        if root_span is not None:
+            end_span(root_span, None if fut.cancelled() else fut.exception())
 
     def callback(self, message: pubsub_v1.subscriber.message.Message) -> None:
+        received_at = time.perf_counter()
+        MESSAGES_RECEIVED.inc()
+        self._leases.register(message)
+        try:
+            event = PubSubMessage.from_pubsub(message, self.topic_id)
+        except Exception as e:
+            # Undecodable payloads would fail on every redelivery, quarantine them straight away.
+            logger.error("Could not decode message %s: %s", message.message_id, e, exc_info=True)
+            self._leases.release(message)
+            self._quarantine(message, message.attributes.get("event_type"), e, 1)
+            return
+
+        root_span: Span | None = None
         try:
-            message = PubSubMessage.from_pubsub(message, self.topic_id)
             if not hasattr(self, "loop") or self.loop is None:
                 raise RuntimeError("No event loop available in subscriber")
 
-            future = asyncio.run_coroutine_threadsafe(
-                self._handle_message(message),
-                self.loop,
+            # Ended once the message is settled, in `_on_done`, or below if it cannot be scheduled.
+            root_span = start_root_span(
+                "pubsub.message",
+                {
+                    "messaging.message.id": message.message_id,
+                    "messaging.destination.name": self.topic_id,
+                    "event_type": event.event_type or "",
+                    "broker_lag_s": max(time.time() - message.publish_time.timestamp(), 0.0),
+                },
+            )
+            # Same ordering key -> same worker, so a user's digests are handled in publish order.
+            handled = self._workers.run(
+                event.ordering_key,
+                self._handle_message,
+                event,
+                context_of(root_span),
+                received_at,
+                priority=event.priority,
             )
+            try:
+                # Raises once the loop is closed, during shutdown.
+                future = asyncio.run_coroutine_threadsafe(handled, self.loop)
+            except Exception:
+                handled.close()
+                raise
 
-            future.add_done_callback(lambda fut: self._on_done(fut, message))
+            MESSAGES_IN_FLIGHT.inc()
+            future.add_done_callback(lambda fut: self._on_done(fut, event, received_at, root_span))
         except Exception as e:
             logger.error("Error scheduling message: %s", e, exc_info=True)
-            message.nack()
+            end_span(root_span, e)
+            self._leases.release(message)
+            _nack(message)
 
-    async def subscribe(self, loop, retry: bool = False) -> None:
-        if retry:
-            logger.info("Attempting to start Pub/Sub listener again: %s")
+    async def _open_stream(self) -> concurrent.futures.Future[None]:
+        await asyncio.to_thread(self.ensure_subscription)  # Only necessary for emulator.
+        streaming_pull_future: concurrent.futures.Future[None] = self.subscriber.subscribe(
+            self.sub_path,
+            callback=self.callback,
+            flow_control=pubsub_v1.types.FlowControl(max_lease_duration=self._settings.max_lease_extension_s),
+        )
+        logger.info("Pub/Sub subscriber started: %s", self.sub_path)
+        return streaming_pull_future
 
+    async def subscribe(self, loop) -> None:
         self.loop = loop
         if self.loop is None:
             raise RuntimeError("No event loop available in subscriber")
-        try:
-            self.ensure_subscription()
-            streaming_pull_future = self.subscriber.subscribe(self.sub_path, callback=self.callback)
-            logger.info("Pub/Sub subscriber started: %s", self.sub_path)
+        self._workers.start(self.loop)
+        WORKER_QUEUE_DEPTH.set_function(lambda: self._workers.queue_depth)
+        self._dead_letters.start(self.loop)
+        self._supervisor.start(self.loop)
+        self._leases.start(self.loop)
 
-            def wait_for_future(streaming_pull_future):
-                try:
-                    streaming_pull_future.result()
-                except Exception as e:
-                    logger.error("Subscriber crashed: %s", e)
-                    streaming_pull_future.cancel()
-                    time.sleep(5)
-                    self.ensure_subscription()  # Only necessary for emulator.
-                    streaming_pull_future = self.subscriber.subscribe(self.sub_path, callback=self.callback)
-                    self.loop.run_in_executor(None, wait_for_future, streaming_pull_future)
+    async def stop(self) -> None:
+        await self._supervisor.stop()
+        await self._leases.stop()
+        await self._workers.stop()
+        await self._dead_letters.stop()
+        self.subscriber.close()
+        logger.info("Pub/Sub subscriber stopped")
 
-            loop.run_in_executor(None, wait_for_future, streaming_pull_future)
+    def health(self) -> SubscriberHealth:
+        return dataclasses.replace(
+            self._supervisor.health(), backlog=self._workers.queue_depth, in_flight=self._leases.in_flight
+        )
 
-        except Exception as e:
-            logger.error("Failed to start Pub/Sub listener: %s", e)
-            await self.subscribe(loop, retry=True)
+
+def _ack(message: pubsub_v1.subscriber.message.Message) -> None:
+    MESSAGES_ACKED.inc()
+    message.ack()
+
+
+def _nack(message: pubsub_v1.subscriber.message.Message) -> None:
+    MESSAGES_NACKED.inc()
+    message.nack()
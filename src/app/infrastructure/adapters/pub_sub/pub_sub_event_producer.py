@@ -1,16 +1,27 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterable
+
 from google.api_core.exceptions import AlreadyExists, NotFound
 from google.cloud import pubsub_v1
 
-from app.application.common.ports.event_publisher import EventPublisher
+from app.application.common.ports.event_publisher import BatchPublishResult, EventPublisher, OutgoingMessage
 from app.config import Config
+from app.setup.config.settings import PubSubSettings
 
 config = Config.from_env()
 
+logger = logging.getLogger(__name__)
+
 
 class PubSubEventProducer(EventPublisher):
-    def __init__(self):
+    def __init__(self, settings: PubSubSettings):
         self.project_id = config.GOOGLE_PROJECT_ID
-        self.publisher = pubsub_v1.PublisherClient()
+        self.enable_message_ordering = settings.enable_message_ordering
+        self.max_in_flight = settings.publish_max_in_flight
+        self.publisher = pubsub_v1.PublisherClient(
+            publisher_options=pubsub_v1.types.PublisherOptions(enable_message_ordering=self.enable_message_ordering),
+        )
 
     async def _ensure_topic(self, topic_name: str) -> None:
         topic_path = self.publisher.topic_path(self.project_id, topic_name)
@@ -23,8 +34,64 @@ class PubSubEventProducer(EventPublisher):
                 return
         return
 
-    async def publish(self, topic_name: str, message: str, **attrs):
+    async def publish(self, topic_name: str, message: str, ordering_key: str = "", **attrs):
         await self._ensure_topic(topic_name)
         topic_path = self.publisher.topic_path(self.project_id, topic_name)
-        future = self.publisher.publish(topic_path, message.encode("utf-8"), **attrs)
-        return future.result()
+        if ordering_key and not self.enable_message_ordering:
+            logger.warning("Message ordering is disabled, publishing without ordering key '%s'.", ordering_key)
+            ordering_key = ""
+        future = self.publisher.publish(topic_path, message.encode("utf-8"), ordering_key=ordering_key, **attrs)
+        try:
+            return future.result()
+        except Exception:
+            if ordering_key:
+                # A failed publish pauses the key; later messages for it would be rejected until resumed.
+                self.publisher.resume_publish(topic_path, ordering_key)
+            raise
+
+    async def publish_many(self, topic_name: str, messages: AsyncIterable[OutgoingMessage]) -> BatchPublishResult:
+        """
+        Hands every message to the client, which batches them into publish
+        requests itself, and settles their futures on the event loop instead of
+        blocking on each one. At most `PUBLISH_MAX_IN_FLIGHT` are unconfirmed
+        at a time.
+        """
+        await self._ensure_topic(topic_name)
+        topic_path = self.publisher.topic_path(self.project_id, topic_name)
+        result = BatchPublishResult()
+        pending: dict[asyncio.Future[str], str] = {}
+        dropped_ordering = False
+
+        def settle(done: set[asyncio.Future[str]]) -> None:
+            for future in done:
+                ordering_key = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    result.published += 1
+                    continue
+                result.failed += 1
+                logger.warning("Publishing to %s failed: %r", topic_name, error)
+                if ordering_key:
+                    self.publisher.resume_publish(topic_path, ordering_key)
+
+        try:
+            async for message in messages:
+                ordering_key = message.ordering_key
+                if ordering_key and not self.enable_message_ordering:
+                    dropped_ordering = True
+                    ordering_key = ""
+                future = self.publisher.publish(
+                    topic_path, message.data, ordering_key=ordering_key, **message.attributes
+                )
+                pending[asyncio.wrap_future(future)] = ordering_key
+                if len(pending) >= self.max_in_flight:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    settle(done)
+        finally:
+            # Whatever was handed to the client is sent either way; wait to report on it.
+            if pending:
+                done, _ = await asyncio.wait(pending)
+                settle(done)
+        if dropped_ordering:
+            logger.warning("Message ordering is disabled, published a batch to %s without ordering keys.", topic_name)
+        return result
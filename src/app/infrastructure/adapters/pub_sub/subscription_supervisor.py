@@ -0,0 +1,125 @@
+import asyncio
+import concurrent.futures
+import logging
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from app.application.common.ports.event_subscriber import SubscriberHealth, SubscriberState
+from app.setup.config.settings import PubSubSettings
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionSupervisor:
+    """
+    Owns the lifecycle of a streaming pull.
+
+    The stream is opened through `open_stream`, awaited on the event loop via
+    `asyncio.wrap_future` (so no executor thread is parked on `result()`), and
+    reopened after a crash with jittered exponential backoff. Restarts are bounded
+    by a budget of `max_restarts` within `restart_window_s`; once exhausted the
+    supervisor gives up and reports `SubscriberState.FAILED`.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], Awaitable[concurrent.futures.Future[None]]],
+        settings: PubSubSettings,
+    ):
+        self._open_stream = open_stream
+        self._settings = settings
+        self._state = SubscriberState.STOPPED
+        self._restarts = 0
+        self._attempt = 0
+        self._last_error: str | None = None
+        self._restart_times: deque[float] = deque()
+        self._stream: concurrent.futures.Future[None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping = False
+        self._state = SubscriberState.STARTING
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._stream is not None:
+            self._stream.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._state = SubscriberState.STOPPED
+
+    def health(self) -> SubscriberHealth:
+        return SubscriberHealth(state=self._state, restarts=self._restarts, last_error=self._last_error)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            self._state = SubscriberState.STARTING
+            try:
+                self._stream = await self._open_stream()
+            except Exception as e:
+                logger.error("Failed to start Pub/Sub listener: %s", e)
+                self._last_error = repr(e)
+            else:
+                self._state = SubscriberState.RUNNING
+                started_at = loop.time()
+                try:
+                    await asyncio.wrap_future(self._stream)
+                except Exception as e:
+                    logger.error("Subscriber crashed: %s", e)
+                    self._last_error = repr(e)
+                else:
+                    if self._stopping:
+                        break
+                    logger.warning("Pub/Sub streaming pull closed unexpectedly.")
+                    self._last_error = "streaming pull closed"
+                finally:
+                    self._stream = None
+                if loop.time() - started_at >= self._settings.stable_after_s:
+                    self._attempt = 0
+
+            if not self._consume_restart_budget(loop.time()):
+                self._state = SubscriberState.FAILED
+                logger.critical(
+                    "Pub/Sub listener exceeded %s restarts within %ss, giving up.",
+                    self._settings.max_restarts,
+                    self._settings.restart_window_s,
+                )
+                return
+
+            self._state = SubscriberState.BACKOFF
+            delay = self._next_delay()
+            logger.info("Restarting Pub/Sub listener in %.2fs (restart #%s).", delay, self._restarts)
+            await asyncio.sleep(delay)
+            logger.info("Attempting to start Pub/Sub listener again.")
+
+    def _consume_restart_budget(self, now: float) -> bool:
+        window_start = now - self._settings.restart_window_s
+        while self._restart_times and self._restart_times[0] < window_start:
+            self._restart_times.popleft()
+        if len(self._restart_times) >= self._settings.max_restarts:
+            return False
+        self._restart_times.append(now)
+        self._restarts += 1
+        return True
+
+    def _next_delay(self) -> float:
+        """
+        Full jitter: a uniform pick below the exponential ceiling, so that pods
+        crashing together do not reconnect together.
+        """
+        ceiling = min(
+            self._settings.backoff_max_s,
+            self._settings.backoff_initial_s * self._settings.backoff_multiplier**self._attempt,
+        )
+        self._attempt += 1
+        return random.uniform(0, ceiling)  # nosec B311
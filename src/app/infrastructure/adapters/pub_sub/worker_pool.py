@@ -0,0 +1,105 @@
+import asyncio
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.domain.entities.pub_sub.value_objects import Priority
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_Job = tuple[Callable[..., Awaitable[Any]], tuple[Any, ...], asyncio.Future[Any]]
+# Urgent jobs sort first; the sequence number keeps each priority in submission order.
+_Entry = tuple[int, int, _Job]
+_RANK = {Priority.URGENT: 0, Priority.BULK: 1}
+
+
+class KeyedWorkerPool:
+    """
+    A fixed set of worker tasks, each draining its own queue.
+
+    Jobs carrying a key always land on the same shard (`hash(key) % size`),
+    so jobs sharing a key run one after another in submission order while jobs
+    with different keys run in parallel on other shards. No lock is involved:
+    the shard queue is the serialisation point. Keyless jobs go to the least
+    loaded shard, counting the job its worker is running as well as its queue,
+    so they start straight away while any worker is idle.
+
+    Each shard serves its urgent jobs before its bulk ones, so a digest
+    backlog delays an urgent job by at most the bulk job already running on
+    its shard, and a keyless urgent job not at all while a worker is idle.
+    Submission order, and with it per-key order, holds within a
+    priority only.
+
+    Must only be used from the event loop it was started on.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._queues: list[asyncio.PriorityQueue[_Entry]] = []
+        self._workers: list[asyncio.Task[None]] = []
+        self._running: list[int] = []
+        self._seq = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._workers:
+            return
+        self._queues = [asyncio.PriorityQueue() for _ in range(self._size)]
+        self._running = [0] * self._size
+        self._workers = [loop.create_task(self._work(shard)) for shard in range(self._size)]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        for queue in self._queues:
+            while not queue.empty():
+                _, _, (_, _, fut) = queue.get_nowait()
+                fut.cancel()
+        self._workers = []
+        self._queues = []
+        self._running = []
+
+    async def run(
+        self, key: str | None, fn: Callable[..., Awaitable[T]], *args: Any, priority: Priority = Priority.BULK
+    ) -> T:
+        if not self._workers:
+            raise RuntimeError("Worker pool is not started")
+        fut: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._shard_for(key).put_nowait((_RANK[priority], next(self._seq), (fn, args, fut)))
+        return await fut
+
+    def _shard_for(self, key: str | None) -> asyncio.PriorityQueue[_Entry]:
+        if key:
+            return self._queues[hash(key) % self._size]
+        shard = min(range(self._size), key=lambda i: self._running[i] + self._queues[i].qsize())
+        return self._queues[shard]
+
+    async def _work(self, shard: int) -> None:
+        queue = self._queues[shard]
+        while True:
+            _, _, (fn, args, fut) = await queue.get()
+            self._running[shard] += 1
+            try:
+                if fut.cancelled():
+                    continue
+                try:
+                    result = await fn(*args)
+                except asyncio.CancelledError:
+                    fut.cancel()
+                    raise
+                except Exception as e:
+                    if not fut.done():
+                        fut.set_exception(e)
+                else:
+                    if not fut.done():
+                        fut.set_result(result)
+            finally:
+                self._running[shard] -= 1
+                queue.task_done()
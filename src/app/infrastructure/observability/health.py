@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+from app.application.common.ports.connection_pool import PoolMonitor
+from app.application.common.ports.event_subscriber import EventConsumer, SubscriberState
+from app.infrastructure.observability.loop_lag import LoopLagMonitor
+from app.setup.config.settings import HealthSettings
+
+
+@dataclass(frozen=True, slots=True)
+class HealthCheck:
+    name: str
+    ok: bool
+    value: float | str
+    limit: float | str
+
+
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    ok: bool
+    checks: list[HealthCheck]
+
+
+class HealthProbe:
+    """
+    Liveness and readiness from state the pipeline already keeps: the
+    subscriber's listener state and backlog, the pool's checkout counts and the
+    loop lag monitor's last sample. Nothing is probed per request, so a probe
+    stays cheap and answers even while the database is struggling.
+
+    Readiness fails as soon as the pod cannot keep up, for the orchestrator to
+    route traffic elsewhere; liveness only once it cannot recover on its own.
+    """
+
+    def __init__(
+        self,
+        consumer: EventConsumer,
+        pool: PoolMonitor,
+        loop_lag: LoopLagMonitor,
+        settings: HealthSettings,
+    ):
+        self._consumer = consumer
+        self._pool = pool
+        self._loop_lag = loop_lag
+        self._settings = settings
+
+    def liveness(self) -> HealthReport:
+        subscriber = self._consumer.health()
+        return self._report(
+            HealthCheck("subscriber", subscriber.healthy, subscriber.state, "not failed or stopped"),
+            self._loop_lag_check(self._settings.live_max_loop_lag_s),
+        )
+
+    def readiness(self) -> HealthReport:
+        subscriber = self._consumer.health()
+        pool = self._pool.stats()
+        settings = self._settings
+        return self._report(
+            HealthCheck(
+                "subscriber", subscriber.state == SubscriberState.RUNNING, subscriber.state, SubscriberState.RUNNING
+            ),
+            self._loop_lag_check(settings.ready_max_loop_lag_s),
+            HealthCheck(
+                "database_pool",
+                pool.saturation < settings.ready_max_pool_saturation,
+                round(pool.saturation, 3),
+                settings.ready_max_pool_saturation,
+            ),
+            HealthCheck(
+                "email_backlog",
+                subscriber.backlog <= settings.ready_max_backlog,
+                subscriber.backlog,
+                settings.ready_max_backlog,
+            ),
+        )
+
+    def _loop_lag_check(self, limit_s: float) -> HealthCheck:
+        lag_s = self._loop_lag.lag_s
+        return HealthCheck("event_loop_lag_s", lag_s <= limit_s, round(lag_s, 4), limit_s)
+
+    @staticmethod
+    def _report(*checks: HealthCheck) -> HealthReport:
+        return HealthReport(ok=all(check.ok for check in checks), checks=list(checks))
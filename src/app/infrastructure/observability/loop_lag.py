@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from app.infrastructure.observability.metrics import REGISTRY
+from app.setup.config.settings import HealthSettings
+
+log = logging.getLogger(__name__)
+
+# The `app` package directory, to tell the app's own frames from library ones.
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) + os.sep
+_OBSERVABILITY = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+LAG_BUCKETS_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+EVENT_LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "event_loop_lag_seconds", "How late the event loop woke a sleeping task.", buckets=LAG_BUCKETS_S
+)
+EVENT_LOOP_BLOCKED = REGISTRY.counter(
+    "event_loop_blocked", "Stalls caught in progress by the blocking-call detector.", ("location",)
+)
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs a sleeping task: the time callbacks
+    spend waiting behind other callbacks, which is also what every message and
+    HTTP request waits before it can make progress.
+
+    The lag is sampled every `LOOP_LAG_INTERVAL_S`, and `lag_s` is the worst of
+    the last `WINDOW` samples, so one stall is still visible to the next probe.
+    A loop blocked outright cannot report anything, but it cannot answer a
+    probe either.
+    """
+
+    WINDOW = 10
+
+    def __init__(self, settings: HealthSettings):
+        self._interval_s = settings.loop_lag_interval_s
+        self._warn_s = settings.blocking_threshold_s
+        self._task: asyncio.Task[None] | None = None
+        self._samples: deque[float] = deque(maxlen=self.WINDOW)
+
+    @property
+    def lag_s(self) -> float:
+        return max(self._samples, default=0.0)
+
+    def observe(self, lag_s: float) -> None:
+        self._samples.append(lag_s)
+        EVENT_LOOP_LAG_SECONDS.observe(lag_s)
+        if lag_s > self._warn_s:
+            log.warning("Event loop lagged %.3fs behind", lag_s)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_s
+            await asyncio.sleep(self._interval_s)
+            self.observe(max(loop.time() - expected, 0.0))
+
+
+class BlockingCallDetector:
+    """
+    Debug aid naming the code that blocks the event loop.
+
+    A task on the loop bumps a heartbeat several times per `BLOCKING_THRESHOLD_S`,
+    and a watchdog thread checks it at the same rate. When the heartbeat is
+    older than the threshold the loop is stuck in a callback right now, so the
+    watchdog logs the loop thread's current stack: the synchronous call that is
+    blocking it, not just the coroutine it was made from. Each stall is
+    reported once, and counted by the innermost frame of the app's own code.
+
+    Off by default (`BLOCKING_DETECTOR`): sampling another thread's stack is
+    cheap, but the heartbeat wakes the loop every few milliseconds.
+    """
+
+    def __init__(self, settings: HealthSettings):
+        self._enabled = settings.blocking_detector
+        self._threshold_s = settings.blocking_threshold_s
+        self._tick_s = settings.blocking_threshold_s / 4
+        self._beat = 0.0
+        self._reported_beat = 0.0
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Must be called from the loop's thread."""
+        if not self._enabled or self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopping.clear()
+        self._task = loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="blocking-call-detector", daemon=True)
+        self._watchdog.start()
+        log.info("Blocking-call detector on, threshold %.3fs", self._threshold_s)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await asyncio.to_thread(self._watchdog.join)  # type: ignore[union-attr]
+        self._task = None
+        self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self._tick_s)
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(self._tick_s):
+            beat = self._beat
+            stalled_s = time.monotonic() - beat
+            if stalled_s > self._threshold_s and beat != self._reported_beat:
+                self._reported_beat = beat
+                self._report(stalled_s)
+
+    def _report(self, stalled_s: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+        EVENT_LOOP_BLOCKED.labels(_location(stack)).inc()
+        log.warning(
+            "Event loop blocked for %.3fs so far, in:\n%s", stalled_s, "".join(traceback.format_list(stack))
+        )
+
+
+def _location(stack: traceback.StackSummary) -> str:
+    """The innermost frame in the app's own code, as a low-cardinality label."""
+    for frame in reversed(stack):
+        if frame.filename.startswith(_APP_ROOT) and not frame.filename.startswith(_OBSERVABILITY):
+            return f"{os.path.relpath(frame.filename, _APP_ROOT)}:{frame.name}"
+    return f"{os.path.basename(stack[-1].filename)}:{stack[-1].name}" if stack else "unknown"
@@ -0,0 +1,83 @@
+"""
+The metrics exported for the message pipeline, from the Pub/Sub callback to the
+email sent and the outcome written back.
+"""
+
+from collections.abc import Iterator
+
+from app.application.common.ports.connection_pool import PoolStats
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.observability.metrics import REGISTRY, format_value
+from app.infrastructure.observability.tracing import record_span, set_attributes
+
+# Pub/Sub consumer
+MESSAGES_RECEIVED = REGISTRY.counter("pubsub_messages_received", "Messages delivered by the subscriber.")
+MESSAGES_ACKED = REGISTRY.counter("pubsub_messages_acked", "Messages acknowledged, including dead-lettered ones.")
+MESSAGES_NACKED = REGISTRY.counter("pubsub_messages_nacked", "Messages handed back to Pub/Sub for redelivery.")
+MESSAGES_DEAD_LETTERED = REGISTRY.counter("pubsub_messages_dead_lettered", "Messages quarantined as dead letters.")
+MESSAGES_IN_FLIGHT = REGISTRY.gauge("pubsub_messages_in_flight", "Messages received and not settled yet.")
+WORKER_QUEUE_DEPTH = REGISTRY.gauge("pubsub_worker_queue_depth", "Messages waiting for a worker.")
+MESSAGE_HANDLE_SECONDS = REGISTRY.histogram(
+    "pubsub_message_handle_seconds", "Time from a message's delivery to it being settled."
+)
+
+# Event interactors
+EVENT_CLAIM_SECONDS = REGISTRY.histogram("event_claim_seconds", "Time spent locking and claiming an event row.")
+EVENT_PROCESS_SECONDS = REGISTRY.histogram("event_process_seconds", "Time spent processing a claimed event.")
+EVENT_FINALISE_SECONDS = REGISTRY.histogram(
+    "event_finalise_seconds", "Time until an event's outcome is committed."
+)
+EVENT_OUTCOMES = REGISTRY.counter("event_outcomes", "Claimed events by the status they ended in.", ("status",))
+EVENT_REJECTED = REGISTRY.counter(
+    "event_claims_rejected", "Deliveries turned away by the status their event already had.", ("status",)
+)
+
+# Email
+EMAIL_SEND_SECONDS = REGISTRY.histogram("email_send_seconds", "Time spent sending an email.")
+EMAIL_SEND_ERRORS = REGISTRY.counter("email_send_errors", "Emails that failed to send, by error.", ("error",))
+
+
+class PipelineEventMetrics:
+    """
+    `EventMetrics` recorded into the process-wide registry and, when the
+    message's trace is sampled, as spans under the current one.
+    """
+
+    def observe_claim(self, seconds: float) -> None:
+        EVENT_CLAIM_SECONDS.observe(seconds)
+        record_span("event.claim", seconds)
+
+    def observe_rejected(self, status: EventStatus) -> None:
+        EVENT_REJECTED.labels(status.value).inc()
+        set_attributes({"event.rejected_status": status.value})
+
+    def observe_outcome(self, status: EventStatus, process_seconds: float, finalise_seconds: float) -> None:
+        EVENT_OUTCOMES.labels(status.value).inc()
+        EVENT_PROCESS_SECONDS.observe(process_seconds)
+        EVENT_FINALISE_SECONDS.observe(finalise_seconds)
+        record_span("event.process", process_seconds, ended_s_ago=finalise_seconds)
+        record_span("event.finalise", finalise_seconds)
+        set_attributes({"event.status": status.value})
+
+
+def pool_metric_lines(stats: PoolStats) -> Iterator[str]:
+    """The connection pool's state as exposition lines, read at scrape time."""
+    for name, kind, documentation, value in (
+        ("db_pool_size", "gauge", "Connections the pool keeps open.", stats.size),
+        ("db_pool_checked_out", "gauge", "Connections currently checked out.", stats.checked_out),
+        ("db_pool_overflow", "gauge", "Connections open beyond the pool size.", stats.overflow),
+        ("db_pool_checkouts", "counter", "Connections checked out.", stats.checkouts),
+        ("db_pool_overflow_connects", "counter", "Connections opened as overflow.", stats.overflow_connects),
+        ("db_pool_timeouts", "counter", "Checkouts that timed out waiting.", stats.timeouts),
+        ("db_pool_invalidated", "counter", "Connections invalidated.", stats.invalidated),
+    ):
+        sample = f"{name}_total" if kind == "counter" else name
+        yield f"# HELP {name} {documentation}"
+        yield f"# TYPE {name} {kind}"
+        yield f"{sample} {value}"
+    yield "# HELP db_pool_wait_seconds Time spent waiting for a connection."
+    yield "# TYPE db_pool_wait_seconds histogram"
+    for bound, count in stats.wait_buckets.items():
+        yield f'db_pool_wait_seconds_bucket{{le="{bound}"}} {count}'
+    yield f"db_pool_wait_seconds_sum {format_value(stats.wait_sum_s)}"
+    yield f"db_pool_wait_seconds_count {stats.wait_count}"
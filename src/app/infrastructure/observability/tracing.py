@@ -0,0 +1,115 @@
+"""
+Span helpers for following one message through the pipeline.
+
+OpenTelemetry is an optional dependency (`pip install .[tracing]`). Until a
+tracer is installed with `use_tracer`, which `configure_tracing` does when
+tracing is enabled, every helper here is a no-op costing one global lookup, so
+call sites do not need to check whether tracing is on.
+
+Whether a message is traced is decided once, when its root span would be
+started, with a single `random()` call: below the sampling ratio nothing is
+handed to OpenTelemetry at all, since even its non-recording spans cost tens of
+microseconds each. Child spans are only opened under a recording parent. Spans
+for the interactor's stages are reconstructed from the durations it already
+measures (`record_span`) instead of being opened around each stage.
+"""
+
+import random
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from opentelemetry import trace
+    from opentelemetry.context import Context
+    from opentelemetry.trace import Span, Tracer
+else:
+    try:
+        from opentelemetry import trace
+        from opentelemetry.context import Context
+        from opentelemetry.trace import Span, Tracer
+    except ImportError:  # pragma: no cover - depends on the installed extras
+        # Left to annotations: with no tracer installed the helpers return before using them.
+        trace = None
+        Context = Span = Tracer = Any
+
+__all__ = [
+    "Attributes",
+    "Context",
+    "Span",
+    "context_of",
+    "end_span",
+    "record_span",
+    "set_attributes",
+    "span",
+    "start_root_span",
+    "use_tracer",
+]
+
+Attributes = Mapping[str, str | int | float | bool]
+
+_tracer: Tracer | None = None
+_sample_ratio = 1.0
+
+
+def use_tracer(tracer: Tracer | None, sample_ratio: float = 1.0) -> None:
+    """Installs an OpenTelemetry tracer, or uninstalls it with `None`."""
+    global _tracer, _sample_ratio
+    _tracer = tracer
+    _sample_ratio = sample_ratio
+
+
+def start_root_span(name: str, attributes: Attributes | None = None) -> Span | None:
+    """
+    Starts a span that is ended elsewhere, possibly on another thread: see `context_of`.
+    """
+    if _tracer is None or random.random() >= _sample_ratio:
+        return None
+    return _tracer.start_span(name, context=Context(), attributes=attributes)
+
+
+def context_of(root: Span | None) -> Context | None:
+    """The context to open a root span's children in, from wherever they run."""
+    if root is None:
+        return None
+    return trace.set_span_in_context(root)
+
+
+def end_span(root: Span | None, error: BaseException | None = None) -> None:
+    if root is None:
+        return
+    if error is not None:
+        root.record_exception(error)
+        root.set_status(trace.StatusCode.ERROR, type(error).__name__)
+    root.end()
+
+
+@contextmanager
+def span(name: str, attributes: Attributes | None = None, context: Context | None = None) -> Iterator[None]:
+    """A child of the current span, or of `context`'s. Exceptions are recorded on it."""
+    if _tracer is None or not trace.get_current_span(context).is_recording():
+        yield
+        return
+    with _tracer.start_as_current_span(name, context=context, attributes=attributes):
+        yield
+
+
+def record_span(
+    name: str, duration_s: float, ended_s_ago: float = 0.0, attributes: Attributes | None = None
+) -> None:
+    """Records a finished child of the current span, measured by the caller."""
+    if _tracer is None or not trace.get_current_span().is_recording():
+        return
+    end_ns = time.time_ns() - int(ended_s_ago * 1e9)
+    child = _tracer.start_span(name, start_time=end_ns - int(duration_s * 1e9), attributes=attributes)
+    child.end(end_time=end_ns)
+
+
+def set_attributes(attributes: Attributes) -> None:
+    """Adds to the current span, if it is being recorded."""
+    if _tracer is None:
+        return
+    current = trace.get_current_span()
+    if current.is_recording():
+        current.set_attributes(attributes)
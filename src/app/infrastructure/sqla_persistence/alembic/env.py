@@ -2,6 +2,7 @@ __all__ = ("alembic_postgresql_enum",)
 
 import asyncio
 import os
+import re
 import sys
 from logging.config import fileConfig
 
@@ -10,8 +11,10 @@ from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
+from sqlalchemy.schema import SchemaItem
 
 from app.infrastructure.sqla_persistence.mappings.all import map_tables
+from app.infrastructure.sqla_persistence.mappings.event import EVENT_DEFAULT_PARTITION, event_table
 from app.infrastructure.sqla_persistence.orm_registry import mapping_registry
 from app.setup.config.settings import AppSettings, load_settings
 
@@ -45,6 +48,19 @@ config.set_main_option("sqlalchemy.url", settings.postgres.dsn)
 print("ALEMBIC is connecting to:", settings.postgres.dsn)
 
 
+# Partitions of `event` are created at runtime by EventPartitionMaintainer, so they are not in
+# the metadata; without this autogenerate would emit a `drop_table` for each of them.
+EVENT_PARTITION = re.compile(rf"{event_table.name}_p\d{{8}}|{EVENT_DEFAULT_PARTITION}")
+
+
+def include_object(
+    object: SchemaItem, name: str | None, type_: str, reflected: bool, compare_to: SchemaItem | None
+) -> bool:
+    if type_ == "table" and reflected and compare_to is None and name is not None:
+        return EVENT_PARTITION.fullmatch(name) is None
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -61,6 +77,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -70,7 +87,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
 
     with context.begin_transaction():
         context.run_migrations()
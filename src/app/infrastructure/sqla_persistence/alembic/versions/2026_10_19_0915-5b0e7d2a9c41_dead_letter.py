@@ -0,0 +1,56 @@
+"""dead letter
+
+Revision ID: 5b0e7d2a9c41
+Revises: 16c842b1765a
+Create Date: 2026-10-19 09:15:12.481230
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0e7d2a9c41"
+down_revision: Union[str, None] = "16c842b1765a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("event", sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+    op.create_table(
+        "dead_letter",
+        sa.Column("id", sa.BIGINT(), nullable=False),
+        sa.Column("message_id", sa.String(), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=True),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "attributes",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("error", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("dead_lettered_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("replayed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_dead_letter")),
+    )
+    op.create_index(
+        "ix_dead_letter_pending",
+        "dead_letter",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("replayed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dead_letter_pending", table_name="dead_letter", postgresql_where=sa.text("replayed_at IS NULL"))
+    op.drop_table("dead_letter")
+    op.drop_column("event", "attempts")
@@ -0,0 +1,36 @@
+"""event retry schedule
+
+Revision ID: 8d3f1c6e2b57
+Revises: 5b0e7d2a9c41
+Create Date: 2026-10-19 10:40:03.917442
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f1c6e2b57"
+down_revision: Union[str, None] = "5b0e7d2a9c41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("event", sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("event", sa.Column("payload", sa.LargeBinary(), nullable=True))
+    op.create_index(
+        "ix_event_retry_due",
+        "event",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'FAILED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_retry_due", table_name="event", postgresql_where=sa.text("status = 'FAILED'"))
+    op.drop_column("event", "payload")
+    op.drop_column("event", "next_attempt_at")
@@ -0,0 +1,128 @@
+"""partition event by publish time
+
+Revision ID: c41a7e9d0f63
+Revises: 8d3f1c6e2b57
+Create Date: 2026-10-19 13:20:41.508316
+
+Rebuilds `event` as a table range-partitioned on `published_at` and copies the
+existing rows over. Legacy rows have no publish time, so it is backfilled from
+`processing_started_at`; drain the subscription before upgrading, since a
+redelivery of a pre-migration message would not match its backfilled row.
+
+Weekly partitions are created for the range of the existing rows and four weeks
+ahead; EventPartitionMaintainer takes over from there.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41a7e9d0f63"
+down_revision: Union[str, None] = "8d3f1c6e2b57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, message_id, topic, event_type, status, processing_started_at, attempts, next_attempt_at, payload"
+
+
+def _rename_legacy() -> None:
+    op.rename_table("event", "event_legacy")
+    op.execute("ALTER TABLE event_legacy RENAME CONSTRAINT pk_event TO pk_event_legacy")
+    op.execute("ALTER TABLE event_legacy RENAME CONSTRAINT uq_message_topic TO uq_message_topic_legacy")
+    op.execute("ALTER INDEX ix_event_retry_due RENAME TO ix_event_retry_due_legacy")
+    op.execute("ALTER SEQUENCE event_id_seq RENAME TO event_legacy_id_seq")
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.BIGINT(), autoincrement=True, nullable=False),
+        sa.Column("message_id", sa.String(), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("payload", sa.LargeBinary(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+    _rename_legacy()
+    op.create_table(
+        "event",
+        *_columns(),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", "published_at", name="pk_event"),
+        sa.UniqueConstraint("message_id", "topic", "published_at", name="uq_message_topic"),
+        postgresql_partition_by="RANGE (published_at)",
+    )
+    op.create_index(
+        "ix_event_retry_due",
+        "event",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'FAILED'"),
+    )
+    op.execute("CREATE TABLE event_default PARTITION OF event DEFAULT")
+    op.execute(
+        """
+        DO $$
+        DECLARE week_start timestamptz;
+        BEGIN
+            FOR week_start IN
+                SELECT generate_series(
+                    date_trunc('week', COALESCE((SELECT min(processing_started_at) FROM event_legacy), now())),
+                    date_trunc('week', now()) + interval '4 weeks',
+                    interval '1 week'
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF event FOR VALUES FROM (%L) TO (%L)',
+                    'event_p' || to_char(week_start, 'YYYYMMDD'),
+                    week_start,
+                    week_start + interval '1 week'
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute(
+        f"INSERT INTO event ({COLUMNS}, published_at) "
+        f"SELECT {COLUMNS}, COALESCE(processing_started_at, now()) FROM event_legacy"
+    )
+    op.execute("SELECT setval('event_id_seq', COALESCE((SELECT max(id) FROM event_legacy), 0) + 1, false)")
+    op.drop_table("event_legacy")
+
+
+def downgrade() -> None:
+    op.rename_table("event", "event_partitioned")
+    op.execute("ALTER TABLE event_partitioned RENAME CONSTRAINT pk_event TO pk_event_partitioned")
+    op.execute("ALTER TABLE event_partitioned RENAME CONSTRAINT uq_message_topic TO uq_message_topic_partitioned")
+    op.execute("ALTER INDEX ix_event_retry_due RENAME TO ix_event_retry_due_partitioned")
+    op.execute("ALTER SEQUENCE event_id_seq RENAME TO event_partitioned_id_seq")
+    op.create_table(
+        "event",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", name="pk_event"),
+        sa.UniqueConstraint("message_id", "topic", name="uq_message_topic"),
+    )
+    op.create_index(
+        "ix_event_retry_due",
+        "event",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'FAILED'"),
+    )
+    # Redeliveries kept several rows per (message_id, topic); keep the latest.
+    op.execute(
+        f"INSERT INTO event ({COLUMNS}) "
+        f"SELECT DISTINCT ON (message_id, topic) {COLUMNS} FROM event_partitioned "
+        "ORDER BY message_id, topic, published_at DESC"
+    )
+    op.execute("SELECT setval('event_id_seq', COALESCE((SELECT max(id) FROM event_partitioned), 0) + 1, false)")
+    # Dropping the parent drops every attached partition, the default one included.
+    op.drop_table("event_partitioned")
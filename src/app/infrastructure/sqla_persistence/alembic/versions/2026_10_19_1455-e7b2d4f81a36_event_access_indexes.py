@@ -0,0 +1,59 @@
+"""event access indexes
+
+Revision ID: e7b2d4f81a36
+Revises: c41a7e9d0f63
+Create Date: 2026-10-19 14:55:12.640183
+
+Indexes on a partitioned table cannot be built CONCURRENTLY, so on a large
+table this locks writes while every partition is indexed. Run it in a quiet
+window, or pre-build the indexes per partition CONCURRENTLY first.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2d4f81a36"
+down_revision: Union[str, None] = "c41a7e9d0f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_stale_processing",
+        "event",
+        ["processing_started_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PROCESSING'"),
+    )
+    op.create_index(
+        "ix_event_replayable",
+        "event",
+        ["status", "id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('FAILED', 'DEAD_LETTERED')"),
+    )
+    op.create_index(
+        "ix_event_published_at_brin",
+        "event",
+        ["published_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_published_at_brin", table_name="event", postgresql_using="brin")
+    op.drop_index(
+        "ix_event_replayable",
+        table_name="event",
+        postgresql_where=sa.text("status IN ('FAILED', 'DEAD_LETTERED')"),
+    )
+    op.drop_index(
+        "ix_event_stale_processing",
+        table_name="event",
+        postgresql_where=sa.text("status = 'PROCESSING'"),
+    )
@@ -0,0 +1,78 @@
+"""compact event columns
+
+Revision ID: 0a9c5e3b7d18
+Revises: e7b2d4f81a36
+Create Date: 2026-10-19 16:10:27.301874
+
+Moves `topic` and `event_type` into lookup tables referenced by smallint ids and
+turns `status` into a native enum. Every row is rewritten, so on a large table
+run it in a maintenance window.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0a9c5e3b7d18"
+down_revision: Union[str, None] = "e7b2d4f81a36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ("PROCESSING", "FAILED", "PROCESSED", "DEAD_LETTERED")
+LOOKUPS = (("event_topic", "topic"), ("event_type", "event_type"))
+# Their predicates compare `status` as text, which blocks the type change; they are rebuilt around it.
+STATUS_INDEXES = (
+    ("ix_event_retry_due", ["next_attempt_at"], "status = 'FAILED'"),
+    ("ix_event_stale_processing", ["processing_started_at"], "status = 'PROCESSING'"),
+    ("ix_event_replayable", ["status", "id"], "status IN ('FAILED', 'DEAD_LETTERED')"),
+)
+
+
+def _change_status_type(new_type: str) -> None:
+    for name, _, _ in STATUS_INDEXES:
+        op.drop_index(name, table_name="event")
+    op.execute(f"ALTER TABLE event ALTER COLUMN status TYPE {new_type} USING status::text::{new_type}")
+    for name, columns, where in STATUS_INDEXES:
+        op.create_index(name, "event", columns, unique=False, postgresql_where=sa.text(where))
+
+
+def upgrade() -> None:
+    for table, column in LOOKUPS:
+        op.create_table(
+            table,
+            sa.Column("id", sa.SMALLINT(), sa.Identity(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("id", name=op.f(f"pk_{table}")),
+            sa.UniqueConstraint("name", name=op.f(f"uq_{table}_name")),
+        )
+        op.execute(f"INSERT INTO {table} (name) SELECT DISTINCT {column} FROM event ORDER BY 1")
+        op.add_column("event", sa.Column(f"{column}_id", sa.SMALLINT(), nullable=True))
+        op.execute(f"UPDATE event SET {column}_id = l.id FROM {table} l WHERE l.name = event.{column}")
+        op.alter_column("event", f"{column}_id", nullable=False)
+        op.create_foreign_key(f"fk_event_{column}_id", "event", table, [f"{column}_id"], ["id"])
+
+    op.drop_constraint("uq_message_topic", "event", type_="unique")
+    op.drop_column("event", "topic")
+    op.drop_column("event", "event_type")
+    op.create_unique_constraint("uq_message_topic", "event", ["message_id", "topic_id", "published_at"])
+
+    postgresql.ENUM(*STATUSES, name="event_status").create(op.get_bind())
+    _change_status_type("event_status")
+
+
+def downgrade() -> None:
+    _change_status_type("varchar")
+    postgresql.ENUM(name="event_status").drop(op.get_bind())
+
+    op.drop_constraint("uq_message_topic", "event", type_="unique")
+    for table, column in LOOKUPS:
+        op.add_column("event", sa.Column(column, sa.String(), nullable=True))
+        op.execute(f"UPDATE event SET {column} = l.name FROM {table} l WHERE l.id = event.{column}_id")
+        op.alter_column("event", column, nullable=False)
+        op.drop_constraint(f"fk_event_{column}_id", "event", type_="foreignkey")
+        op.drop_column("event", f"{column}_id")
+        op.drop_table(table)
+    op.create_unique_constraint("uq_message_topic", "event", ["message_id", "topic", "published_at"])
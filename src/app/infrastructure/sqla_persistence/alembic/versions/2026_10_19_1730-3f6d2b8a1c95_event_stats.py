@@ -0,0 +1,44 @@
+"""event stats
+
+Revision ID: 3f6d2b8a1c95
+Revises: 0a9c5e3b7d18
+Create Date: 2026-10-19 17:30:41.207315
+
+Adds the `event_stats` rollup and seeds it with one outcome per settled event
+still in `event`, bucketed by publish minute.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6d2b8a1c95"
+down_revision: Union[str, None] = "0a9c5e3b7d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_stats",
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("topic_id", sa.SMALLINT(), nullable=False),
+        sa.Column("event_type_id", sa.SMALLINT(), nullable=False),
+        sa.Column("status", postgresql.ENUM(name="event_status", create_type=False), nullable=False),
+        sa.Column("count", sa.BIGINT(), nullable=False),
+        sa.ForeignKeyConstraint(["topic_id"], ["event_topic.id"], name="fk_event_stats_topic_id"),
+        sa.ForeignKeyConstraint(["event_type_id"], ["event_type.id"], name="fk_event_stats_event_type_id"),
+        sa.PrimaryKeyConstraint("bucket", "topic_id", "event_type_id", "status", name="pk_event_stats"),
+    )
+    op.execute(
+        "INSERT INTO event_stats (bucket, topic_id, event_type_id, status, count) "
+        "SELECT date_trunc('minute', published_at, 'UTC'), topic_id, event_type_id, status, count(*) "
+        "FROM event WHERE status <> 'PROCESSING' GROUP BY 1, 2, 3, 4"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_stats")
@@ -0,0 +1,50 @@
+"""
+Column type for message payloads kept on the `event` row.
+
+Payloads are orjson bytes in the domain. On the way into the database, anything
+at least `min_size` bytes long is compressed with zstd; on the way out, values
+carrying the zstd frame magic are decompressed and everything else is returned
+as-is. Small payloads, and rows written before compression was enabled, simply
+stay raw, so no separate encoding column is needed: JSON can never start with
+the zstd magic.
+
+zstd is an optional dependency (`pip install .[compression]`). Without it
+payloads are stored uncompressed.
+"""
+
+import logging
+
+from sqlalchemy import Dialect, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the installed extras
+    zstandard = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class CompressedPayload(TypeDecorator[bytes]):
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, level: int = 3, min_size: int = 256):
+        super().__init__()
+        self.level = level
+        self.min_size = min_size
+
+    def process_bind_param(self, value: bytes | None, dialect: Dialect) -> bytes | None:
+        if value is None or zstandard is None or len(value) < self.min_size:
+            return value
+        # Compressor objects are not thread-safe, so one is made per call; they are cheap at low levels.
+        return zstandard.ZstdCompressor(level=self.level).compress(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> bytes | None:
+        if value is None or not value.startswith(ZSTD_MAGIC):
+            return value
+        if zstandard is None:
+            raise RuntimeError("Payload is zstd-compressed but 'zstandard' is not installed")
+        return zstandard.ZstdDecompressor().decompress(value)
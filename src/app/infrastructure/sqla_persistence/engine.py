@@ -0,0 +1,39 @@
+"""
+Engine construction from `SqlaEngineSettings`.
+
+Behind a transaction-mode pooler a client connection is only bound to a server
+session for the length of a transaction, so nothing may outlive one: psycopg's
+prepared statements are disabled through `connect_args`, and the statement
+timeout, which would otherwise be a startup option, is set with `set_config(...,
+true)` as each transaction begins. Locks are transaction-scoped throughout
+(`pg_try_advisory_xact_lock`, `SET LOCAL`), so they need nothing extra.
+"""
+
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.infrastructure.adapters.database.pool_metrics import PoolMetrics
+from app.setup.config.settings import PostgresDsn, SqlaEngineSettings
+
+
+def build_async_engine(dsn: PostgresDsn, settings: SqlaEngineSettings, pool_metrics: PoolMetrics) -> AsyncEngine:
+    engine = create_async_engine(
+        url=dsn,
+        **settings.model_dump(),
+        connect_args=settings.connect_args(),
+        poolclass=pool_metrics.pool_class(),
+    )
+    pool_metrics.instrument(engine, settings.max_overflow)
+    if settings.transaction_pooling and settings.statement_timeout_ms:
+        timeout = f"{settings.statement_timeout_ms}ms"
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def set_statement_timeout(connection: Connection) -> None:
+            # Runs on the DBAPI cursor: going through `connection` would re-enter the transaction being begun.
+            cursor = connection.connection.cursor()
+            try:
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", (timeout,))
+            finally:
+                cursor.close()
+
+    return engine
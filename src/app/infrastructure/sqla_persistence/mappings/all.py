@@ -21,8 +21,13 @@ in `env.py` for Alembic migrations to ensure all models are available
 during database migrations.
 """
 
+from app.infrastructure.sqla_persistence.mappings.dead_letter import map_dead_letter_table
 from app.infrastructure.sqla_persistence.mappings.event import map_event_table
 
+# Core-only table with no entity to map; imported so it is part of the metadata Alembic compares against.
+from app.infrastructure.sqla_persistence.mappings.event_stats import event_stats_table  # noqa: F401
+
 
 def map_tables() -> None:
     map_event_table()
+    map_dead_letter_table()
@@ -0,0 +1,44 @@
+from sqlalchemy import BIGINT, Column, DateTime, Index, Integer, String, Table, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.domain.entities.pub_sub.entity import DeadLetter
+from app.infrastructure.sqla_persistence.compressed_payload import CompressedPayload
+from app.infrastructure.sqla_persistence.orm_registry import mapping_registry
+
+dead_letter_table = Table(
+    "dead_letter",
+    mapping_registry.metadata,
+    Column("id", BIGINT, primary_key=True),
+    Column("message_id", String, nullable=False),
+    Column("topic", String, nullable=False),
+    Column("event_type", String, nullable=True),
+    Column("payload", CompressedPayload(), nullable=False),
+    Column("attributes", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    Column("error", Text, nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("published_at", DateTime(timezone=True), nullable=True),
+    Column("dead_lettered_at", DateTime(timezone=True), nullable=False),
+    Column("replayed_at", DateTime(timezone=True), nullable=True),
+    # Operators only ever page through what has not been replayed yet.
+    Index("ix_dead_letter_pending", "id", postgresql_where=text("replayed_at IS NULL")),
+)
+
+
+def map_dead_letter_table() -> None:
+    mapping_registry.map_imperatively(
+        DeadLetter,
+        dead_letter_table,
+        properties={
+            "id": dead_letter_table.c.id,
+            "message_id": dead_letter_table.c.message_id,
+            "topic": dead_letter_table.c.topic,
+            "event_type": dead_letter_table.c.event_type,
+            "payload": dead_letter_table.c.payload,
+            "attributes": dead_letter_table.c.attributes,
+            "error": dead_letter_table.c.error,
+            "attempts": dead_letter_table.c.attempts,
+            "published_at": dead_letter_table.c.published_at,
+            "dead_lettered_at": dead_letter_table.c.dead_lettered_at,
+            "replayed_at": dead_letter_table.c.replayed_at,
+        },
+    )
@@ -1,27 +1,89 @@
-from sqlalchemy import BIGINT, Column, DateTime, Enum, MetaData, String, Table, UniqueConstraint
-from sqlalchemy.orm import registry
+from typing import Any
+
+from sqlalchemy import (
+    BIGINT,
+    DDL,
+    SMALLINT,
+    Column,
+    ColumnElement,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    UniqueConstraint,
+    event,
+    text,
+)
+from sqlalchemy.orm import column_property
 
 from app.domain.entities.pub_sub.entity import Event
 from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.sqla_persistence.compressed_payload import CompressedPayload
+from app.infrastructure.sqla_persistence.name_lookup import NameLookup
+from app.infrastructure.sqla_persistence.orm_registry import mapping_registry
 
-metadata = MetaData()
-mapping_registry = registry(metadata=metadata)
+metadata = mapping_registry.metadata
 # id, message_id, status = (processing, processed), topic, event_type
 
+# Topics and event types are a handful of strings repeated on every event row; the row keeps a smallint id.
+event_topic_table = Table(
+    "event_topic",
+    mapping_registry.metadata,
+    Column("id", SMALLINT, Identity(), primary_key=True),
+    Column("name", String, nullable=False, unique=True),
+)
+event_type_table = Table(
+    "event_type",
+    mapping_registry.metadata,
+    Column("id", SMALLINT, Identity(), primary_key=True),
+    Column("name", String, nullable=False, unique=True),
+)
+event_topics = NameLookup(event_topic_table)
+event_types = NameLookup(event_type_table)
+
+# Range-partitioned by publish time; partitions are created and expired by EventPartitionMaintainer.
+# Postgres requires the partition key in every unique constraint, hence in the primary key as well.
 event_table = Table(
     "event",
     mapping_registry.metadata,
-    Column("id", BIGINT, primary_key=True),
-    Column("message_id", String, nullable=False, unique=True),
-    Column("topic", String, nullable=False),
-    Column("event_type", String, nullable=False),
-    Column(
-        "status",
-        Enum(EventStatus, name="event_status", native_enum=False, validate_strings=True),
-        nullable=False,
-    ),
-    Column("processing_started_at", DateTime, nullable=True),
-    UniqueConstraint("message_id", "topic", name="uq_message_topic"),
+    Column("id", BIGINT, autoincrement=True),
+    Column("message_id", String, nullable=False),
+    Column("topic_id", SMALLINT, ForeignKey("event_topic.id"), nullable=False),
+    Column("event_type_id", SMALLINT, ForeignKey("event_type.id"), nullable=False),
+    # A native enum is 4 bytes, against a varchar the length of the name plus its header.
+    Column("status", Enum(EventStatus, name="event_status", validate_strings=True), nullable=False),
+    Column("processing_started_at", DateTime(timezone=True), nullable=True),
+    Column("published_at", DateTime(timezone=True), nullable=False),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("next_attempt_at", DateTime(timezone=True), nullable=True),
+    Column("payload", CompressedPayload(), nullable=True),
+    PrimaryKeyConstraint("id", "published_at", name="pk_event"),
+    UniqueConstraint("message_id", "topic_id", "published_at", name="uq_message_topic"),
+    # Settled rows (PROCESSED) are the bulk of the table and are only ever fetched by key,
+    # so the status indexes are partial and stay the size of the backlog.
+    # The retry worker only ever looks at FAILED rows that are due.
+    Index("ix_event_retry_due", "next_attempt_at", postgresql_where=text("status = 'FAILED'")),
+    # The reaper looks for PROCESSING rows whose handler died.
+    Index("ix_event_stale_processing", "processing_started_at", postgresql_where=text("status = 'PROCESSING'")),
+    # Bulk replay pages through FAILED / DEAD_LETTERED rows in id order.
+    Index("ix_event_replayable", "status", "id", postgresql_where=text("status IN ('FAILED', 'DEAD_LETTERED')")),
+    # Rows arrive in publish-time order, so a BRIN index serves time-range scans at a fraction of a btree's size.
+    Index("ix_event_published_at_brin", "published_at", postgresql_using="brin"),
+    postgresql_partition_by="RANGE (published_at)",
+)
+
+# Catches rows outside every range partition, so an insert never fails for want of a partition.
+# It should stay empty; the maintainer warns when it is not.
+EVENT_DEFAULT_PARTITION = "event_default"
+event.listen(
+    event_table,
+    "after_create",
+    DDL(f"CREATE TABLE IF NOT EXISTS {EVENT_DEFAULT_PARTITION} PARTITION OF event DEFAULT"),  # type: ignore[no-untyped-call]
 )
 
 
@@ -32,9 +94,28 @@ def map_event_table() -> None:
         properties={
             "id": event_table.c.id,
             "message_id": event_table.c.message_id,
-            "topic": event_table.c.topic,
-            "event_type": event_table.c.event_type,
+            # Read-only: writes go through EventRepository, which resolves the ids. Neither ever
+            # changes on an existing row, so there is no point reloading them after a flush.
+            "topic": column_property(event_topics.name_of(event_table.c.topic_id), expire_on_flush=False),
+            "event_type": column_property(
+                event_types.name_of(event_table.c.event_type_id), expire_on_flush=False
+            ),
             "status": event_table.c.status,
             "processing_started_at": event_table.c.processing_started_at,
+            "published_at": event_table.c.published_at,
+            "attempts": event_table.c.attempts,
+            "next_attempt_at": event_table.c.next_attempt_at,
+            "payload": event_table.c.payload,
         },
     )
+
+
+def event_columns() -> list[ColumnElement[Any]]:
+    """The columns of an `Event`, names resolved, for Core selects that build entities by hand."""
+    columns: list[ColumnElement[Any]] = [
+        column for column in event_table.c if column.key not in ("topic_id", "event_type_id")
+    ]
+    return columns + [
+        event_topics.name_of(event_table.c.topic_id).label("topic"),
+        event_types.name_of(event_table.c.event_type_id).label("event_type"),
+    ]
@@ -0,0 +1,20 @@
+from sqlalchemy import BIGINT, SMALLINT, Column, DateTime, ForeignKey, PrimaryKeyConstraint, Table
+
+from app.infrastructure.sqla_persistence.mappings.event import event_table
+from app.infrastructure.sqla_persistence.orm_registry import mapping_registry
+
+# Rollup of event outcomes, maintained by EventRepository in the transaction that
+# changes the statuses: one row per publish-time bucket, topic, event type and
+# status. Buckets are minutes, compacted into hours once they are older than
+# STATS_COMPACT_AFTER_DAYS by EventPartitionMaintainer. Not partitioned and not
+# expired with `event`, so the statistics outlive the raw rows.
+event_stats_table = Table(
+    "event_stats",
+    mapping_registry.metadata,
+    Column("bucket", DateTime(timezone=True), nullable=False),
+    Column("topic_id", SMALLINT, ForeignKey("event_topic.id"), nullable=False),
+    Column("event_type_id", SMALLINT, ForeignKey("event_type.id"), nullable=False),
+    Column("status", event_table.c.status.type, nullable=False),
+    Column("count", BIGINT, nullable=False),
+    PrimaryKeyConstraint("bucket", "topic_id", "event_type_id", "status", name="pk_event_stats"),
+)
@@ -0,0 +1,55 @@
+"""
+Interning of low-cardinality strings (topics, event types) into lookup tables.
+
+The `event` row stores a smallint id instead of repeating the string, which
+keeps rows and the indexes that include the column small. Ids never change once
+assigned, so each process caches name -> id and only goes to the database for
+names it has not seen yet.
+
+Lookups run in the caller's session rather than on a connection of their own,
+so a burst of new names cannot starve the pool. An id is only cached once it was
+read back as an existing row: one inserted by the caller's own transaction could
+still be rolled back, so it is returned uncached and picked up by a later call.
+"""
+
+from sqlalchemy import BindParameter, ColumnElement, ScalarSelect, Table, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class NameLookup:
+    def __init__(self, table: Table):
+        self._table = table
+        self._ids: dict[str, int] = {}
+
+    async def id_for(self, session: AsyncSession, name: str) -> int:
+        cached = self._ids.get(name)
+        if cached is not None:
+            return cached
+        table = self._table
+        lookup = select(table.c.id).where(table.c.name == name)
+        existing: int | None = (await session.execute(lookup)).scalar_one_or_none()
+        if existing is not None:
+            self._ids[name] = existing
+            return existing
+        inserted = await session.execute(
+            insert(table).values(name=name).on_conflict_do_nothing(index_elements=["name"]).returning(table.c.id)
+        )
+        new_id: int | None = inserted.scalar_one_or_none()
+        if new_id is None:
+            # A concurrent transaction got there first; its row is visible once it commits.
+            new_id = (await session.execute(lookup)).scalar_one()
+        return new_id
+
+    def id_of(self, name: str | BindParameter[str]) -> ScalarSelect[int]:
+        """
+        For filters: resolves in SQL, so looking up an unknown name has no side
+        effects. Takes a bind parameter for statements that are built once.
+        """
+        return select(self._table.c.id).where(self._table.c.name == name).scalar_subquery()
+
+    def name_of(self, id_column: ColumnElement[int]) -> ScalarSelect[str]:
+        return select(self._table.c.name).where(self._table.c.id == id_column).scalar_subquery()
+
+    def clear(self) -> None:
+        self._ids.clear()
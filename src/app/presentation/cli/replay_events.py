@@ -0,0 +1,68 @@
+"""
+Replays stored events through their handlers without republishing them.
+
+Usage:
+    python -m app.presentation.cli.replay_events --status FAILED --topic daily-digest --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.bulk_event_replayer import REPLAYABLE_STATUSES, BulkEventReplayer
+from app.infrastructure.sqla_persistence.mappings.all import map_tables
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import load_settings
+from app.setup.ioc.registry import get_providers
+
+log = logging.getLogger(__name__)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--status",
+        choices=[status.value for status in REPLAYABLE_STATUSES],
+        default=EventStatus.FAILED.value,
+        help="Replay events in this status (default: %(default)s).",
+    )
+    parser.add_argument("--topic", default=None, help="Only replay events from this topic.")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many events.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum replays in flight (default: REPLAY_CONCURRENCY from the config).",
+    )
+    return parser.parse_args(argv)
+
+
+async def replay(args: argparse.Namespace) -> int:
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+    map_tables()
+
+    container = create_async_ioc_container(providers=get_providers(), settings=settings)
+    try:
+        replayer = await container.get(BulkEventReplayer)
+        result = await replayer.run(
+            status=EventStatus(args.status),
+            topic=args.topic,
+            limit=args.limit,
+            concurrency=args.concurrency,
+        )
+    finally:
+        await container.close()
+
+    print(f"replayed={result.replayed} failed={result.failed}")
+    return 1 if result.failed else 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    raise SystemExit(asyncio.run(replay(parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
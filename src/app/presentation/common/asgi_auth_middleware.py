@@ -1,97 +1,105 @@
+import functools
 import logging
 from http.cookies import SimpleCookie
-from typing import Any, Literal
+from typing import Any
 
 from fastapi import FastAPI
-from starlette.datastructures import MutableHeaders
-from starlette.requests import Request
+from starlette.requests import cookie_parser
 from starlette.types import Message, Receive, Scope, Send
 
 log = logging.getLogger(__name__)
 
+# Encodes values the way `SimpleCookie` does; only its `value_encode` is used.
+_ENCODER = SimpleCookie()
 
-class ASGIAuthMiddleware:
-    def __init__(self, app: FastAPI):
-        self.app = app
-
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
-            return
-
-        request = Request(scope)
-
-        async def modify_cookies(message: Message) -> None:
-            if message["type"] != "http.response.start":
-                await send(message)
-                return
-
-            headers = MutableHeaders(scope=message)
-
-            self._set_access_token_cookie(request, headers)
-            self._set_refresh_token_cookie(request, headers)
-            self._delete_access_token_cookie(request, headers)
-
-            await send(message)
 
-        await self.app(scope, receive, modify_cookies)
+def _cookie_attributes(secure: bool, samesite: str | None, max_age: int | None = None) -> str:
+    """What `SimpleCookie` writes after `name=value`, for the given attributes."""
+    cookie = SimpleCookie()
+    cookie["name"] = "value"
+    cookie["name"]["path"] = "/"
+    cookie["name"]["httponly"] = True
+    if max_age is not None:
+        cookie["name"]["max-age"] = max_age
+    if secure:
+        cookie["name"]["secure"] = True
+    if samesite is not None:
+        cookie["name"]["samesite"] = samesite
+    return cookie["name"].OutputString().removeprefix("name=value")
 
-    def _set_token_cookie(
-        self, headers: MutableHeaders, name: str, value: str, secure: bool, samesite: Literal["strict"] | None
-    ) -> None:
-        cookie = SimpleCookie()
-        cookie[name] = value
-        cookie[name]["path"] = "/"
-        cookie[name]["httponly"] = True
-        if secure:
-            cookie[name]["secure"] = True
-        if samesite is not None:
-            cookie[name]["samesite"] = samesite
 
-        for morsel in cookie.values():
-            headers.append("Set-Cookie", morsel.OutputString())
+@functools.cache
+def _token_cookie_attributes(secure: bool, samesite: str | None) -> bytes:
+    """Serialised once per combination, so headers match a `SimpleCookie` built per response."""
+    return _cookie_attributes(secure, samesite).encode("latin-1")
 
-        log.debug("Cookie with %s '%s' was set.", name, value)
-
-    def _set_access_token_cookie(self, request: Request, headers: MutableHeaders) -> None:
-        new_access_token: str | None = getattr(request.state, "new_access_token", None)
-        if new_access_token is None:
-            return
 
-        cookie_params: dict[str, Any] = getattr(request.state, "cookie_params", {})
-        is_cookie_secure: bool = cookie_params.get("secure", False)
-        cookie_samesite: Literal["strict"] | None = cookie_params.get("samesite", None)
+_DELETE_ACCESS_TOKEN_COOKIE = b'access_token=""' + _cookie_attributes(False, None, max_age=0).encode("latin-1")
 
-        self._set_token_cookie(headers, "access_token", new_access_token, is_cookie_secure, cookie_samesite)
 
-    def _set_refresh_token_cookie(self, request: Request, headers: MutableHeaders) -> None:
-        new_refresh_token: str | None = getattr(request.state, "new_refresh_token", None)
-        if new_refresh_token is None:
-            return
+class ASGIAuthMiddleware:
+    """
+    Writes the auth cookies a handler asked for through `request.state`:
+    `new_access_token` and `new_refresh_token` set them (with the `secure`
+    and `samesite` of `cookie_params`) and `delete_access_token` expires the
+    access token.
 
-        cookie_params: dict[str, Any] = getattr(request.state, "cookie_params", {})
-        is_cookie_secure: bool = cookie_params.get("secure", False)
-        cookie_samesite: Literal["strict"] | None = cookie_params.get("samesite", None)
+    Pure ASGI: `request.state` is the `state` dict of the scope, so nothing is
+    built per request, and the response headers are only touched when one of
+    the flags is set, which most requests (probes, the event API) never do.
+    """
 
-        self._set_token_cookie(headers, "refresh_token", new_refresh_token, is_cookie_secure, cookie_samesite)
+    def __init__(self, app: FastAPI):
+        self.app = app
 
-    def _delete_access_token_cookie(self, request: Request, headers: MutableHeaders) -> None:
-        is_delete_token: bool = getattr(request.state, "delete_access_token", False)
-        if not is_delete_token:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
             return
 
-        current_access_token: str | None = request.cookies.get("access_token", None)
-        log.debug(
-            "Deleting cookie with access token '%s'.",
-            current_access_token if current_access_token else "already deleted",
-        )
-
-        cookie = SimpleCookie()
-        cookie["access_token"] = ""  # nosec
-        cookie["access_token"]["path"] = "/"
-        cookie["access_token"]["httponly"] = True
-        cookie["access_token"]["max-age"] = 0
-
-        headers.append("Set-Cookie", cookie.output(header="").strip())
+        async def send_with_cookies(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state = scope.get("state")
+                if state:
+                    cookies = self._cookie_headers(state, scope)
+                    if cookies:
+                        message["headers"] = [*message.get("headers", ()), *cookies]
+            await send(message)
 
-        log.debug("Cookie was deleted.")
+        await self.app(scope, receive, send_with_cookies)
+
+    def _cookie_headers(self, state: dict[str, Any], scope: Scope) -> list[tuple[bytes, bytes]]:
+        headers = []
+        new_access_token: str | None = state.get("new_access_token")
+        new_refresh_token: str | None = state.get("new_refresh_token")
+        if new_access_token is not None or new_refresh_token is not None:
+            cookie_params: dict[str, Any] = state.get("cookie_params", {})
+            attributes = _token_cookie_attributes(
+                bool(cookie_params.get("secure", False)), cookie_params.get("samesite", None)
+            )
+            if new_access_token is not None:
+                headers.append(self._token_cookie("access_token", new_access_token, attributes))
+            if new_refresh_token is not None:
+                headers.append(self._token_cookie("refresh_token", new_refresh_token, attributes))
+        if state.get("delete_access_token", False):
+            headers.append((b"set-cookie", _DELETE_ACCESS_TOKEN_COOKIE))
+            if log.isEnabledFor(logging.DEBUG):
+                current_access_token = self._request_cookies(scope).get("access_token")
+                log.debug(
+                    "Deleted cookie with access token '%s'.",
+                    current_access_token if current_access_token else "already deleted",
+                )
+        return headers
+
+    @staticmethod
+    def _token_cookie(name: str, value: str, attributes: bytes) -> tuple[bytes, bytes]:
+        log.debug("Cookie with %s '%s' was set.", name, value)
+        _, encoded = _ENCODER.value_encode(value)
+        return b"set-cookie", f"{name}={encoded}".encode("latin-1") + attributes
+
+    @staticmethod
+    def _request_cookies(scope: Scope) -> dict[str, str]:
+        for key, value in scope["headers"]:
+            if key == b"cookie":
+                return cookie_parser(value.decode("latin-1"))
+        return {}
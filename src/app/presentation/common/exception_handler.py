@@ -8,7 +8,10 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.requests import Request
 from fastapi.responses import ORJSONResponse
 
+from app.application.common.exceptions.authorization import AuthenticationError, AuthorizationError
 from app.application.common.exceptions.base import ApplicationError
+from app.application.common.exceptions.query import QueryRangeError
+from app.application.common.exceptions.replay import ReplayInProgressError, ReplayJobNotFoundError
 from app.domain.exceptions.base import DomainError, DomainFieldError
 from app.infrastructure.exceptions.base import InfrastructureError
 
@@ -30,6 +33,15 @@ class ExceptionHandler:
     _ERROR_MAPPING: Final[dict[type[Exception], int]] = {
         # 400
         DomainFieldError: status.HTTP_400_BAD_REQUEST,
+        QueryRangeError: status.HTTP_400_BAD_REQUEST,
+        # 401
+        AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+        # 403
+        AuthorizationError: status.HTTP_403_FORBIDDEN,
+        # 404
+        ReplayJobNotFoundError: status.HTTP_404_NOT_FOUND,
+        # 409
+        ReplayInProgressError: status.HTTP_409_CONFLICT,
         # 422
         pydantic.ValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
         # 500
@@ -1,5 +1,41 @@
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import Security
 from fastapi.security import APIKeyCookie
 
+from app.application.common.exceptions.authorization import AuthenticationError, AuthorizationError
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
+
 # Token extraction marker for FastAPI Swagger UI.
-# The actual token processing will be handled behind the Identity Provider.
-cookie_scheme = APIKeyCookie(name="access_token")
+# The token is issued by the Identity Provider; here it is only verified.
+cookie_scheme = APIKeyCookie(name="access_token", auto_error=False)
+
+
+class Role(StrEnum):
+    # The /admin endpoints: event listings, payloads, replays.
+    ADMIN = "admin"
+    # Publishing and sending notifications.
+    PUBLISHER = "publisher"
+
+
+def require_role(role: Role) -> Callable[..., Awaitable[None]]:
+    """A route dependency refusing callers whose access token does not grant `role`."""
+
+    @inject
+    async def check_role(
+        processor: FromDishka[JwtAccessTokenProcessor],
+        access_token: str | None = Security(cookie_scheme),
+    ) -> None:
+        if not access_token:
+            raise AuthenticationError("Not authenticated.")
+        roles = processor.decode_roles(access_token)
+        if roles is None:
+            raise AuthenticationError("Invalid or expired access token.")
+        if role not in roles:
+            raise AuthorizationError(f"The '{role}' role is required.")
+
+    return check_role
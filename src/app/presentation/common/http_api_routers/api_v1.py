@@ -1,17 +1,46 @@
-from fastapi import APIRouter
+from dataclasses import dataclass
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, status
 from fastapi.requests import Request
+from fastapi.responses import ORJSONResponse
+
+from app.application.common.ports.connection_pool import PoolMonitor, PoolStats
+from app.application.common.ports.event_subscriber import EventConsumer, SubscriberHealth
+from app.presentation.http_controllers.dead_letters import dead_letters_router
+from app.presentation.http_controllers.events import events_router
+from app.presentation.http_controllers.health import health_router
+from app.presentation.http_controllers.notifications import notifications_router
 
 api_v1_router = APIRouter(
     prefix="/api/v1",
 )
 
 
+@dataclass(frozen=True, slots=True)
+class HealthSchema:
+    status: str
+    subscriber: SubscriberHealth
+    database_pool: PoolStats
+
+
 @api_v1_router.get("/", tags=["General"])
-async def healthcheck(_: Request) -> dict[str, str]:
-    return {"status": "ok"}
+@inject
+async def healthcheck(
+    _: Request, consumer: FromDishka[EventConsumer], pool: FromDishka[PoolMonitor]
+) -> ORJSONResponse:
+    subscriber_health = consumer.health()
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK if subscriber_health.healthy else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=HealthSchema(
+            status="ok" if subscriber_health.healthy else "degraded",
+            subscriber=subscriber_health,
+            database_pool=pool.stats(),
+        ),
+    )
 
 
-api_v1_sub_routers: tuple = ()
+api_v1_sub_routers: tuple = (dead_letters_router, events_router, health_router, notifications_router)
 
 for router in api_v1_sub_routers:
     api_v1_router.include_router(router)
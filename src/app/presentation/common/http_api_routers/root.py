@@ -1,6 +1,10 @@
+from dishka.integrations.fastapi import FromDishka, inject
 from fastapi import APIRouter
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
 
+from app.application.common.ports.connection_pool import PoolMonitor
+from app.infrastructure.observability.metrics import REGISTRY
+from app.infrastructure.observability.pipeline_metrics import pool_metric_lines
 from app.presentation.common.http_api_routers.api_v1 import api_v1_router
 
 root_router = APIRouter()
@@ -11,6 +15,16 @@ async def redirect_to_docs() -> RedirectResponse:
     return RedirectResponse(url="docs/")
 
 
+@root_router.get("/metrics", tags=["General"], response_class=PlainTextResponse)
+@inject
+async def metrics(pool: FromDishka[PoolMonitor]) -> PlainTextResponse:
+    """Prometheus scrape endpoint."""
+    return PlainTextResponse(
+        REGISTRY.render(lambda: pool_metric_lines(pool.stats())),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 root_sub_routers = (api_v1_router,)
 
 for router in root_sub_routers:
@@ -0,0 +1,28 @@
+import logging
+
+import jwt
+
+log = logging.getLogger(__name__)
+
+
+class JwtAccessTokenProcessor:
+    """
+    Reads the access tokens the identity provider issues: JWTs signed with
+    `JWT_SECRET`, carrying an `exp` and the caller's `roles`.
+    """
+
+    def __init__(self, secret: str, algorithm: str):
+        self._secret = secret
+        self._algorithm = algorithm
+
+    def decode_roles(self, token: str) -> frozenset[str] | None:
+        """The roles the token grants, or `None` when it is invalid or expired."""
+        try:
+            payload = jwt.decode(token, self._secret, algorithms=[self._algorithm], options={"require": ["exp"]})
+        except jwt.PyJWTError as e:
+            log.debug("Rejected access token: %s", e)
+            return None
+        roles = payload.get("roles", [])
+        if not isinstance(roles, list):
+            return None
+        return frozenset(role for role in roles if isinstance(role, str))
@@ -0,0 +1,175 @@
+"""
+Splitting a streamed request body into JSON items without buffering it.
+
+Both splitters are fed the body chunk by chunk and hand back the raw bytes of
+each complete item, for the caller to parse; only the item being read is held
+in memory, and an item growing past `max_item_bytes` is an error. NDJSON splits
+on newlines at C speed. A JSON array has to be scanned for the commas that
+separate its elements, which costs a regex step per bracket, brace, comma and
+quote, so large batches are better sent as NDJSON.
+"""
+
+import re
+from collections.abc import AsyncIterator
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class NdjsonSplitter:
+    def __init__(self, max_item_bytes: int):
+        self._max_item_bytes = max_item_bytes
+        self._buffer = bytearray()
+        self._error: JsonStreamError | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self._error is not None:
+            raise self._error
+        self._buffer += chunk
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            if len(self._buffer) > self._max_item_bytes:
+                raise JsonStreamError(f"Line longer than {self._max_item_bytes} bytes")
+            return []
+        lines = bytes(self._buffer[:end]).split(b"\n")
+        del self._buffer[: end + 1]
+        items = [line for line in lines if line.strip()]
+        too_long = next((i for i, item in enumerate(items) if len(item) > self._max_item_bytes), None)
+        if too_long is not None:
+            # As with arrays, the lines before it are still handed back.
+            self._error = JsonStreamError(f"Line longer than {self._max_item_bytes} bytes")
+            if too_long == 0:
+                raise self._error
+            return items[:too_long]
+        return items
+
+    def close(self) -> list[bytes]:
+        if self._error is not None:
+            raise self._error
+        rest = bytes(self._buffer)
+        self._buffer.clear()
+        return [rest] if rest.strip() else []
+
+
+_STRUCTURAL = re.compile(rb'[\[\]{},"]')
+_STRING_END = re.compile(rb'["\\]')
+_START, _ITEMS, _END = range(3)
+
+
+class JsonArraySplitter:
+    """Splits a top-level JSON array into its elements; their own syntax is left to the parser."""
+
+    def __init__(self, max_item_bytes: int):
+        self._max_item_bytes = max_item_bytes
+        self._buffer = bytearray()
+        self._pos = 0
+        self._item_start = 0
+        self._state = _START
+        self._depth = 0
+        self._in_string = False
+        self._after_comma = False
+        self._error: JsonStreamError | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self._error is not None:
+            raise self._error
+        items: list[bytes] = []
+        try:
+            self._scan(chunk, items)
+        except JsonStreamError as e:
+            if not items:
+                raise
+            # The elements before the error are still handed back; the error comes with the next call.
+            self._error = e
+        return items
+
+    def _scan(self, chunk: bytes, items: list[bytes]) -> None:
+        buffer = self._buffer
+        buffer += chunk
+        i = self._pos
+        while i < len(buffer):
+            if self._state == _END:
+                if buffer[i:].strip():
+                    raise JsonStreamError("Data after the end of the array")
+                i = len(buffer)
+                break
+            if self._in_string:
+                match = _STRING_END.search(buffer, i)
+                if match is None:
+                    i = len(buffer)
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):  # the escaped character is in the next chunk
+                        i = match.start()
+                        break
+                    i = match.end() + 1
+                    continue
+                self._in_string = False
+                i = match.end()
+                continue
+            match = _STRUCTURAL.search(buffer, i)
+            if match is None:
+                i = len(buffer)
+                break
+            char, at = match.group(), match.start()
+            if self._state == _START:
+                if char != b"[" or buffer[i:at].strip():
+                    raise JsonStreamError("Expected a JSON array")
+                self._state = _ITEMS
+                self._item_start = match.end()
+            elif char == b'"':
+                self._in_string = True
+            elif char in b"[{":
+                self._depth += 1
+            elif char in b"]}" and self._depth > 0:
+                self._depth -= 1
+            elif self._depth > 0:  # a comma inside an element
+                pass
+            elif char == b"]":
+                item = bytes(buffer[self._item_start : at]).strip()
+                if item:
+                    items.append(item)
+                elif self._after_comma:
+                    raise JsonStreamError("Trailing comma in the array")
+                self._state = _END
+            elif char == b",":
+                item = bytes(buffer[self._item_start : at]).strip()
+                if not item:
+                    raise JsonStreamError("Empty array element")
+                items.append(item)
+                self._item_start = match.end()
+                self._after_comma = True
+                i = match.end()
+                continue
+            else:  # a stray closing brace
+                raise JsonStreamError("Unbalanced brackets in the array")
+            self._after_comma = False
+            i = match.end()
+
+        # Keeps only the element being read.
+        if self._state == _ITEMS:
+            consumed, self._item_start = self._item_start, 0
+        else:
+            consumed = i
+        del buffer[:consumed]
+        self._pos = i - consumed
+        if len(buffer) > self._max_item_bytes:
+            raise JsonStreamError(f"Array element longer than {self._max_item_bytes} bytes")
+
+    def close(self) -> list[bytes]:
+        if self._error is not None:
+            raise self._error
+        if self._state != _END:
+            raise JsonStreamError("The array is not closed")
+        return []
+
+
+async def split_json_stream(
+    chunks: AsyncIterator[bytes], splitter: NdjsonSplitter | JsonArraySplitter
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield item
+    for item in splitter.close():
+        yield item
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends, Query, status
+
+from app.application.commands.replay_dead_letters import ReplayDeadLettersInteractor, ReplayResult
+from app.application.queries.dead_letters import ListDeadLettersQuery
+from app.domain.entities.pub_sub.entity import DeadLetter
+from app.presentation.common.fastapi_dependencies import Role, require_role
+
+dead_letters_router = APIRouter(
+    prefix="/admin/dead-letters",
+    tags=["Dead letters"],
+    dependencies=[Depends(require_role(Role.ADMIN))],
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DeadLetterSchema:
+    id: int
+    message_id: str
+    topic: str
+    event_type: str | None
+    payload: str
+    attributes: dict[str, str]
+    error: str
+    attempts: int
+    published_at: datetime | None
+    dead_lettered_at: datetime
+
+    @classmethod
+    def from_entity(cls, dead_letter: DeadLetter) -> "DeadLetterSchema":
+        assert dead_letter.id is not None
+        return cls(
+            id=dead_letter.id,
+            message_id=dead_letter.message_id,
+            topic=dead_letter.topic,
+            event_type=dead_letter.event_type,
+            payload=dead_letter.payload.decode("utf-8", errors="replace"),
+            attributes=dead_letter.attributes,
+            error=dead_letter.error,
+            attempts=dead_letter.attempts,
+            published_at=dead_letter.published_at,
+            dead_lettered_at=dead_letter.dead_lettered_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DeadLetterPageSchema:
+    items: list[DeadLetterSchema]
+    next_after_id: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayRequestSchema:
+    ids: list[int] | None = None
+    limit: int = 100
+
+
+@dead_letters_router.get("/")
+@inject
+async def list_dead_letters(
+    query: FromDishka[ListDeadLettersQuery],
+    limit: int = Query(default=50, ge=1, le=500),
+    after_id: int | None = Query(default=None, ge=0),
+) -> DeadLetterPageSchema:
+    dead_letters = await query(limit, after_id)
+    items = [DeadLetterSchema.from_entity(dead_letter) for dead_letter in dead_letters]
+    return DeadLetterPageSchema(
+        items=items,
+        next_after_id=items[-1].id if len(items) == limit else None,
+    )
+
+
+@dead_letters_router.post("/replay", status_code=status.HTTP_200_OK)
+@inject
+async def replay_dead_letters(
+    body: ReplayRequestSchema,
+    interactor: FromDishka[ReplayDeadLettersInteractor],
+) -> ReplayResult:
+    return await interactor(ids=body.ids, limit=max(1, min(body.limit, 500)))
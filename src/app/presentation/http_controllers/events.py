@@ -0,0 +1,241 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Literal
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import Field
+
+from app.application.queries.events import CountEventsQuery, DeliveryStatsQuery, ListEventsQuery
+from app.domain.entities.pub_sub.entity import DeliveryCount, Event, EventCount
+from app.domain.entities.pub_sub.value_objects import EventStatus, TimeBucket
+from app.infrastructure.adapters.database.replay_jobs import ReplayFilter, ReplayJob, ReplayJobs, ReplayJobState
+from app.presentation.common.fastapi_dependencies import Role, require_role
+
+events_router = APIRouter(
+    prefix="/admin/events",
+    tags=["Events"],
+    dependencies=[Depends(require_role(Role.ADMIN))],
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EventSchema:
+    id: int
+    message_id: str
+    topic: str
+    event_type: str
+    status: EventStatus
+    attempts: int
+    published_at: datetime
+    processing_started_at: datetime | None
+    next_attempt_at: datetime | None
+    payload: str | None
+
+    @classmethod
+    def from_entity(cls, event: Event) -> "EventSchema":
+        assert event.id is not None
+        return cls(
+            id=event.id,
+            message_id=event.message_id,
+            topic=event.topic,
+            event_type=event.event_type,
+            status=event.status,
+            attempts=event.attempts,
+            published_at=event.published_at,
+            processing_started_at=event.processing_started_at,
+            next_attempt_at=event.next_attempt_at,
+            payload=event.payload.decode("utf-8", errors="replace") if event.payload is not None else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EventPageSchema:
+    items: list[EventSchema]
+    next_after_id: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class EventCountsSchema:
+    bucket: TimeBucket
+    published_from: datetime
+    published_until: datetime
+    items: list[EventCount]
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryStatsSchema:
+    bucket: TimeBucket
+    published_from: datetime
+    published_until: datetime
+    items: list[DeliveryCount]
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayJobRequestSchema:
+    status: Literal["FAILED", "DEAD_LETTERED"] = "FAILED"
+    topic: str | None = None
+    event_type: str | None = None
+    published_from: datetime | None = None
+    published_until: datetime | None = None
+    limit: Annotated[int | None, Field(ge=1)] = None
+    # Replays in flight; defaults to REPLAY_CONCURRENCY.
+    concurrency: Annotated[int | None, Field(ge=1, le=64)] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayJobSchema:
+    id: str
+    state: ReplayJobState
+    filter: ReplayFilter
+    concurrency: int | None
+    replayed: int
+    failed: int
+    processed: int
+    rate_per_s: float
+    started_at: datetime
+    finished_at: datetime | None
+    error: str | None
+
+    @classmethod
+    def from_job(cls, job: ReplayJob) -> "ReplayJobSchema":
+        return cls(
+            id=job.id,
+            state=job.state,
+            filter=job.filter,
+            concurrency=job.concurrency,
+            replayed=job.progress.replayed,
+            failed=job.progress.failed,
+            processed=job.processed,
+            rate_per_s=round(job.rate_per_s, 2),
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error,
+        )
+
+
+def _default_range(published_from: datetime | None, published_until: datetime | None) -> tuple[datetime, datetime]:
+    published_until = published_until or datetime.now(timezone.utc)
+    return published_from or published_until - timedelta(hours=24), published_until
+
+
+# The endpoints hand their dataclasses straight to orjson: a page is up to 500
+# rows, and validating each one against the response model would cost more
+# than the query.
+
+
+@events_router.get("/", response_model=EventPageSchema)
+@inject
+async def list_events(
+    query: FromDishka[ListEventsQuery],
+    message_id: str | None = Query(default=None),
+    topic: str | None = Query(default=None),
+    status: EventStatus | None = Query(default=None),
+    event_type: str | None = Query(default=None),
+    published_from: datetime | None = Query(default=None),
+    published_until: datetime | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+    after_id: int | None = Query(default=None, ge=0),
+) -> ORJSONResponse:
+    events = await query(
+        limit,
+        after_id,
+        message_id=message_id,
+        topic=topic,
+        status=status,
+        event_type=event_type,
+        published_from=published_from,
+        published_until=published_until,
+    )
+    items = [EventSchema.from_entity(event) for event in events]
+    return ORJSONResponse(
+        EventPageSchema(
+            items=items,
+            next_after_id=items[-1].id if len(items) == limit else None,
+        )
+    )
+
+
+@events_router.get("/counts", response_model=EventCountsSchema)
+@inject
+async def count_events(
+    query: FromDishka[CountEventsQuery],
+    bucket: TimeBucket = Query(default=TimeBucket.HOUR),
+    published_from: datetime | None = Query(default=None, description="Defaults to 24 hours before the end."),
+    published_until: datetime | None = Query(default=None, description="Defaults to now."),
+    topic: str | None = Query(default=None),
+) -> ORJSONResponse:
+    """Event counts per time bucket, topic and status; buckets with no events are left out."""
+    published_from, published_until = _default_range(published_from, published_until)
+    counts = await query(bucket, published_from, published_until, topic)
+    return ORJSONResponse(
+        EventCountsSchema(
+            bucket=bucket,
+            published_from=published_from,
+            published_until=published_until,
+            items=list(counts),
+        )
+    )
+
+
+@events_router.get("/delivery-stats", response_model=DeliveryStatsSchema)
+@inject
+async def delivery_stats(
+    query: FromDishka[DeliveryStatsQuery],
+    bucket: TimeBucket = Query(default=TimeBucket.HOUR),
+    published_from: datetime | None = Query(default=None, description="Defaults to 24 hours before the end."),
+    published_until: datetime | None = Query(default=None, description="Defaults to now."),
+    topic: str | None = Query(default=None),
+    event_type: str | None = Query(default=None),
+) -> ORJSONResponse:
+    """
+    Handler-run outcomes per time bucket, topic, event type and status, from
+    the maintained rollup; for dashboards. Minute buckets older than
+    `STATS_COMPACT_AFTER_DAYS` have been folded into hours.
+    """
+    published_from, published_until = _default_range(published_from, published_until)
+    counts = await query(bucket, published_from, published_until, topic, event_type)
+    return ORJSONResponse(
+        DeliveryStatsSchema(
+            bucket=bucket,
+            published_from=published_from,
+            published_until=published_until,
+            items=list(counts),
+        )
+    )
+
+
+@events_router.post("/replay", status_code=status.HTTP_202_ACCEPTED, response_model=ReplayJobSchema)
+@inject
+async def start_replay(body: ReplayJobRequestSchema, jobs: FromDishka[ReplayJobs]) -> ORJSONResponse:
+    """
+    Starts redriving the matching events with a stored payload through their
+    handlers, in the background; poll the returned job for progress. Only one
+    replay runs at a time per pod, and only that pod knows the job.
+    """
+    job = jobs.start(
+        ReplayFilter(
+            status=EventStatus(body.status),
+            topic=body.topic,
+            event_type=body.event_type,
+            published_from=body.published_from,
+            published_until=body.published_until,
+            limit=body.limit,
+        ),
+        concurrency=body.concurrency,
+    )
+    return ORJSONResponse(ReplayJobSchema.from_job(job), status_code=status.HTTP_202_ACCEPTED)
+
+
+@events_router.get("/replay/{job_id}", response_model=ReplayJobSchema)
+@inject
+async def get_replay(job_id: str, jobs: FromDishka[ReplayJobs]) -> ORJSONResponse:
+    return ORJSONResponse(ReplayJobSchema.from_job(jobs.get(job_id)))
+
+
+@events_router.delete("/replay/{job_id}", response_model=ReplayJobSchema)
+@inject
+async def cancel_replay(job_id: str, jobs: FromDishka[ReplayJobs]) -> ORJSONResponse:
+    """Stops reading more events; the replays already started finish first."""
+    return ORJSONResponse(ReplayJobSchema.from_job(await jobs.cancel(job_id)))
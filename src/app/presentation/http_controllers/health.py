@@ -0,0 +1,31 @@
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
+
+from app.infrastructure.observability.health import HealthProbe, HealthReport
+
+health_router = APIRouter(
+    prefix="/health",
+    tags=["General"],
+)
+
+
+def _respond(report: HealthReport) -> ORJSONResponse:
+    return ORJSONResponse(
+        status_code=status.HTTP_200_OK if report.ok else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=report,
+    )
+
+
+@health_router.get("/live")
+@inject
+async def liveness(probe: FromDishka[HealthProbe]) -> ORJSONResponse:
+    """Fails when the pod cannot recover by itself and should be restarted."""
+    return _respond(probe.liveness())
+
+
+@health_router.get("/ready")
+@inject
+async def readiness(probe: FromDishka[HealthProbe]) -> ORJSONResponse:
+    """Fails while the pod cannot keep up and should not be sent more work."""
+    return _respond(probe.readiness())
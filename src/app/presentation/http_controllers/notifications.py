@@ -0,0 +1,191 @@
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import orjson
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.application.common.exceptions.email import EmailDeliveryError
+from app.application.common.ports.event_publisher import EventPublisher, OutgoingMessage
+from app.application.common.services.priority_slots import priority_scope
+from app.application.events.event_dispatcher import EventDispatcher
+from app.domain.entities.pub_sub.entity import PubSubMessage, StoredMessage
+from app.domain.entities.pub_sub.value_objects import EventStatus, Priority
+from app.presentation.common.exception_handler import ExceptionSchema
+from app.presentation.common.fastapi_dependencies import Role, require_role
+from app.presentation.common.json_stream import JsonArraySplitter, JsonStreamError, NdjsonSplitter, split_json_stream
+from app.setup.config.settings import PrioritySettings, PubSubSettings
+
+notifications_router = APIRouter(
+    tags=["Notifications"],
+)
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+MAX_REPORTED_ERRORS = 100
+# The topic events sent through the synchronous endpoint are recorded under; they never touch the broker.
+DIRECT_TOPIC = "direct"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchItemErrorSchema:
+    index: int
+    error: str
+
+
+@dataclass(slots=True)
+class BatchPublishSchema:
+    received: int = 0
+    published: int = 0
+    rejected: int = 0
+    failed: int = 0
+    # The first MAX_REPORTED_ERRORS rejected items.
+    errors: list[BatchItemErrorSchema] = field(default_factory=list)
+    # Why the body stopped being read before its end, if it did.
+    aborted: str | None = None
+
+    def reject(self, index: int, error: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(BatchItemErrorSchema(index, error))
+
+
+def _to_message(item: object, dispatcher: EventDispatcher) -> OutgoingMessage:
+    if not isinstance(item, dict):
+        raise TypeError("Item must be an object")
+    event_type, data, ordering_key = item.get("event_type"), item.get("data"), item.get("ordering_key", "")
+    if not isinstance(event_type, str) or not isinstance(data, dict) or not isinstance(ordering_key, str):
+        raise TypeError("Item needs a string event_type, an object data and an optional string ordering_key")
+    dispatcher.decode(event_type, data)
+    return OutgoingMessage(orjson.dumps(data), ordering_key, {"event_type": event_type})
+
+
+@notifications_router.post(
+    "/notifications:batch",
+    response_model=BatchPublishSchema,
+    dependencies=[Depends(require_role(Role.PUBLISHER))],
+)
+@inject
+async def publish_batch(
+    request: Request,
+    publisher: FromDishka[EventPublisher],
+    dispatcher: FromDishka[EventDispatcher],
+    settings: FromDishka[PubSubSettings],
+    topic: str = Query(default="daily-digest"),
+) -> ORJSONResponse:
+    """
+    Publishes a batch of events, sent as NDJSON (`application/x-ndjson`) or as
+    a JSON array (`application/json`) of `{"event_type", "data",
+    "ordering_key"?}` objects. The body is read as it arrives and each item is
+    published as soon as it is decoded, the same way its handler will decode
+    it, so the batch is never held in memory whole. Items that fail to decode
+    are reported by position and skipped; a body that cannot be split into
+    items stops the batch there, with a 400, after publishing what came before.
+    `topic` must be one of INGEST_TOPICS.
+    """
+    if topic not in settings.ingest_topics:
+        return ORJSONResponse(
+            ExceptionSchema(f"Topic {topic!r} is not open to ingestion."),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        splitter: NdjsonSplitter | JsonArraySplitter = NdjsonSplitter(settings.ingest_max_item_bytes)
+    elif content_type == "application/json":
+        splitter = JsonArraySplitter(settings.ingest_max_item_bytes)
+    else:
+        return ORJSONResponse(
+            {"description": "Send NDJSON (application/x-ndjson) or a JSON array (application/json)."},
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
+
+    report = BatchPublishSchema()
+
+    async def messages() -> AsyncIterator[OutgoingMessage]:
+        try:
+            async for raw in split_json_stream(request.stream(), splitter):
+                index = report.received
+                report.received += 1
+                try:
+                    message = _to_message(orjson.loads(raw), dispatcher)
+                except (TypeError, ValueError) as e:
+                    report.reject(index, str(e))
+                    continue
+                yield message
+        except JsonStreamError as e:
+            report.aborted = f"{e} after item {report.received}"
+
+    result = await publisher.publish_many(topic, messages())
+    report.published, report.failed = result.published, result.failed
+    return ORJSONResponse(
+        report,
+        status_code=status.HTTP_400_BAD_REQUEST if report.aborted else status.HTTP_200_OK,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SendRequestSchema:
+    event_type: str
+    data: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class SendResultSchema:
+    message_id: str
+    status: EventStatus
+
+
+@notifications_router.post(
+    "/notifications:send",
+    response_model=SendResultSchema,
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": ExceptionSchema},
+        status.HTTP_502_BAD_GATEWAY: {"model": SendResultSchema},
+    },
+    dependencies=[Depends(require_role(Role.PUBLISHER))],
+)
+@inject
+async def send_now(
+    body: SendRequestSchema,
+    dispatcher: FromDishka[EventDispatcher],
+    priority: FromDishka[PrioritySettings],
+) -> ORJSONResponse:
+    """
+    Sends an urgent notification (a password reset) inline, without going
+    through the broker, so it never waits behind the digest backlog in the
+    subscription. Its handler runs as urgent: it may use the mail slots and
+    database sessions reserved for urgent work (EMAIL_RESERVED, DB_RESERVED),
+    which bulk work never gets. The event is recorded under the `direct` topic
+    like any other; a send the mail provider failed comes back as a 502 with
+    a FAILED event, which the retry worker takes over. Only the event types
+    in URGENT_EVENT_TYPES are taken.
+    """
+    if body.event_type not in priority.urgent_event_types:
+        return ORJSONResponse(
+            ExceptionSchema(f"Event type {body.event_type!r} is not urgent; publish it instead."),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    try:
+        dispatcher.decode(body.event_type, body.data)
+    except TypeError as e:
+        return ORJSONResponse(ExceptionSchema(str(e)), status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    stored = StoredMessage(
+        message_id=uuid.uuid4().hex,
+        data=orjson.dumps(body.data),
+        attributes={"event_type": body.event_type, "priority": Priority.URGENT.value},
+        publish_time=datetime.now(timezone.utc),
+    )
+    message = PubSubMessage.from_stored(stored, DIRECT_TOPIC)
+    # Set before the handler and its session are resolved, so the session comes from the reserved share too.
+    with priority_scope(Priority.URGENT):
+        try:
+            await dispatcher.dispatch(message)
+        except EmailDeliveryError:
+            return ORJSONResponse(
+                SendResultSchema(stored.message_id, EventStatus.FAILED), status_code=status.HTTP_502_BAD_GATEWAY
+            )
+    return ORJSONResponse(SendResultSchema(stored.message_id, EventStatus.PROCESSED))
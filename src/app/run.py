@@ -8,6 +8,7 @@ from app.presentation.common.http_api_routers.root import root_router
 from app.setup.app_factory import configure_app, create_app, create_async_ioc_container
 from app.setup.config.logs import configure_logging
 from app.setup.config.settings import AppSettings, load_settings
+from app.setup.config.tracing import configure_tracing
 from app.setup.ioc.registry import get_providers
 
 log = logging.getLogger(__name__)
@@ -21,6 +22,7 @@ def make_app(
         settings = load_settings()
 
     configure_logging(level=settings.logs.level)
+    configure_tracing(settings.tracing)
 
     # Create Dishka container first
     async_ioc_container = create_async_ioc_container(
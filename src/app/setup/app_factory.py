@@ -7,7 +7,6 @@ __all__ = (
 
 import asyncio
 import logging
-import os
 from contextlib import asynccontextmanager
 from typing import Iterable
 
@@ -15,21 +14,17 @@ from dishka import AsyncContainer, Provider, make_async_container
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
-from google.cloud import pubsub_v1
 
 from app.application.common.ports.event_subscriber import EventConsumer
+from app.infrastructure.adapters.database.event_partition_maintainer import EventPartitionMaintainer
+from app.infrastructure.adapters.database.event_retry_worker import EventRetryWorker
+from app.infrastructure.observability.loop_lag import BlockingCallDetector, LoopLagMonitor
 from app.infrastructure.sqla_persistence.mappings.all import map_tables
 from app.presentation.common.asgi_auth_middleware import ASGIAuthMiddleware
 from app.presentation.common.exception_handler import ExceptionHandler
 from app.setup.config.settings import AppSettings
 
 log = logging.getLogger(__name__)
-# Pub/Sub config
-project_id = os.getenv("PUBSUB_PROJECT_ID", "slava")
-topic_id = "daily-digest"
-subscription_id = "daily-digest-sub"
-subscriber: pubsub_v1.SubscriberClient | None = None
-streaming_pull_future = None
 
 
 @asynccontextmanager
@@ -41,16 +36,28 @@ async def lifespan(app: FastAPI):
     event_subscriber = await app.state.dishka_container.get(EventConsumer)
     await event_subscriber.subscribe(loop)
 
+    retry_worker = await app.state.dishka_container.get(EventRetryWorker)
+    retry_worker.start(loop)
+
+    partition_maintainer = await app.state.dishka_container.get(EventPartitionMaintainer)
+    partition_maintainer.start(loop)
+
+    loop_lag_monitor = await app.state.dishka_container.get(LoopLagMonitor)
+    loop_lag_monitor.start(loop)
+
+    blocking_call_detector = await app.state.dishka_container.get(BlockingCallDetector)
+    blocking_call_detector.start(loop)
+
     # Hand control back to FastAPI
     yield
 
     # 👋 Shutdown
+    await retry_worker.stop()
+    await partition_maintainer.stop()
+    await loop_lag_monitor.stop()
+    await blocking_call_detector.stop()
     try:
-        if streaming_pull_future:
-            streaming_pull_future.cancel()
-            log.info("Pub/Sub subscriber stopped")
-        if subscriber:
-            subscriber.close()
+        await event_subscriber.stop()
     except Exception as e:
         log.error("Error during Pub/Sub shutdown: %s", e)
 
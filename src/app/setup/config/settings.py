@@ -4,7 +4,7 @@ from datetime import timedelta
 from typing import Any, Literal, NewType, Self, cast
 
 import rtoml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic import PostgresDsn as PydanticPostgresDsn
 
 from app.setup.config.constants import (
@@ -17,6 +17,7 @@ from app.setup.config.constants import (
 log = logging.getLogger(__name__)
 
 PostgresDsn = NewType("PostgresDsn", str)
+ReplicaDsns = NewType("ReplicaDsns", tuple[PostgresDsn, ...])
 
 
 class PasswordSettings(BaseModel):
@@ -76,6 +77,9 @@ class PostgresSettings(BaseModel):
     host: str = Field(alias="HOST")
     port: int = Field(alias="PORT")
     driver: str = Field(alias="DRIVER")
+    # Streaming replicas of the primary ("host" or "host:port"), same credentials and database. Read-only
+    # paths (admin listings, reporting) are spread over them; none configured means they use the primary.
+    replica_hosts: list[str] = Field(default_factory=list, alias="REPLICA_HOSTS")
 
     @field_validator("host")
     @classmethod
@@ -92,8 +96,16 @@ class PostgresSettings(BaseModel):
             raise ValueError("Port must be between 1 and 65535")
         return v
 
-    @property
-    def dsn(self) -> PostgresDsn:
+    @field_validator("replica_hosts")
+    @classmethod
+    def validate_replica_ports(cls, v: list[str]) -> list[str]:
+        for host in v:
+            _, _, port = host.partition(":")
+            if port and not (port.isdigit() and 1 <= int(port) <= 65535):
+                raise ValueError(f"Replica port must be between 1 and 65535: {host}")
+        return v
+
+    def _build_dsn(self, host: str, port: int) -> PostgresDsn:
         return cast(
             PostgresDsn,
             str(
@@ -101,19 +113,286 @@ class PostgresSettings(BaseModel):
                     scheme=f"postgresql+{self.driver}",
                     username=self.user,
                     password=self.password,
-                    host=self.host,
-                    port=self.port,
+                    host=host,
+                    port=port,
                     path=self.db,
                 )
             ),
         )
 
+    @property
+    def dsn(self) -> PostgresDsn:
+        return self._build_dsn(self.host, self.port)
+
+    @property
+    def replica_dsns(self) -> ReplicaDsns:
+        dsns = []
+        for replica in self.replica_hosts:
+            host, _, port = replica.partition(":")
+            dsns.append(self._build_dsn(host, int(port) if port else self.port))
+        return ReplicaDsns(tuple(dsns))
+
 
 class SqlaEngineSettings(BaseModel):
     echo: bool = Field(alias="ECHO")
     echo_pool: bool = Field(alias="ECHO_POOL")
     pool_size: int = Field(alias="POOL_SIZE")
     max_overflow: int = Field(alias="MAX_OVERFLOW")
+    pool_timeout: float = Field(default=30.0, alias="POOL_TIMEOUT_S")
+    # Connections older than this are replaced on checkout, before a proxy or the server times them out.
+    pool_recycle: int = Field(default=1800, alias="POOL_RECYCLE_S")
+    pool_pre_ping: bool = Field(default=True, alias="POOL_PRE_PING")
+    # LIFO keeps the hot connections busy and lets the idle tail be recycled away when load drops.
+    pool_use_lifo: bool = Field(default=True, alias="POOL_USE_LIFO")
+    # Compiled-SQL cache entries per engine; the repositories' hot statements are built once and hit it every time.
+    query_cache_size: int = Field(default=500, alias="QUERY_CACHE_SIZE")
+    # psycopg prepares a statement server-side once a connection has run it this many times (0: on first use).
+    # Not an engine argument: it is handed to the driver through `connect_args`.
+    prepare_threshold: int = Field(default=5, alias="PREPARE_THRESHOLD", exclude=True)
+    # Server-side settings of every connection, also handed over through `connect_args` (0: no timeout).
+    statement_timeout_ms: int = Field(default=0, alias="STATEMENT_TIMEOUT_MS", exclude=True)
+    application_name: str = Field(default="notification-service", alias="APPLICATION_NAME", exclude=True)
+    # "transaction" when connecting through a transaction-mode pooler (PgBouncer), where consecutive
+    # transactions of one client connection may run on different server sessions: no prepared statements
+    # and no session-level settings. "session" for direct connections and session-mode pooling.
+    pooler_mode: Literal["session", "transaction"] = Field(default="session", alias="POOLER_MODE", exclude=True)
+
+    @field_validator("query_cache_size", "prepare_threshold", "statement_timeout_ms", "pool_recycle")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("SQLAlchemy engine counts and durations must not be negative.")
+        return v
+
+    @field_validator("pool_timeout")
+    @classmethod
+    def validate_pool_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("POOL_TIMEOUT_S must be positive (n of seconds, n > 0).")
+        return v
+
+    @property
+    def transaction_pooling(self) -> bool:
+        return self.pooler_mode == "transaction"
+
+    def connect_args(self) -> dict[str, Any]:
+        if self.transaction_pooling:
+            # PgBouncer rejects the `options` startup parameter; the statement timeout is set per transaction instead.
+            return {"prepare_threshold": None, "application_name": self.application_name}
+        args: dict[str, Any] = {"prepare_threshold": self.prepare_threshold, "application_name": self.application_name}
+        if self.statement_timeout_ms:
+            args["options"] = f"-c statement_timeout={self.statement_timeout_ms}"
+        return args
+
+
+class PubSubSettings(BaseModel):
+    backoff_initial_s: float = Field(default=1.0, alias="BACKOFF_INITIAL_S")
+    backoff_max_s: float = Field(default=60.0, alias="BACKOFF_MAX_S")
+    backoff_multiplier: float = Field(default=2.0, alias="BACKOFF_MULTIPLIER")
+    max_restarts: int = Field(default=10, alias="MAX_RESTARTS")
+    restart_window_s: float = Field(default=600.0, alias="RESTART_WINDOW_S")
+    stable_after_s: float = Field(default=60.0, alias="STABLE_AFTER_S")
+    ack_deadline_s: int = Field(default=60, alias="ACK_DEADLINE_S")
+    lease_check_interval_s: float = Field(default=5.0, alias="LEASE_CHECK_INTERVAL_S")
+    max_lease_extension_s: int = Field(default=600, alias="MAX_LEASE_EXTENSION_S")
+    enable_message_ordering: bool = Field(default=False, alias="ENABLE_MESSAGE_ORDERING")
+    worker_pool_size: int = Field(default=64, alias="WORKER_POOL_SIZE")
+    max_delivery_attempts: int = Field(default=5, alias="MAX_DELIVERY_ATTEMPTS")
+    dead_letter_flush_interval_s: float = Field(default=1.0, alias="DEAD_LETTER_FLUSH_INTERVAL_S")
+    dead_letter_batch_size: int = Field(default=500, alias="DEAD_LETTER_BATCH_SIZE")
+    replay_concurrency: int = Field(default=8, alias="REPLAY_CONCURRENCY")
+    # Bulk replay reads this many events per short query, then dispatches them with no transaction open.
+    replay_page_size: int = Field(default=500, alias="REPLAY_PAGE_SIZE")
+    # Every handled message waits up to one interval for its status to be flushed before it is acked.
+    batch_finalise: bool = Field(default=True, alias="BATCH_FINALISE")
+    finalise_flush_interval_s: float = Field(default=0.05, alias="FINALISE_FLUSH_INTERVAL_S")
+    finalise_batch_size: int = Field(default=500, alias="FINALISE_BATCH_SIZE")
+    # Batch ingestion: messages handed to the publisher and not yet confirmed, and the largest accepted item.
+    publish_max_in_flight: int = Field(default=1000, alias="PUBLISH_MAX_IN_FLIGHT")
+    ingest_max_item_bytes: int = Field(default=1_048_576, alias="INGEST_MAX_ITEM_BYTES")
+    # The topics the batch ingestion endpoint may publish to.
+    ingest_topics: list[str] = Field(default_factory=lambda: ["daily-digest"], alias="INGEST_TOPICS")
+
+    @field_validator(
+        "backoff_initial_s",
+        "backoff_max_s",
+        "restart_window_s",
+        "stable_after_s",
+        "lease_check_interval_s",
+        "max_lease_extension_s",
+        "dead_letter_flush_interval_s",
+        "finalise_flush_interval_s",
+    )
+    @classmethod
+    def validate_positive_duration(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Pub/Sub durations must be positive (n of seconds, n > 0).")
+        return v
+
+    @field_validator("ack_deadline_s")
+    @classmethod
+    def validate_ack_deadline(cls, v: int) -> int:
+        if not 10 <= v <= 600:
+            raise ValueError("ACK_DEADLINE_S must be between 10 and 600 (Pub/Sub limits).")
+        return v
+
+    @field_validator("backoff_multiplier")
+    @classmethod
+    def validate_backoff_multiplier(cls, v: float) -> float:
+        if v < 1:
+            raise ValueError("BACKOFF_MULTIPLIER must be at least 1.")
+        return v
+
+    @field_validator(
+        "max_restarts",
+        "worker_pool_size",
+        "max_delivery_attempts",
+        "dead_letter_batch_size",
+        "replay_concurrency",
+        "replay_page_size",
+        "finalise_batch_size",
+        "publish_max_in_flight",
+        "ingest_max_item_bytes",
+    )
+    @classmethod
+    def validate_at_least_one(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("Pub/Sub counts and sizes must be at least 1.")
+        return v
+
+
+class RetrySettings(BaseModel):
+    enabled: bool = Field(default=True, alias="ENABLED")
+    initial_delay_s: float = Field(default=30.0, alias="INITIAL_DELAY_S")
+    max_delay_s: float = Field(default=3600.0, alias="MAX_DELAY_S")
+    multiplier: float = Field(default=2.0, alias="MULTIPLIER")
+    poll_interval_s: float = Field(default=5.0, alias="POLL_INTERVAL_S")
+    batch_size: int = Field(default=50, alias="BATCH_SIZE")
+    lease_s: float = Field(default=300.0, alias="LEASE_S")
+    # Longer than the broker lease can be extended for, so a live handler is never reaped.
+    stale_processing_s: float = Field(default=900.0, alias="STALE_PROCESSING_S")
+
+    @field_validator("initial_delay_s", "max_delay_s", "poll_interval_s", "lease_s", "stale_processing_s")
+    @classmethod
+    def validate_positive_duration(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Retry durations must be positive (n of seconds, n > 0).")
+        return v
+
+    @field_validator("multiplier")
+    @classmethod
+    def validate_multiplier(cls, v: float) -> float:
+        if v < 1:
+            raise ValueError("MULTIPLIER must be at least 1.")
+        return v
+
+    @field_validator("batch_size")
+    @classmethod
+    def validate_batch_size(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("BATCH_SIZE must be at least 1.")
+        return v
+
+
+class EventStoreSettings(BaseModel):
+    store_payloads: bool = Field(default=True, alias="STORE_PAYLOADS")
+
+
+class PartitionSettings(BaseModel):
+    enabled: bool = Field(default=True, alias="ENABLED")
+    interval: Literal["day", "week"] = Field(default="week", alias="INTERVAL")
+    premake: int = Field(default=4, alias="PREMAKE")
+    retention_days: int = Field(default=90, alias="RETENTION_DAYS")
+    expire_mode: Literal["drop", "detach"] = Field(default="detach", alias="EXPIRE_MODE")
+    check_interval_s: float = Field(default=3600.0, alias="CHECK_INTERVAL_S")
+    # Minute buckets of the event_stats rollup are folded into hours once older than this.
+    stats_compact_after_days: int = Field(default=7, alias="STATS_COMPACT_AFTER_DAYS")
+
+    @field_validator("premake", "retention_days", "stats_compact_after_days")
+    @classmethod
+    def validate_at_least_one(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("PREMAKE, RETENTION_DAYS and STATS_COMPACT_AFTER_DAYS must be at least 1.")
+        return v
+
+    @field_validator("check_interval_s")
+    @classmethod
+    def validate_positive_duration(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("CHECK_INTERVAL_S must be positive (n of seconds, n > 0).")
+        return v
+
+
+class PrioritySettings(BaseModel):
+    # Gmail sends in flight at once, and how many of them only urgent notifications may use.
+    email_concurrency: int = Field(default=16, alias="EMAIL_CONCURRENCY")
+    email_reserved: int = Field(default=4, alias="EMAIL_RESERVED")
+    # Handler database sessions, out of POOL_SIZE + MAX_OVERFLOW, only urgent notifications may use.
+    # Background writers and admin reads take connections outside this count.
+    db_reserved: int = Field(default=5, alias="DB_RESERVED")
+    # The event types the synchronous send endpoint takes; everything else goes through the broker.
+    urgent_event_types: list[str] = Field(default_factory=list, alias="URGENT_EVENT_TYPES")
+
+    @field_validator("email_concurrency")
+    @classmethod
+    def validate_at_least_one(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("EMAIL_CONCURRENCY must be at least 1.")
+        return v
+
+    @field_validator("email_reserved", "db_reserved")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Reserved slots must not be negative.")
+        return v
+
+    @model_validator(mode="after")
+    def validate_email_reserved(self) -> Self:
+        if self.email_reserved >= self.email_concurrency:
+            raise ValueError("EMAIL_RESERVED must be lower than EMAIL_CONCURRENCY, or bulk mail never goes out.")
+        return self
+
+
+class HealthSettings(BaseModel):
+    loop_lag_interval_s: float = Field(default=0.5, alias="LOOP_LAG_INTERVAL_S")
+    # A loop stalled for longer is logged; with BLOCKING_DETECTOR on, with the stack of the blocking call.
+    blocking_threshold_s: float = Field(default=0.1, alias="BLOCKING_THRESHOLD_S")
+    blocking_detector: bool = Field(default=False, alias="BLOCKING_DETECTOR")
+    # Beyond these the pod stops taking traffic...
+    ready_max_loop_lag_s: float = Field(default=0.25, alias="READY_MAX_LOOP_LAG_S")
+    ready_max_pool_saturation: float = Field(default=0.9, alias="READY_MAX_POOL_SATURATION")
+    ready_max_backlog: int = Field(default=1000, alias="READY_MAX_BACKLOG")
+    # ...and beyond this one it is restarted.
+    live_max_loop_lag_s: float = Field(default=5.0, alias="LIVE_MAX_LOOP_LAG_S")
+
+    @field_validator("loop_lag_interval_s", "blocking_threshold_s", "ready_max_loop_lag_s", "live_max_loop_lag_s")
+    @classmethod
+    def validate_positive_duration(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Durations must be positive (n of seconds, n > 0).")
+        return v
+
+    @field_validator("ready_max_pool_saturation")
+    @classmethod
+    def validate_saturation(cls, v: float) -> float:
+        if not 0 < v <= 1:
+            raise ValueError("READY_MAX_POOL_SATURATION must be in (0, 1].")
+        return v
+
+
+class TracingSettings(BaseModel):
+    enabled: bool = Field(default=False, alias="ENABLED")
+    # Share of messages whose trace is recorded; the rest only pay for a sampling decision.
+    sample_ratio: float = Field(default=0.01, alias="SAMPLE_RATIO")
+    service_name: str = Field(default="notification-service", alias="SERVICE_NAME")
+
+    @field_validator("sample_ratio")
+    @classmethod
+    def validate_ratio(cls, v: float) -> float:
+        if not 0 <= v <= 1:
+            raise ValueError("SAMPLE_RATIO must be between 0 and 1.")
+        return v
 
 
 class LoggingSettings(BaseModel):
@@ -129,9 +408,24 @@ class LoggingSettings(BaseModel):
 class AppSettings(BaseModel):
     postgres: PostgresSettings
     sqla: SqlaEngineSettings
+    pubsub: PubSubSettings = Field(default_factory=PubSubSettings)
+    retry: RetrySettings = Field(default_factory=RetrySettings)
+    events: EventStoreSettings = Field(default_factory=EventStoreSettings)
+    partitions: PartitionSettings = Field(default_factory=PartitionSettings)
+    priority: PrioritySettings = Field(default_factory=PrioritySettings)
+    health: HealthSettings = Field(default_factory=HealthSettings)
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
     security: SecuritySettings
     logs: LoggingSettings
 
+    @model_validator(mode="after")
+    def validate_db_reserved(self) -> Self:
+        if self.priority.db_reserved >= self.sqla.pool_size + self.sqla.max_overflow:
+            raise ValueError(
+                "DB_RESERVED must be lower than POOL_SIZE + MAX_OVERFLOW, or bulk work never gets a session."
+            )
+        return self
+
     @classmethod
     def from_toml(cls, env: ValidEnvs | None = None) -> Self:
         if env is None:
@@ -0,0 +1,37 @@
+import logging
+
+from app.infrastructure.observability.tracing import use_tracer
+from app.setup.config.settings import TracingSettings
+
+log = logging.getLogger(__name__)
+
+
+def configure_tracing(settings: TracingSettings) -> None:
+    """
+    Installs an OpenTelemetry tracer sampling `SAMPLE_RATIO` of the messages.
+    Spans are exported over OTLP, configured by the standard `OTEL_EXPORTER_OTLP_*`
+    environment variables.
+    """
+    if not settings.enabled:
+        return
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        log.warning("Tracing is enabled but OpenTelemetry is not installed (pip install .[tracing])")
+        return
+
+    try:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    except ImportError:
+        log.warning("Tracing is enabled but no OTLP exporter is installed (pip install .[tracing])")
+        return
+
+    # Sampled at the root span by `use_tracer`, so the SDK keeps its default of recording everything.
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.service_name}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    use_tracer(provider.get_tracer("app"), settings.sample_ratio)
+    log.info("Tracing %.2f%% of messages", settings.sample_ratio * 100)
@@ -1,17 +1,39 @@
 # pylint: disable=C0301 (line-too-long)
+from collections.abc import AsyncIterator
+
 from dishka import AsyncContainer, Provider, Scope, provide, provide_all
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.application.commands.game_digest import GameDigestInteractor
+from app.application.commands.replay_dead_letters import ReplayDeadLettersInteractor
 
 # from app.application.common.ports.identity_provider import IdentityProvider
 from app.application.common.ports.email_sender import EmailSender
+from app.application.common.ports.event_finaliser import EventFinaliser
+from app.application.common.ports.event_metrics import EventMetrics
 from app.application.common.ports.event_publisher import EventPublisher
+from app.application.common.ports.event_replayer import EventReplayer
 from app.application.common.ports.event_subscriber import EventConsumer
+from app.application.common.services.inline_event_finaliser import INLINE_EVENT_FINALISER
+from app.application.common.services.payload_storage_policy import PayloadStoragePolicy
+from app.application.common.services.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
 from app.application.events.event_dispatcher import EventDispatcher
+from app.application.queries.dead_letters import ListDeadLettersQuery
+from app.application.queries.events import CountEventsQuery, DeliveryStatsQuery, ListEventsQuery
 from app.config import Config
+from app.infrastructure.adapters.application.new_types import EmailSendSlots
+from app.infrastructure.adapters.database.batch_event_finaliser import BatchEventFinaliser
+from app.infrastructure.adapters.database.bulk_event_replayer import BulkEventReplayer
+from app.infrastructure.adapters.database.event_retry_worker import EventRetryWorker
+from app.infrastructure.adapters.database.replay_jobs import ReplayJobs
+from app.infrastructure.adapters.email.priority_email_sender import PriorityEmailSender
 from app.infrastructure.adapters.email.smtp_email_sender import SmtpEmailSender
+from app.infrastructure.adapters.pub_sub.container_event_replayer import ContainerEventReplayer
 from app.infrastructure.adapters.pub_sub.pub_sub_event_consumer import PubSubEventConsumer
 from app.infrastructure.adapters.pub_sub.pub_sub_event_producer import PubSubEventProducer
+from app.infrastructure.observability.health import HealthProbe
+from app.infrastructure.observability.pipeline_metrics import PipelineEventMetrics
+from app.setup.config.settings import EventStoreSettings, PubSubSettings, RetrySettings
 
 
 def build_dispatcher(container: AsyncContainer) -> EventDispatcher:
@@ -37,8 +59,55 @@ class CommonApplicationProvider(Provider):
         provides=EventConsumer,
     )
 
+    event_replayer = provide(
+        source=ContainerEventReplayer,
+        provides=EventReplayer,
+    )
+
     configuration = provide(source=build_config, provides=Config)
 
+    event_metrics = provide(
+        source=PipelineEventMetrics,
+        provides=EventMetrics,
+    )
+
+    health_probe = provide(source=HealthProbe)
+
+    retry_worker = provide(source=EventRetryWorker)
+    bulk_event_replayer = provide(source=BulkEventReplayer)
+
+    @provide
+    async def provide_replay_jobs(self, replayer: BulkEventReplayer) -> AsyncIterator[ReplayJobs]:
+        jobs = ReplayJobs(replayer)
+        yield jobs
+        await jobs.stop()
+
+    @provide
+    def provide_retry_policy(self, retry: RetrySettings, pubsub: PubSubSettings) -> RetryPolicy:
+        return RetryPolicy(
+            max_attempts=pubsub.max_delivery_attempts,
+            initial_delay_s=retry.initial_delay_s,
+            max_delay_s=retry.max_delay_s,
+            multiplier=retry.multiplier,
+            retry_on=DEFAULT_RETRY_POLICY.retry_on if retry.enabled else (),
+        )
+
+    @provide
+    def provide_payload_storage_policy(self, events: EventStoreSettings) -> PayloadStoragePolicy:
+        return PayloadStoragePolicy(store_on_claim=events.store_payloads)
+
+    @provide
+    async def provide_event_finaliser(
+        self, session_maker: async_sessionmaker[AsyncSession], pubsub: PubSubSettings
+    ) -> AsyncIterator[EventFinaliser]:
+        if not pubsub.batch_finalise:
+            yield INLINE_EVENT_FINALISER
+            return
+        finaliser = BatchEventFinaliser(session_maker, pubsub)
+        yield finaliser
+        # Outcomes still buffered belong to messages that have not been acked yet.
+        await finaliser.stop()
+
 
 class UserApplicationProvider(Provider):
     scope = Scope.REQUEST
@@ -46,7 +115,10 @@ class UserApplicationProvider(Provider):
         source=build_dispatcher,
         provides=EventDispatcher,
     )
-    smtp_sender = provide(source=SmtpEmailSender, provides=EmailSender)
+
+    @provide
+    def provide_email_sender(self, config: Config, slots: EmailSendSlots) -> EmailSender:
+        return PriorityEmailSender(SmtpEmailSender(config), slots)
 
     # Services
     # Ports
@@ -54,4 +126,9 @@ class UserApplicationProvider(Provider):
     # Interactors
     interactors = provide_all(
         GameDigestInteractor,
+        ReplayDeadLettersInteractor,
+        ListDeadLettersQuery,
+        ListEventsQuery,
+        CountEventsQuery,
+        DeliveryStatsQuery,
     )
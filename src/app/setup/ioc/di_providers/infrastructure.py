@@ -2,19 +2,33 @@
 import logging
 from typing import AsyncIterable, cast
 
-from dishka import Provider, Scope, provide, provide_all
+from dishka import Provider, Scope, alias, provide, provide_all
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
 
 from app.application.commands.game_digest import GameDigestInteractor
-from app.application.common.ports.unit_of_work import UnitOfWork
+from app.application.common.ports.connection_pool import PoolMonitor
+from app.application.common.ports.unit_of_work import ReadOnlyUnitOfWork, UnitOfWork
+from app.application.common.services.priority_slots import PrioritySlots
+from app.infrastructure.adapters.application.new_types import EmailSendSlots, ReplicaAsyncSession, SessionSlots
+from app.infrastructure.adapters.database.dead_letter_writer import DeadLetterWriter
+from app.infrastructure.adapters.database.event_partition_maintainer import EventPartitionMaintainer
+from app.infrastructure.adapters.database.pool_metrics import PoolMetrics
+from app.infrastructure.adapters.database.read_replica_router import ReadReplicaRouter
 from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
-from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
-from app.setup.config.settings import PostgresDsn, SqlaEngineSettings
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import (
+    SqlAlchemyReadOnlyUnitOfWork,
+    SqlAlchemyUnitOfWork,
+)
+from app.infrastructure.observability.loop_lag import BlockingCallDetector, LoopLagMonitor
+from app.infrastructure.sqla_persistence.engine import build_async_engine
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
+from app.setup.config.settings import AuthSettings, PostgresDsn, PrioritySettings, ReplicaDsns, SqlaEngineSettings
 
 log = logging.getLogger(__name__)
 
@@ -27,18 +41,29 @@ class CommonInfrastructureProvider(Provider):
         self,
         dsn: PostgresDsn,
         engine_settings: SqlaEngineSettings,
+        pool_metrics: PoolMetrics,
     ) -> AsyncIterable[AsyncEngine]:
-        async_engine_params = {
-            "url": dsn,
-            **engine_settings.model_dump(),
-        }
-        async_engine = create_async_engine(**async_engine_params)
+        async_engine = build_async_engine(dsn, engine_settings, pool_metrics)
         log.debug("Async engine created with DSN: %s", dsn)
         yield async_engine
         log.debug("Disposing async engine...")
         await async_engine.dispose()
         log.debug("Engine is disposed.")
 
+    @provide
+    async def provide_read_replica_router(
+        self,
+        engine: AsyncEngine,
+        replica_dsns: ReplicaDsns,
+        engine_settings: SqlaEngineSettings,
+    ) -> AsyncIterable[ReadReplicaRouter]:
+        # Replica pools are not exported: the pool monitor watches the primary, where the consumer runs.
+        replicas = [build_async_engine(dsn, engine_settings, PoolMetrics()) for dsn in replica_dsns]
+        log.debug("Read replica router created with %d replica(s).", len(replicas))
+        yield ReadReplicaRouter(replicas or [engine])
+        for replica in replicas:
+            await replica.dispose()
+
     @provide
     def provide_async_session_maker(
         self,
@@ -53,6 +78,31 @@ class CommonInfrastructureProvider(Provider):
         log.debug("Async session maker initialized.")
         return session_factory
 
+    @provide
+    def provide_session_slots(self, engine_settings: SqlaEngineSettings, priority: PrioritySettings) -> SessionSlots:
+        # One slot per connection the pool will open. Only request-scoped sessions (handlers, the send
+        # endpoint) take one: the batch writers, the retry worker, the partition maintainer and reads falling
+        # back from replicas use the pool directly (the finaliser must, as handlers holding a slot wait on its
+        # flushes). DB_RESERVED thus stops urgent handlers queueing behind bulk ones, but the pool needs
+        # headroom for that background work on top.
+        capacity = engine_settings.pool_size + engine_settings.max_overflow
+        return SessionSlots(PrioritySlots(capacity, priority.db_reserved))
+
+    @provide
+    def provide_email_send_slots(self, priority: PrioritySettings) -> EmailSendSlots:
+        return EmailSendSlots(PrioritySlots(priority.email_concurrency, priority.email_reserved))
+
+    @provide
+    def provide_access_token_processor(self, auth: AuthSettings) -> JwtAccessTokenProcessor:
+        return JwtAccessTokenProcessor(auth.jwt_secret, auth.jwt_algorithm)
+
+    pool_metrics = provide(source=PoolMetrics)
+    pool_monitor = alias(source=PoolMetrics, provides=PoolMonitor)
+    dead_letter_writer = provide(source=DeadLetterWriter)
+    event_partition_maintainer = provide(source=EventPartitionMaintainer)
+    loop_lag_monitor = provide(source=LoopLagMonitor)
+    blocking_call_detector = provide(source=BlockingCallDetector)
+
 
 class UserInfrastructureProvider(Provider):
     scope = Scope.REQUEST
@@ -61,18 +111,29 @@ class UserInfrastructureProvider(Provider):
     async def provide_user_async_session(
         self,
         async_session_maker: async_sessionmaker[AsyncSession],
+        slots: SessionSlots,
     ) -> AsyncIterable[AsyncSession]:
         log.debug("Starting User async session...")
-        async with async_session_maker() as session:
+        # Held for the session's lifetime, at the priority of the notification being handled.
+        async with slots.acquire(), async_session_maker() as session:
             log.debug("Async session started for User.")
             yield cast(AsyncSession, session)
             log.debug("Closing async session.")
         log.debug("Async session closed for User.")
 
+    @provide
+    async def provide_replica_async_session(self, router: ReadReplicaRouter) -> AsyncIterable[ReplicaAsyncSession]:
+        async with router.session() as session:
+            yield cast(ReplicaAsyncSession, session)
+
     unit_of_work = provide(
         source=SqlAlchemyUnitOfWork,
         provides=UnitOfWork,
     )
+    read_only_unit_of_work = provide(
+        source=SqlAlchemyReadOnlyUnitOfWork,
+        provides=ReadOnlyUnitOfWork,
+    )
     event_repository = provide(
         source=EventRepository,
     )
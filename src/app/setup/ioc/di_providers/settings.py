@@ -1,7 +1,19 @@
 # pylint: disable=C0301 (line-too-long)
 from dishka import Provider, Scope, from_context, provide
 
-from app.setup.config.settings import AppSettings, PostgresDsn, SqlaEngineSettings
+from app.setup.config.settings import (
+    AppSettings,
+    AuthSettings,
+    EventStoreSettings,
+    HealthSettings,
+    PartitionSettings,
+    PostgresDsn,
+    PrioritySettings,
+    PubSubSettings,
+    ReplicaDsns,
+    RetrySettings,
+    SqlaEngineSettings,
+)
 
 
 class CommonSettingsProvider(Provider):
@@ -13,6 +25,38 @@ class CommonSettingsProvider(Provider):
     def provide_postgres_dsn(self, settings: AppSettings) -> PostgresDsn:
         return PostgresDsn(settings.postgres.dsn)
 
+    @provide
+    def provide_replica_dsns(self, settings: AppSettings) -> ReplicaDsns:
+        return settings.postgres.replica_dsns
+
     @provide
     def provide_sqla_engine_settings(self, settings: AppSettings) -> SqlaEngineSettings:
         return settings.sqla
+
+    @provide
+    def provide_pubsub_settings(self, settings: AppSettings) -> PubSubSettings:
+        return settings.pubsub
+
+    @provide
+    def provide_retry_settings(self, settings: AppSettings) -> RetrySettings:
+        return settings.retry
+
+    @provide
+    def provide_event_store_settings(self, settings: AppSettings) -> EventStoreSettings:
+        return settings.events
+
+    @provide
+    def provide_partition_settings(self, settings: AppSettings) -> PartitionSettings:
+        return settings.partitions
+
+    @provide
+    def provide_priority_settings(self, settings: AppSettings) -> PrioritySettings:
+        return settings.priority
+
+    @provide
+    def provide_health_settings(self, settings: AppSettings) -> HealthSettings:
+        return settings.health
+
+    @provide
+    def provide_auth_settings(self, settings: AppSettings) -> AuthSettings:
+        return settings.security.auth
@@ -1,7 +1,10 @@
+import concurrent.futures
 import logging
-from collections.abc import AsyncGenerator, Iterable
+from collections.abc import AsyncGenerator, Callable, Iterable
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import jwt
 import pytest
 import pytest_asyncio
 from dishka import AsyncContainer, Provider, Scope, make_async_container, provide, provide_all
@@ -15,19 +18,32 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import class_mapper
 from sqlalchemy.orm.exc import UnmappedClassError
-from src.app.infrastructure.sqla_persistence.mappings.event import mapping_registry
 
 from app.application.commands.game_digest import GameDigestInteractor
 from app.application.common.ports.email_sender import EmailSender
+from app.application.common.ports.event_finaliser import EventFinaliser
+from app.application.common.ports.event_metrics import EventMetrics
 from app.application.common.ports.unit_of_work import UnitOfWork
+from app.application.common.services.inline_event_finaliser import INLINE_EVENT_FINALISER
+from app.application.common.services.null_event_metrics import NULL_EVENT_METRICS
+from app.application.common.services.payload_storage_policy import (
+    DEFAULT_PAYLOAD_STORAGE_POLICY,
+    PayloadStoragePolicy,
+)
+from app.application.common.services.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
 from app.application.events.event_dispatcher import EventDispatcher
 from app.config import Config
 from app.domain.entities.pub_sub.entity import Event
+from app.infrastructure.adapters.database.dead_letter_writer import DeadLetterWriter
 from app.infrastructure.adapters.email.smtp_email_sender import SmtpEmailSender
 from app.infrastructure.adapters.pub_sub.pub_sub_event_consumer import PubSubEventConsumer
 from app.infrastructure.adapters.pub_sub.pub_sub_event_producer import PubSubEventProducer
 from app.infrastructure.sqla_persistence.mappings.all import map_tables
-from app.infrastructure.sqla_persistence.mappings.event import metadata
+from app.infrastructure.sqla_persistence.mappings.event import event_topics, event_types, metadata
+from app.infrastructure.sqla_persistence.orm_registry import mapping_registry
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
 from app.setup.ioc.di_providers.infrastructure import CommonInfrastructureProvider
 from app.setup.ioc.di_providers.settings import CommonSettingsProvider
 
@@ -53,6 +69,22 @@ class MockCommonApplicationProvider(Provider):
         mock.GOOGLE_PROJECT_ID = "GOOGLE_PROJECT_ID"
         return mock
 
+    @provide
+    def retry_policy(self) -> RetryPolicy:
+        return DEFAULT_RETRY_POLICY
+
+    @provide
+    def payload_storage_policy(self) -> PayloadStoragePolicy:
+        return DEFAULT_PAYLOAD_STORAGE_POLICY
+
+    @provide
+    def event_finaliser(self) -> EventFinaliser:
+        return INLINE_EVENT_FINALISER
+
+    @provide
+    def event_metrics(self) -> EventMetrics:
+        return NULL_EVENT_METRICS
+
 
 class MockUserApplicationProvider(Provider):
     scope = Scope.REQUEST
@@ -89,18 +121,45 @@ def get_providers() -> Iterable[Provider]:
     )
 
 
+TEST_JWT_SECRET = "test-jwt-secret-long-enough-for-hs256"
+
+
+@pytest.fixture
+def access_token_processor() -> JwtAccessTokenProcessor:
+    return JwtAccessTokenProcessor(TEST_JWT_SECRET, "HS256")
+
+
+@pytest.fixture
+def access_token() -> Callable[..., dict[str, str]]:
+    """Issues the `access_token` cookie the identity provider would, granting `roles`."""
+
+    def issue(*roles: str) -> dict[str, str]:
+        payload = {"roles": list(roles), "exp": datetime.now(timezone.utc) + timedelta(minutes=5)}
+        return {"access_token": jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")}
+
+    return issue
+
+
 @pytest.fixture
 def mock_subscriber_client() -> MagicMock:
     """Fixture for mocking SubscriberClient."""
     client = MagicMock(spec=pubsub_v1.SubscriberClient)
     client.subscription_path = MagicMock(side_effect=lambda project, sub: f"projects/{project}/subscriptions/{sub}")
     client.get_subscription = Mock()
-    client.subscribe = Mock()
+    client.subscribe = Mock(side_effect=lambda *args, **kwargs: concurrent.futures.Future())
     client.close = Mock()
     client.acknowledge = Mock()
     return client
 
 
+@pytest.fixture
+def dead_letter_writer() -> MagicMock:
+    """Fixture for mocking the dead-letter writer, settling each quarantined message as written."""
+    writer = MagicMock(spec=DeadLetterWriter)
+    writer.submit = Mock(side_effect=lambda item, on_flushed=None: on_flushed and on_flushed(True))
+    return writer
+
+
 @pytest.fixture
 def mock_producer_client() -> MagicMock:
     """Fixture for mocking SubscriberClient."""
@@ -197,4 +256,7 @@ async def clean_db_tables(engine: AsyncEngine):
         await conn.run_sync(metadata.drop_all)
         await conn.run_sync(metadata.create_all)
         await conn.execute(text("SET session_replication_role = 'origin';"))
+    # Ids cached from the previous test's lookup tables are gone with them.
+    event_topics.clear()
+    event_types.clear()
     yield
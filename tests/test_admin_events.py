@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+
+from app.application.common.exceptions.query import QueryRangeError
+from app.application.queries.events import CountEventsQuery, ListEventsQuery
+from app.domain.entities.pub_sub.entity import Event, EventCount
+from app.domain.entities.pub_sub.value_objects import EventStatus, TimeBucket
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import (
+    SqlAlchemyReadOnlyUnitOfWork,
+    SqlAlchemyUnitOfWork,
+)
+from app.presentation.common.exception_handler import ExceptionHandler
+from app.presentation.common.fastapi_dependencies import Role
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
+from app.presentation.http_controllers.events import events_router
+
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+async def add_events(session_maker) -> None:
+    """Ninety events, one a minute from 09:00: every third on weekly-digest, every fifth FAILED."""
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        for i in range(90):
+            await uow.events.add(
+                Event(
+                    message_id=str(i),
+                    topic="weekly-digest" if i % 3 == 0 else "daily-digest",
+                    event_type="DailyDigest",
+                    status=EventStatus.FAILED if i % 5 == 0 else EventStatus.PROCESSED,
+                    processing_started_at=PUBLISHED_AT,
+                    published_at=PUBLISHED_AT + timedelta(minutes=i),
+                    attempts=1,
+                    payload=b'{"username": "den@hotmail.com"}' if i % 5 == 0 else None,
+                )
+            )
+
+
+async def test_count_events_groups_by_bucket_topic_and_status(session_maker):
+    await add_events(session_maker)
+
+    query = CountEventsQuery(SqlAlchemyReadOnlyUnitOfWork(session_maker()))
+    counts = await query(TimeBucket.HOUR, PUBLISHED_AT, PUBLISHED_AT + timedelta(hours=2))
+
+    ten = PUBLISHED_AT + timedelta(hours=1)
+    assert counts == [
+        EventCount(PUBLISHED_AT, "daily-digest", EventStatus.FAILED, 8),
+        EventCount(PUBLISHED_AT, "daily-digest", EventStatus.PROCESSED, 32),
+        EventCount(PUBLISHED_AT, "weekly-digest", EventStatus.FAILED, 4),
+        EventCount(PUBLISHED_AT, "weekly-digest", EventStatus.PROCESSED, 16),
+        EventCount(ten, "daily-digest", EventStatus.FAILED, 4),
+        EventCount(ten, "daily-digest", EventStatus.PROCESSED, 16),
+        EventCount(ten, "weekly-digest", EventStatus.FAILED, 2),
+        EventCount(ten, "weekly-digest", EventStatus.PROCESSED, 8),
+    ]
+
+    query = CountEventsQuery(SqlAlchemyReadOnlyUnitOfWork(session_maker()))
+    weekly = await query(TimeBucket.DAY, PUBLISHED_AT, PUBLISHED_AT + timedelta(days=1), topic="weekly-digest")
+    assert [(count.bucket, count.status, count.count) for count in weekly] == [
+        (PUBLISHED_AT.replace(hour=0), EventStatus.FAILED, 6),
+        (PUBLISHED_AT.replace(hour=0), EventStatus.PROCESSED, 24),
+    ]
+
+    with pytest.raises(QueryRangeError):
+        await query(TimeBucket.MINUTE, PUBLISHED_AT, PUBLISHED_AT + timedelta(days=1))
+
+
+async def test_admin_api_lists_and_counts_events(session_maker, access_token_processor, access_token):
+    await add_events(session_maker)
+
+    class QueryProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide(scope=Scope.APP)
+        def processor(self) -> JwtAccessTokenProcessor:
+            return access_token_processor
+
+        @provide
+        def list_events(self) -> ListEventsQuery:
+            return ListEventsQuery(SqlAlchemyReadOnlyUnitOfWork(session_maker()))
+
+        @provide
+        def count_events(self) -> CountEventsQuery:
+            return CountEventsQuery(SqlAlchemyReadOnlyUnitOfWork(session_maker()))
+
+    app = FastAPI()
+    app.include_router(events_router)
+    ExceptionHandler(app).setup_handlers()
+    container = make_async_container(QueryProvider())
+    setup_dishka(container, app)
+
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.get("/admin/events/")).status_code == 401
+            client.cookies.update(access_token(Role.PUBLISHER))
+            assert (await client.get("/admin/events/")).status_code == 403
+            client.cookies.update(access_token(Role.ADMIN))
+
+            pages, after_id = [], None
+            while True:
+                params = {"topic": "weekly-digest", "status": "FAILED", "limit": 4}
+                if after_id is not None:
+                    params["after_id"] = after_id
+                response = await client.get("/admin/events/", params=params)
+                assert response.status_code == 200
+                page = response.json()
+                pages.append([item["message_id"] for item in page["items"]])
+                after_id = page["next_after_id"]
+                if after_id is None:
+                    break
+            assert pages == [["0", "15", "30", "45"], ["60", "75"]]
+
+            response = await client.get("/admin/events/", params={"message_id": "15"})
+            [event] = response.json()["items"]
+            assert event["topic"] == "weekly-digest"
+            assert event["status"] == "FAILED"
+            assert event["payload"] == '{"username": "den@hotmail.com"}'
+            assert event["published_at"] == "2026-10-19T09:15:00+00:00"
+
+            response = await client.get(
+                "/admin/events/counts",
+                params={
+                    "bucket": "hour",
+                    "published_from": PUBLISHED_AT.isoformat(),
+                    "published_until": (PUBLISHED_AT + timedelta(hours=1)).isoformat(),
+                    "topic": "daily-digest",
+                },
+            )
+            assert response.status_code == 200
+            assert response.json()["items"] == [
+                {"bucket": "2026-10-19T09:00:00+00:00", "topic": "daily-digest", "status": "FAILED", "count": 8},
+                {"bucket": "2026-10-19T09:00:00+00:00", "topic": "daily-digest", "status": "PROCESSED", "count": 32},
+            ]
+
+            response = await client.get(
+                "/admin/events/counts",
+                params={"bucket": "minute", "published_from": "2026-01-01T00:00:00+00:00"},
+            )
+            assert response.status_code == 400
+    finally:
+        await container.close()
@@ -0,0 +1,213 @@
+import asyncio
+import concurrent.futures
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from google.cloud import pubsub_v1
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.common.ports.event_publisher import EventPublisher, OutgoingMessage
+from app.application.events.event_dispatcher import EventDispatcher
+from app.infrastructure.adapters.pub_sub.pub_sub_event_producer import PubSubEventProducer
+from app.presentation.common.exception_handler import ExceptionHandler
+from app.presentation.common.fastapi_dependencies import Role
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
+from app.presentation.common.json_stream import JsonArraySplitter, JsonStreamError, NdjsonSplitter
+from app.presentation.http_controllers.notifications import notifications_router
+from app.setup.config.settings import PubSubSettings
+
+ITEMS = [
+    {"event_type": "DailyDigest", "data": {"username": "den@hotmail.com", "incorrect_words": []}},
+    # Brackets, braces, commas, quotes and escapes inside strings.
+    {"event_type": "DailyDigest", "data": {"username": 'a,]}"[{\\', "incorrect_words": [{"Italian": "\\"}]}},
+    {"event_type": "DailyDigest", "data": {"username": "é", "incorrect_words": [[], {}]}, "ordering_key": "é"},
+]
+
+
+def split(splitter, body: bytes, chunk_size: int) -> list[bytes]:
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items += splitter.feed(body[i : i + chunk_size])
+    return items + splitter.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_splitters_find_every_item_whatever_the_chunking(chunk_size):
+    ndjson = b"\n".join(orjson.dumps(item) for item in ITEMS) + b"\n\n"
+    array = b' [ \n' + b" ,\n".join(orjson.dumps(item) for item in ITEMS) + b"\n] \n"
+
+    assert [orjson.loads(item) for item in split(NdjsonSplitter(1024), ndjson, chunk_size)] == ITEMS
+    assert [orjson.loads(item) for item in split(JsonArraySplitter(1024), array, chunk_size)] == ITEMS
+    assert split(JsonArraySplitter(1024), b"[]", chunk_size) == []
+    assert split(JsonArraySplitter(1024), b"[1, true,null]", chunk_size) == [b"1", b"true", b"null"]
+
+
+@pytest.mark.parametrize(
+    ("body", "error"),
+    [
+        (b'{"event_type": "DailyDigest"}', "Expected a JSON array"),
+        (b"[1, 2,]", "Trailing comma"),
+        (b"[1,,2]", "Empty array element"),
+        (b"[1, 2] 3", "Data after the end"),
+        (b"[1, 2", "not closed"),
+        (b"[1}", "Unbalanced"),
+        (b'["' + b"x" * 64 + b'"]', "longer than 32 bytes"),
+    ],
+)
+def test_json_array_splitter_rejects_what_is_not_an_array(body, error):
+    with pytest.raises(JsonStreamError, match=error):
+        split(JsonArraySplitter(32), body, 4)
+
+
+def test_ndjson_splitter_bounds_the_line_it_buffers():
+    splitter = NdjsonSplitter(32)
+    with pytest.raises(JsonStreamError):
+        for _ in range(10):
+            splitter.feed(b"x" * 8)
+
+
+class FakePublisherClient:
+    """Confirms publishes in the background, a few milliseconds after each was made."""
+
+    def __init__(self, fail_on: bytes | None = None):
+        self.fail_on = fail_on
+        self.published: list[tuple[bytes, str, dict]] = []
+        self.unconfirmed = 0
+        self.max_unconfirmed = 0
+
+    def topic_path(self, project, topic):
+        return f"projects/{project}/topics/{topic}"
+
+    def get_topic(self, request):
+        return None
+
+    def publish(self, topic_path, data, ordering_key="", **attrs):
+        self.published.append((data, ordering_key, attrs))
+        self.unconfirmed += 1
+        self.max_unconfirmed = max(self.max_unconfirmed, self.unconfirmed)
+        future = concurrent.futures.Future()
+
+        def confirm():
+            self.unconfirmed -= 1
+            if data == self.fail_on:
+                future.set_exception(RuntimeError("publish failed"))
+            else:
+                future.set_result(str(len(self.published)))
+
+        asyncio.get_running_loop().call_later(0.002, confirm)
+        return future
+
+    def resume_publish(self, topic_path, ordering_key):
+        pass
+
+
+def make_producer(client: FakePublisherClient, max_in_flight: int = 1000) -> PubSubEventProducer:
+    settings = PubSubSettings(PUBLISH_MAX_IN_FLIGHT=max_in_flight, ENABLE_MESSAGE_ORDERING=True)
+    with patch.object(pubsub_v1, "PublisherClient", return_value=client):
+        return PubSubEventProducer(settings)
+
+
+async def test_publish_many_bounds_unconfirmed_messages():
+    client = FakePublisherClient(fail_on=b"7")
+
+    async def messages():
+        for i in range(50):
+            yield OutgoingMessage(str(i).encode(), attributes={"event_type": "DailyDigest"})
+
+    result = await make_producer(client, max_in_flight=5).publish_many("daily-digest", messages())
+
+    assert (result.published, result.failed) == (49, 1)
+    assert [data for data, _, _ in client.published] == [str(i).encode() for i in range(50)]
+    assert client.max_unconfirmed == 5
+    assert client.unconfirmed == 0
+
+
+async def test_batch_endpoint_streams_and_publishes_valid_items(access_token_processor, access_token):
+    client = FakePublisherClient()
+    producer = make_producer(client)
+    dispatcher = EventDispatcher(None)
+    dispatcher.register("DailyDigest", GameDigestInteractor)
+
+    class IngestionProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def publisher(self) -> EventPublisher:
+            return producer
+
+        @provide
+        def event_dispatcher(self) -> EventDispatcher:
+            return dispatcher
+
+        @provide
+        def settings(self) -> PubSubSettings:
+            return PubSubSettings()
+
+        @provide
+        def processor(self) -> JwtAccessTokenProcessor:
+            return access_token_processor
+
+    app = FastAPI()
+    app.include_router(notifications_router)
+    ExceptionHandler(app).setup_handlers()
+    container = make_async_container(IngestionProvider())
+    setup_dishka(container, app)
+
+    rejected = [
+        {"event_type": "DailyDigest", "data": {"username": "den@hotmail.com"}},  # no incorrect_words
+        {"event_type": "WeeklyDigest", "data": {}},  # no handler
+        ["not", "an", "object"],
+    ]
+    lines = [orjson.dumps(item) for item in ITEMS + rejected] + [b"{broken"]
+
+    async def body(chunks):
+        for chunk in chunks:
+            yield chunk
+
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            empty = {"content": b"[]", "headers": {"content-type": "application/json"}}
+            assert (await http.post("/notifications:batch", **empty)).status_code == 401
+            http.cookies.update(access_token(Role.PUBLISHER))
+            assert (await http.post("/notifications:batch?topic=billing", **empty)).status_code == 422
+            assert not client.published
+
+            ndjson = b"\n".join(lines)
+            response = await http.post(
+                "/notifications:batch",
+                content=body([ndjson[i : i + 10] for i in range(0, len(ndjson), 10)]),
+                headers={"content-type": "application/x-ndjson"},
+            )
+            assert response.status_code == 200
+            report = response.json()
+            assert {key: report[key] for key in ("received", "published", "rejected", "failed")} == {
+                "received": 7,
+                "published": 3,
+                "rejected": 4,
+                "failed": 0,
+            }
+            assert [error["index"] for error in report["errors"]] == [3, 4, 5, 6]
+            assert [orjson.loads(data) for data, _, _ in client.published] == [item["data"] for item in ITEMS]
+            assert client.published[2][1:] == ("é", {"event_type": "DailyDigest"})
+
+            array = b"[" + b",".join(orjson.dumps(item) for item in ITEMS) + b",]"
+            response = await http.post(
+                "/notifications:batch?topic=daily-digest",
+                content=body([array]),
+                headers={"content-type": "application/json"},
+            )
+            assert response.status_code == 400
+            assert response.json()["published"] == 3
+            assert "Trailing comma" in response.json()["aborted"]
+
+            response = await http.post("/notifications:batch", content=b"x", headers={"content-type": "text/plain"})
+            assert response.status_code == 415
+    finally:
+        await container.close()
@@ -0,0 +1,214 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import orjson
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from app.application.common.exceptions.replay import ReplayInProgressError
+from app.domain.entities.pub_sub.entity import Event
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.bulk_event_replayer import BulkEventReplayer
+from app.infrastructure.adapters.database.replay_jobs import ReplayFilter, ReplayJobs, ReplayJobState
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.sqla_persistence.compressed_payload import ZSTD_MAGIC
+from app.presentation.common.exception_handler import ExceptionHandler
+from app.presentation.common.fastapi_dependencies import Role
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
+from app.presentation.http_controllers.events import events_router
+from app.setup.config.settings import PubSubSettings
+
+TOPIC = "daily-digest"
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+def make_payload(words: int) -> dict:
+    return {"username": "den@hotmail.com", "incorrect_words": [{"Italian": "Fiore", "English": "Flower"}] * words}
+
+
+async def add_events(session_maker, count: int, status: EventStatus = EventStatus.FAILED, words: int = 1) -> None:
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        for i in range(count):
+            await uow.events.add(
+                Event(
+                    message_id=str(i),
+                    topic=TOPIC,
+                    event_type="DailyDigest",
+                    status=status,
+                    processing_started_at=datetime.now(timezone.utc),
+                    published_at=PUBLISHED_AT,
+                    attempts=1,
+                    payload=orjson.dumps(make_payload(words)),
+                )
+            )
+
+
+async def test_large_payloads_are_stored_compressed(session_maker):
+    await add_events(session_maker, 1, words=50)
+    await add_events(session_maker, 1, words=1)  # conflicts on message_id "0", nothing written
+
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        raw = (await uow.session.execute(text("SELECT payload FROM event"))).scalar_one()
+        stored = await uow.events.get_by_id_and_topic("0", TOPIC)
+    assert raw.startswith(ZSTD_MAGIC)
+    assert orjson.loads(stored.payload) == make_payload(50)
+
+
+class CountingReplayer:
+    def __init__(self, fail_ids: set[str] = frozenset(), delay_s: float = 0.01):
+        self.fail_ids = fail_ids
+        self.delay_s = delay_s
+        self.running = 0
+        self.max_running = 0
+        self.seen: list[str] = []
+
+    async def replay(self, messages):
+        (message,) = messages
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay_s)
+        self.running -= 1
+        self.seen.append(message.message.message_id)
+        assert message.data == make_payload(1)
+        return [RuntimeError("boom") if message.message.message_id in self.fail_ids else None]
+
+
+async def test_bulk_replay_streams_with_bounded_concurrency(session_maker):
+    await add_events(session_maker, 20)
+    replayer = CountingReplayer(fail_ids={"3"})
+
+    result = await BulkEventReplayer(session_maker, replayer, PubSubSettings(REPLAY_CONCURRENCY=4)).run()
+
+    assert (result.replayed, result.failed) == (19, 1)
+    assert sorted(replayer.seen, key=int) == [str(i) for i in range(20)]
+    assert replayer.max_running == 4
+
+
+async def test_bulk_replay_holds_no_connection_while_waiting_for_slots(session_maker, engine):
+    await add_events(session_maker, 5)
+    gate = asyncio.Event()
+
+    class GatedReplayer(CountingReplayer):
+        waiting = 0
+
+        async def replay(self, messages):
+            self.waiting += 1
+            await gate.wait()
+            return await super().replay(messages)
+
+    replayer = GatedReplayer()
+    settings = PubSubSettings(REPLAY_CONCURRENCY=2, REPLAY_PAGE_SIZE=2)
+    run = asyncio.create_task(BulkEventReplayer(session_maker, replayer, settings).run(limit=4))
+    async with asyncio.timeout(5):
+        # Both slots are taken, so the walk is blocked handing out the second page.
+        while replayer.waiting < 2:
+            await asyncio.sleep(0.01)
+        while engine.sync_engine.pool.checkedout():
+            await asyncio.sleep(0.01)
+    gate.set()
+    result = await run
+
+    assert result.replayed == 4
+    assert sorted(replayer.seen, key=int) == ["0", "1", "2", "3"]
+
+
+async def test_bulk_replay_resets_dead_lettered_events(session_maker):
+    await add_events(session_maker, 2, status=EventStatus.DEAD_LETTERED)
+
+    result = await BulkEventReplayer(session_maker, CountingReplayer(), PubSubSettings()).run(
+        status=EventStatus.DEAD_LETTERED, limit=1
+    )
+
+    assert result.replayed == 1
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        first = await uow.events.get_by_id_and_topic("0", TOPIC)
+        second = await uow.events.get_by_id_and_topic("1", TOPIC)
+    assert (first.status, first.attempts) == (EventStatus.FAILED, 0)
+    assert second.status == EventStatus.DEAD_LETTERED
+
+
+async def wait_until_done(jobs: ReplayJobs, job_id: str) -> None:
+    async with asyncio.timeout(10):
+        while jobs.get(job_id).state is ReplayJobState.RUNNING:
+            await asyncio.sleep(0.01)
+
+
+async def test_replay_job_runs_in_the_background_one_at_a_time(session_maker):
+    await add_events(session_maker, 20)
+    replayer = CountingReplayer(fail_ids={"3"})
+    jobs = ReplayJobs(BulkEventReplayer(session_maker, replayer, PubSubSettings(REPLAY_CONCURRENCY=4)))
+
+    job = jobs.start(ReplayFilter(topic=TOPIC, published_from=PUBLISHED_AT))
+    with pytest.raises(ReplayInProgressError):
+        jobs.start(ReplayFilter())
+    await wait_until_done(jobs, job.id)
+
+    assert job.state is ReplayJobState.FINISHED
+    assert (job.progress.replayed, job.progress.failed, job.processed) == (19, 1, 20)
+    assert job.rate_per_s > 0
+    assert jobs.start(ReplayFilter(topic="weekly-digest")).id != job.id
+    await jobs.stop()
+
+
+async def test_cancelled_replay_job_lets_started_replays_finish(session_maker):
+    await add_events(session_maker, 20)
+    replayer = CountingReplayer(delay_s=0.05)
+    jobs = ReplayJobs(BulkEventReplayer(session_maker, replayer, PubSubSettings()))
+
+    job = jobs.start(ReplayFilter(), concurrency=2)
+    await asyncio.sleep(0.12)
+    await jobs.cancel(job.id)
+
+    assert job.state is ReplayJobState.CANCELLED
+    assert replayer.running == 0
+    assert 0 < job.processed < 20
+    assert job.processed == len(replayer.seen)
+
+
+async def test_replay_api_starts_and_reports_a_job(session_maker, access_token_processor, access_token):
+    await add_events(session_maker, 5)
+    jobs = ReplayJobs(BulkEventReplayer(session_maker, CountingReplayer(), PubSubSettings()))
+
+    class JobsProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def replay_jobs(self) -> ReplayJobs:
+            return jobs
+
+        @provide
+        def processor(self) -> JwtAccessTokenProcessor:
+            return access_token_processor
+
+    app = FastAPI()
+    app.include_router(events_router)
+    ExceptionHandler(app).setup_handlers()
+    container = make_async_container(JobsProvider())
+    setup_dishka(container, app)
+
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.post("/admin/events/replay", json={})).status_code == 401
+            client.cookies.update(access_token(Role.ADMIN))
+
+            response = await client.post("/admin/events/replay", json={"status": "PROCESSED"})
+            assert response.status_code == 422
+
+            response = await client.post("/admin/events/replay", json={"topic": TOPIC, "concurrency": 2})
+            assert response.status_code == 202
+            job_id = response.json()["id"]
+            assert response.json()["filter"]["status"] == "FAILED"
+            assert (await client.post("/admin/events/replay", json={})).status_code == 409
+
+            await wait_until_done(jobs, job_id)
+            report = (await client.get(f"/admin/events/replay/{job_id}")).json()
+            assert (report["state"], report["replayed"], report["processed"]) == ("FINISHED", 5, 5)
+            assert (await client.get("/admin/events/replay/unknown")).status_code == 404
+    finally:
+        await container.close()
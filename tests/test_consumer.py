@@ -1,5 +1,7 @@
 import asyncio
+import concurrent.futures
 import logging
+import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, Mock, patch
 
@@ -8,12 +10,25 @@ from dishka import Scope
 from google.cloud import pubsub_v1
 
 from app.application.common.exceptions.email import EmailDeliveryError
+from app.application.common.ports.event_subscriber import SubscriberState
 from app.config import Config
 from app.domain.entities.pub_sub.entity import PubSubMessage
+from app.infrastructure.adapters.pub_sub.lease_extender import LeaseExtender
 from app.infrastructure.adapters.pub_sub.pub_sub_event_consumer import PubSubEventConsumer
+from app.setup.config.settings import PubSubSettings
 
+FAST_BACKOFF = PubSubSettings(BACKOFF_INITIAL_S=0.01, BACKOFF_MAX_S=0.05, MAX_RESTARTS=3)
 
-async def test_consumer_with_no_loop(container, mock_subscriber_client, mock_producer_client):
+
+async def wait_for_state(consumer: PubSubEventConsumer, state: SubscriberState, timeout: float = 2.0) -> None:
+    async def _poll():
+        while consumer.health().state != state:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_poll(), timeout)
+
+
+async def test_consumer_with_no_loop(container, mock_subscriber_client, mock_producer_client, dead_letter_writer):
     with (
         patch(
             "src.app.infrastructure.adapters.pub_sub.pub_sub_event_consumer.pubsub_v1.SubscriberClient",
@@ -26,7 +41,7 @@ async def test_consumer_with_no_loop(container, mock_subscriber_client, mock_pro
     ):
         async with container(scope=Scope.REQUEST) as request_container:
             mock_config = await request_container.get(Config)
-            a = PubSubEventConsumer(container, mock_config)
+            a = PubSubEventConsumer(container, mock_config, FAST_BACKOFF, dead_letter_writer)
             loop = None
             try:
                 await a.subscribe(loop)
@@ -40,6 +55,7 @@ def make_pubsub_message(data: dict | list, attributes: dict | None = None) -> pu
     mock_msg.data = data
     mock_msg.attributes = attributes or {}
     mock_msg.publish_time = datetime.now(timezone.utc)
+    mock_msg.message_id = "1"
     mock_msg.ack = Mock()
     mock_msg.nack = Mock()
 
@@ -57,7 +73,7 @@ def make_pubsub_message(data: dict | list, attributes: dict | None = None) -> pu
     ],
 )
 async def test_consumer_process_message(
-    container, mock_subscriber_client, mock_producer_client, caplog, side_effect, expected_log
+    container, mock_subscriber_client, mock_producer_client, dead_letter_writer, caplog, side_effect, expected_log
 ):
     caplog.set_level(logging.ERROR)
     with (
@@ -72,7 +88,7 @@ async def test_consumer_process_message(
     ):
         async with container(scope=Scope.REQUEST) as request_container:
             mock_config = await request_container.get(Config)
-        a = PubSubEventConsumer(container, mock_config)
+        a = PubSubEventConsumer(container, mock_config, FAST_BACKOFF, dead_letter_writer)
         loop = asyncio.get_running_loop()
         a.loop = loop
 
@@ -103,11 +119,12 @@ async def test_consumer_process_message(
             with patch.object(a, "_on_done", wraps=a._on_done):
                 a.callback(message)
                 assert any(expected_log in rec.message for rec in caplog.records)
+        await a.stop()
 
 
 @pytest.mark.asyncio
-async def test_subscribe_crash(container, mock_subscriber_client, mock_producer_client, caplog):
-    mock_subscriber_client.subscribe = Mock(side_effect=[Exception, Mock()])
+async def test_subscribe_crash(container, mock_subscriber_client, mock_producer_client, dead_letter_writer, caplog):
+    mock_subscriber_client.subscribe = Mock(side_effect=[Exception, concurrent.futures.Future()])
     caplog.set_level(logging.INFO)
     with (
         patch(
@@ -121,13 +138,130 @@ async def test_subscribe_crash(container, mock_subscriber_client, mock_producer_
     ):
         async with container(scope=Scope.REQUEST) as request_container:
             mock_config = await request_container.get(Config)
-        a = PubSubEventConsumer(container, mock_config)
+        a = PubSubEventConsumer(container, mock_config, FAST_BACKOFF, dead_letter_writer)
         loop = asyncio.get_running_loop()
         a.loop = loop
 
         await a.subscribe(loop)
+        await wait_for_state(a, SubscriberState.RUNNING)
         for rec in caplog.records:
             print(f"[{rec.levelname}] {rec.message}")
 
         assert any("Failed to start" in rec.message for rec in caplog.records)
         assert any("Attempting to start" in rec.message for rec in caplog.records)
+        assert a.health().restarts == 1
+        await a.stop()
+        assert a.health().state == SubscriberState.STOPPED
+
+
+@pytest.mark.asyncio
+async def test_subscriber_restarts_after_stream_crash(
+    container, mock_subscriber_client, mock_producer_client, dead_letter_writer
+):
+    first_stream: concurrent.futures.Future = concurrent.futures.Future()
+    mock_subscriber_client.subscribe = Mock(side_effect=[first_stream, concurrent.futures.Future()])
+    with (
+        patch(
+            "src.app.infrastructure.adapters.pub_sub.pub_sub_event_consumer.pubsub_v1.SubscriberClient",
+            return_value=mock_subscriber_client,
+        ),
+        patch(
+            "src.app.infrastructure.adapters.pub_sub.pub_sub_event_producer.pubsub_v1.PublisherClient",
+            return_value=mock_producer_client,
+        ),
+    ):
+        async with container(scope=Scope.REQUEST) as request_container:
+            mock_config = await request_container.get(Config)
+        a = PubSubEventConsumer(container, mock_config, FAST_BACKOFF, dead_letter_writer)
+
+        await a.subscribe(asyncio.get_running_loop())
+        await wait_for_state(a, SubscriberState.RUNNING)
+
+        first_stream.set_exception(RuntimeError("stream reset"))
+        await wait_for_state(a, SubscriberState.RUNNING)
+        await asyncio.sleep(0.1)
+
+        assert mock_subscriber_client.subscribe.call_count == 2
+        assert a.health().restarts == 1
+        assert a.health().last_error == "RuntimeError('stream reset')"
+        await a.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_gives_up_when_restart_budget_exhausted(
+    container, mock_subscriber_client, mock_producer_client, dead_letter_writer
+):
+    mock_subscriber_client.subscribe = Mock(side_effect=Exception("emulator down"))
+    with (
+        patch(
+            "src.app.infrastructure.adapters.pub_sub.pub_sub_event_consumer.pubsub_v1.SubscriberClient",
+            return_value=mock_subscriber_client,
+        ),
+        patch(
+            "src.app.infrastructure.adapters.pub_sub.pub_sub_event_producer.pubsub_v1.PublisherClient",
+            return_value=mock_producer_client,
+        ),
+    ):
+        async with container(scope=Scope.REQUEST) as request_container:
+            mock_config = await request_container.get(Config)
+        a = PubSubEventConsumer(container, mock_config, FAST_BACKOFF, dead_letter_writer)
+
+        await a.subscribe(asyncio.get_running_loop())
+        await wait_for_state(a, SubscriberState.FAILED)
+
+        assert mock_subscriber_client.subscribe.call_count == FAST_BACKOFF.max_restarts + 1
+        assert not a.health().healthy
+        await a.stop()
+
+
+def test_lease_extender_extends_until_max_extension():
+    settings = PubSubSettings(ACK_DEADLINE_S=20, MAX_LEASE_EXTENSION_S=60)
+    leases = LeaseExtender(settings)
+    message = make_pubsub_message(b"{}")
+    message.ack_id = "ack-1"
+    message.message_id = "1"
+    leases.register(message)
+    received_at = time.monotonic()
+
+    assert leases.extend_due(received_at) == 0
+    assert leases.extend_due(received_at + 11) == 1
+    message.modify_ack_deadline.assert_called_once_with(20)
+
+    assert leases.extend_due(received_at + 15) == 0
+    assert leases.extend_due(received_at + 22) == 1
+
+    assert leases.extend_due(received_at + 61) == 0
+    assert leases.extend_due(received_at + 90) == 0
+    assert message.modify_ack_deadline.call_count == 2
+    # Given up on, but its handler is still running: it stays in flight until released.
+    assert leases.in_flight == 1
+    leases.release(message)
+    assert leases.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_on_done_releases_lease(container, mock_subscriber_client, mock_producer_client, dead_letter_writer):
+    with (
+        patch(
+            "src.app.infrastructure.adapters.pub_sub.pub_sub_event_consumer.pubsub_v1.SubscriberClient",
+            return_value=mock_subscriber_client,
+        ),
+        patch(
+            "src.app.infrastructure.adapters.pub_sub.pub_sub_event_producer.pubsub_v1.PublisherClient",
+            return_value=mock_producer_client,
+        ),
+    ):
+        async with container(scope=Scope.REQUEST) as request_container:
+            mock_config = await request_container.get(Config)
+        a = PubSubEventConsumer(container, mock_config, FAST_BACKOFF, dead_letter_writer)
+
+    message = make_pubsub_message(b"{}", {"event_type": "DailyDigest"})
+    a._leases.register(message)
+    assert a._leases.in_flight == 1
+
+    done: concurrent.futures.Future = concurrent.futures.Future()
+    done.set_result(None)
+    a._on_done(done, PubSubMessage(message, {}, {}, "DailyDigest", datetime.now(), "test-topic"))
+
+    message.ack.assert_called_once()
+    assert a._leases.in_flight == 0
@@ -0,0 +1,193 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from dishka import Scope
+from sqlalchemy import select
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.commands.replay_dead_letters import ReplayDeadLettersInteractor
+from app.application.common.exceptions.event import EventDeadLetteredError
+from app.application.common.ports.email_sender import EmailSender
+from app.domain.entities.pub_sub.entity import DeadLetter, Event, PubSubMessage
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.dead_letter_writer import DeadLetterWriter
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.adapters.pub_sub.pub_sub_event_consumer import PubSubEventConsumer
+from app.infrastructure.sqla_persistence.mappings.dead_letter import dead_letter_table
+from app.setup.config.settings import PubSubSettings
+
+TOPIC = "daily-digest"
+PAYLOAD = {"username": "den@hotmail.com", "incorrect_words": [{"Italian": "Fiore", "English": "Flower"}]}
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+def make_dead_letter(message_id: str = "1") -> DeadLetter:
+    return DeadLetter(
+        message_id=message_id,
+        topic=TOPIC,
+        event_type="DailyDigest",
+        payload=json.dumps(PAYLOAD).encode("utf-8"),
+        error="EmailDeliveryError()",
+        attempts=5,
+        dead_lettered_at=datetime.now(timezone.utc),
+        attributes={"event_type": "DailyDigest"},
+        published_at=PUBLISHED_AT,
+    )
+
+
+async def add_event(session_maker, message_id: str, status: EventStatus, attempts: int = 5) -> None:
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        await uow.events.add(
+            Event(
+                message_id=message_id,
+                topic=TOPIC,
+                event_type="DailyDigest",
+                status=status,
+                processing_started_at=datetime.now(timezone.utc),
+                published_at=PUBLISHED_AT,
+                attempts=attempts,
+            )
+        )
+
+
+async def test_writer_flush_quarantines_in_one_transaction(session_maker):
+    await add_event(session_maker, "1", EventStatus.FAILED)
+    writer = DeadLetterWriter(session_maker, PubSubSettings())
+    on_flushed = Mock()
+
+    writer.submit(make_dead_letter("1"), on_flushed)
+    writer.submit(make_dead_letter("2"), on_flushed)
+    assert await writer.flush() == 2
+
+    assert on_flushed.call_args_list == [((True,),), ((True,),)]
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        assert [dl.message_id for dl in await uow.dead_letters.list_pending(10)] == ["1", "2"]
+        event = await uow.events.get_by_id_and_topic("1", TOPIC)
+        assert event.status == EventStatus.DEAD_LETTERED
+
+
+async def test_writer_flushes_when_batch_is_full(session_maker):
+    writer = DeadLetterWriter(session_maker, PubSubSettings(DEAD_LETTER_FLUSH_INTERVAL_S=60, DEAD_LETTER_BATCH_SIZE=2))
+    writer.start(asyncio.get_running_loop())
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(writer.write(make_dead_letter("1")), writer.write(make_dead_letter("2"))),
+            timeout=2,
+        )
+    finally:
+        await writer.stop()
+    async with session_maker() as session:
+        assert len((await session.execute(select(dead_letter_table.c.id))).all()) == 2
+
+
+async def test_writer_stop_lets_an_ongoing_flush_finish(session_maker):
+    writer = DeadLetterWriter(session_maker, PubSubSettings(DEAD_LETTER_FLUSH_INTERVAL_S=60, DEAD_LETTER_BATCH_SIZE=1))
+    writing = asyncio.Event()
+    release = asyncio.Event()
+    write_batch = writer._write_batch
+
+    async def slow_write_batch(uow, items):
+        writing.set()
+        await release.wait()
+        await write_batch(uow, items)
+
+    writer._write_batch = slow_write_batch
+    writer.start(asyncio.get_running_loop())
+    write = asyncio.create_task(writer.write(make_dead_letter("1")))
+    await writing.wait()
+
+    stop = asyncio.create_task(writer.stop())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.wait_for(asyncio.gather(write, stop), timeout=2)
+
+    async with session_maker() as session:
+        assert len((await session.execute(select(dead_letter_table.c.id))).all()) == 1
+
+
+async def test_quarantined_event_is_not_processed_again(container, db_session, session_maker):
+    await add_event(session_maker, "1", EventStatus.DEAD_LETTERED)
+    message = PubSubMessage(
+        SimpleNamespace(message_id="1"), PAYLOAD, {}, "DailyDigest", PUBLISHED_AT, TOPIC
+    )
+    async with container(scope=Scope.REQUEST) as request_container:
+        sender = await request_container.get(EmailSender)
+        interactor = GameDigestInteractor(sender, SqlAlchemyUnitOfWork(db_session))
+        with pytest.raises(EventDeadLetteredError):
+            await interactor(message)
+        sender.send.assert_not_called()
+
+
+@pytest.mark.parametrize("delivery_attempt, quarantined", [(4, False), (5, True)])
+async def test_consumer_dead_letters_after_max_attempts(
+    container,
+    mock_subscriber_client,
+    mock_producer_client,
+    dead_letter_writer,
+    monkeypatch,
+    delivery_attempt,
+    quarantined,
+):
+    monkeypatch.setattr("google.cloud.pubsub_v1.SubscriberClient", Mock(return_value=mock_subscriber_client))
+    monkeypatch.setattr("google.cloud.pubsub_v1.PublisherClient", Mock(return_value=mock_producer_client))
+    consumer = PubSubEventConsumer(container, Mock(), PubSubSettings(MAX_DELIVERY_ATTEMPTS=5), dead_letter_writer)
+    raw = Mock(message_id="1", data=b"{}", attributes={}, publish_time=datetime.now(timezone.utc))
+    event = PubSubMessage(
+        raw, {}, {}, "DailyDigest", datetime.now(timezone.utc), TOPIC, delivery_attempt=delivery_attempt
+    )
+    failed: asyncio.Future = asyncio.get_running_loop().create_future()
+    failed.set_exception(RuntimeError("boom"))
+
+    consumer._on_done(failed, event)
+
+    assert dead_letter_writer.submit.called is quarantined
+    assert raw.ack.called is quarantined
+    assert raw.nack.called is not quarantined
+
+
+class InlineReplayer:
+    """Replays straight through the interactor, standing in for the container-backed replayer."""
+
+    def __init__(self, sender, session_maker):
+        self.sender = sender
+        self.session_maker = session_maker
+
+    async def replay(self, messages):
+        outcomes = []
+        for message in messages:
+            async with self.session_maker() as session:
+                try:
+                    await GameDigestInteractor(self.sender, SqlAlchemyUnitOfWork(session))(message)
+                    outcomes.append(None)
+                except Exception as e:
+                    outcomes.append(e)
+        return outcomes
+
+
+async def test_replay_dead_letters(container, session_maker):
+    await add_event(session_maker, "1", EventStatus.DEAD_LETTERED)
+    await add_event(session_maker, "2", EventStatus.DEAD_LETTERED)
+    broken = make_dead_letter("2")
+    broken.payload = b'{"username": "den@hotmail.com"}'
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        await uow.dead_letters.add_many([make_dead_letter("1"), broken])
+
+    sender = Mock(spec=EmailSender)
+    sender.send = AsyncMock()
+    async with session_maker() as session:
+        interactor = ReplayDeadLettersInteractor(SqlAlchemyUnitOfWork(session), InlineReplayer(sender, session_maker))
+        result = await interactor(limit=10)
+
+    assert len(result.replayed) == 1
+    assert len(result.failed) == 1
+    sender.send.assert_awaited_once()
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        replayed = await uow.events.get_by_id_and_topic("1", TOPIC)
+        assert (replayed.status, replayed.attempts) == (EventStatus.PROCESSED, 1)
+        still_failing = await uow.events.get_by_id_and_topic("2", TOPIC)
+        assert still_failing.status == EventStatus.FAILED
+        assert [dl.message_id for dl in await uow.dead_letters.list_pending(10)] == ["2"]
@@ -0,0 +1,145 @@
+import os
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.pub_sub.value_objects import EventStatus, TimeBucket
+from app.infrastructure.adapters.database.event_partition_maintainer import EventPartitionMaintainer
+from app.infrastructure.adapters.database.repositories.dead_letter_repository import DeadLetterRepository
+from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
+from app.infrastructure.sqla_persistence.mappings.event import event_topics, event_types
+from app.setup.config.settings import PartitionSettings
+
+# Plans only settle into their production shape once the table is big (EVENT_EXPLAIN_ROWS=10000000).
+# At the default size a sequential scan is cheaper than any index, so the planner is told to avoid
+# one: that still proves each query can use its index, just not that Postgres would pick it unaided.
+ROWS = int(os.environ.get("EVENT_EXPLAIN_ROWS", 20_000))
+AT_SCALE = ROWS >= 1_000_000
+START = datetime(2026, 10, 19, tzinfo=timezone.utc)
+SPAN = timedelta(weeks=3)
+POPULATED = ["event_p20261019", "event_p20261026", "event_p20261102"]
+
+# 1% FAILED (due an hour after publish, with a payload), 0.1% PROCESSING, 0.1% DEAD_LETTERED, the rest PROCESSED.
+SEED_EVENTS = """
+INSERT INTO event (message_id, topic_id, event_type_id, status, processing_started_at, published_at, attempts,
+                   next_attempt_at, payload)
+SELECT g::text, :topic_id, :event_type_id,
+       CASE WHEN g % 1000 = 0 THEN 'PROCESSING'
+            WHEN g % 1000 = 2 THEN 'DEAD_LETTERED'
+            WHEN g % 100 = 1 THEN 'FAILED'
+            ELSE 'PROCESSED' END::event_status,
+       ts, ts, 1,
+       CASE WHEN g % 100 = 1 THEN ts + interval '1 hour' END,
+       CASE WHEN g % 100 = 1 OR g % 1000 = 2 THEN '\\x00'::bytea END
+FROM generate_series(1, :rows) g,
+     LATERAL (SELECT :start + (g * :span) / :rows AS ts) t
+"""
+# Dead letters are mostly replayed already; only every 50th is pending.
+SEED_DEAD_LETTERS = """
+INSERT INTO dead_letter (message_id, topic, event_type, payload, error, attempts, dead_lettered_at, replayed_at)
+SELECT g::text, 'daily-digest', 'DailyDigest', '\\x00'::bytea, 'EmailDeliveryError()', 5, :start,
+       CASE WHEN g % 50 <> 0 THEN :start END
+FROM generate_series(1, :rows / 100) g
+"""
+
+
+async def plan_of(session: AsyncSession, query: Callable[[AsyncSession], Awaitable]) -> str:
+    """EXPLAINs the first statement `query` sends, exactly as the repository builds it."""
+    connection = await session.connection()
+    statements: list[tuple[str, dict]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        await query(session)
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+    statement, parameters = statements[0]
+    rows = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(rows.scalars())
+
+
+async def partition_indexes(session: AsyncSession, index: str) -> set[str]:
+    rows = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :index"
+        ),
+        {"index": index},
+    )
+    return set(rows.scalars())
+
+
+def assert_index_scans(plan: str, indexes: set[str], partitions: list[str]) -> None:
+    for partition in partitions:
+        assert f"Seq Scan on {partition}" not in plan, plan
+    assert any(f"using {index} on" in plan or f"on {index}" in plan for index in indexes), plan
+
+
+async def test_hot_queries_use_index_scans_at_scale(session_maker):
+    await EventPartitionMaintainer(session_maker, PartitionSettings(INTERVAL="week", PREMAKE=2)).run_once(START)
+    async with session_maker() as session:
+        params = {
+            "rows": ROWS,
+            "start": START,
+            "span": SPAN,
+            "topic_id": await event_topics.id_for(session, "daily-digest"),
+            "event_type_id": await event_types.id_for(session, "DailyDigest"),
+        }
+        await session.execute(text(SEED_EVENTS), params)
+        await session.execute(text(SEED_DEAD_LETTERS), params)
+        await session.commit()
+    async with session_maker() as session:
+        # What autovacuum would have done by then: fresh statistics and summarised BRIN ranges.
+        connection = await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        await connection.execute(text("VACUUM ANALYZE event, dead_letter"))
+
+    now = START + SPAN / 2
+    published_at = START + (ROWS // 2 * SPAN) / ROWS
+    async with session_maker() as session:
+        if not AT_SCALE:
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+        # Claim: the consumer's lookup by key is pruned to one partition.
+        plan = await plan_of(
+            session,
+            lambda s: EventRepository(s).get_by_id_and_topic(
+                str(ROWS // 2), "daily-digest", published_at, for_update=True
+            ),
+        )
+        assert_index_scans(plan, await partition_indexes(session, "uq_message_topic"), POPULATED)
+        assert plan.count(" on event_p") == 1, plan
+
+        plan = await plan_of(
+            session, lambda s: EventRepository(s).claim_due_retries(now, 50, now + timedelta(minutes=5))
+        )
+        assert_index_scans(plan, await partition_indexes(session, "ix_event_retry_due"), POPULATED)
+
+        # Reaper
+        plan = await plan_of(
+            session, lambda s: EventRepository(s).reap_stale_processing(now - timedelta(minutes=15), now, 50)
+        )
+        assert_index_scans(plan, await partition_indexes(session, "ix_event_stale_processing"), POPULATED)
+
+        # Admin: bulk replay and the dead-letter listing
+        async def first_replayable(s: AsyncSession) -> None:
+            stream = EventRepository(s).list(status=EventStatus.DEAD_LETTERED, limit=100, with_payload=True)
+            await anext(stream)
+            await stream.aclose()
+
+        plan = await plan_of(session, first_replayable)
+        assert_index_scans(plan, await partition_indexes(session, "ix_event_replayable"), POPULATED)
+
+        plan = await plan_of(session, lambda s: DeadLetterRepository(s).list_pending(100))
+        assert_index_scans(plan, {"ix_dead_letter_pending"}, ["dead_letter"])
+
+        # Admin: event counts over a publish-time window
+        plan = await plan_of(
+            session, lambda s: EventRepository(s).count_by_bucket(TimeBucket.HOUR, now, now + timedelta(hours=1))
+        )
+        assert_index_scans(plan, await partition_indexes(session, "ix_event_published_at_brin"), POPULATED)
+        await session.rollback()
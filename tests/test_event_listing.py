@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.pub_sub.entity import Event
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+async def add_events(session_maker) -> None:
+    """Twenty events, one a minute: even ones on daily-digest and PROCESSED, odd ones on weekly-digest and FAILED."""
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        for i in range(20):
+            await uow.events.add(
+                Event(
+                    message_id=str(i),
+                    topic="daily-digest" if i % 2 == 0 else "weekly-digest",
+                    event_type="DailyDigest" if i < 10 else "WeeklyDigest",
+                    status=EventStatus.PROCESSED if i % 2 == 0 else EventStatus.FAILED,
+                    processing_started_at=PUBLISHED_AT,
+                    published_at=PUBLISHED_AT + timedelta(minutes=i),
+                    attempts=1,
+                )
+            )
+
+
+async def listed(session_maker, **filters) -> list[str]:
+    async with session_maker() as session:
+        return [event.message_id async for event in EventRepository(session).list(**filters)]
+
+
+async def test_list_filters_events(session_maker):
+    await add_events(session_maker)
+
+    assert await listed(session_maker) == [str(i) for i in range(20)]
+    assert await listed(session_maker, status=EventStatus.FAILED) == [str(i) for i in range(1, 20, 2)]
+    daily_weekly = await listed(session_maker, topic="daily-digest", event_type="WeeklyDigest")
+    assert daily_weekly == ["10", "12", "14", "16", "18"]
+    assert await listed(
+        session_maker,
+        published_from=PUBLISHED_AT + timedelta(minutes=5),
+        published_until=PUBLISHED_AT + timedelta(minutes=8),
+    ) == ["5", "6", "7"]
+    assert await listed(session_maker, topic="unknown-topic") == []
+
+
+async def test_list_walks_keyset_pages_and_resumes_after_an_id(session_maker):
+    await add_events(session_maker)
+
+    async with session_maker() as session:
+        repository = EventRepository(session)
+        with patch.object(AsyncSession, "stream", autospec=True, side_effect=AsyncSession.stream) as stream:
+            events = [event async for event in repository.list(page_size=6)]
+        # Pages of 6, 6, 6 and 2 rows, each its own query.
+        assert stream.await_count == 4
+        assert [event.message_id for event in events] == [str(i) for i in range(20)]
+        assert events[3].topic == "weekly-digest" and events[3].event_type == "DailyDigest"
+        # Rows are not kept in the session.
+        assert len(session.identity_map) == 0
+
+        resumed = [event.message_id async for event in repository.list(after_id=events[11].id, limit=5, page_size=2)]
+        assert resumed == ["12", "13", "14", "15", "16"]
+
+        stream = repository.list(page_size=6)
+        assert (await anext(stream)).message_id == "0"
+        await stream.aclose()
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.application.queries.events import DeliveryStatsQuery
+from app.domain.entities.pub_sub.entity import DeliveryCount, Event, EventOutcome
+from app.domain.entities.pub_sub.value_objects import EventStatus, TimeBucket
+from app.infrastructure.adapters.database.event_partition_maintainer import EventPartitionMaintainer
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import (
+    SqlAlchemyReadOnlyUnitOfWork,
+    SqlAlchemyUnitOfWork,
+)
+from app.infrastructure.sqla_persistence.mappings.event_stats import event_stats_table
+from app.setup.config.settings import PartitionSettings
+
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+async def add_processing(session_maker, count: int, topic: str = "daily-digest") -> list[tuple[str, str, datetime]]:
+    """`count` PROCESSING events, one every 20 seconds from 09:00."""
+    keys = []
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        for i in range(count):
+            event = Event(
+                message_id=f"{topic}-{i}",
+                topic=topic,
+                event_type="DailyDigest",
+                status=EventStatus.PROCESSING,
+                processing_started_at=PUBLISHED_AT,
+                published_at=PUBLISHED_AT + timedelta(seconds=20 * i),
+            )
+            await uow.events.add(event)
+            keys.append((event.message_id, event.topic, event.published_at))
+    return keys
+
+
+async def delivery_stats(session_maker, bucket: TimeBucket, **filters) -> list[tuple]:
+    query = DeliveryStatsQuery(SqlAlchemyReadOnlyUnitOfWork(session_maker()))
+    counts = await query(bucket, PUBLISHED_AT, PUBLISHED_AT + timedelta(hours=1), **filters)
+    return [(count.bucket.minute, count.status, count.count) for count in counts]
+
+
+async def test_settling_events_maintains_the_rollup(session_maker):
+    keys = await add_processing(session_maker, 9)
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        # 09:00-09:01 processed, 09:01-09:02 failed.
+        updated = await uow.events.finalise_many(
+            [
+                EventOutcome(message_id, topic, published_at, EventStatus.PROCESSED if i < 3 else EventStatus.FAILED)
+                for i, (message_id, topic, published_at) in enumerate(keys[:6])
+            ]
+        )
+        assert updated == 6
+        # Not PROCESSING any more, so neither updated nor counted again.
+        assert await uow.events.finalise_many([EventOutcome(*keys[0], EventStatus.PROCESSED)]) == 0
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        # The handlers of 09:02 died.
+        assert await uow.events.reap_stale_processing(PUBLISHED_AT + timedelta(days=1), PUBLISHED_AT, limit=10) == 3
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        await uow.events.transition_many(keys[3:5], EventStatus.FAILED, EventStatus.DEAD_LETTERED)
+        # Replays are not outcomes.
+        await uow.events.transition_many(keys[3:4], EventStatus.DEAD_LETTERED, EventStatus.FAILED)
+
+    assert await delivery_stats(session_maker, TimeBucket.MINUTE) == [
+        (0, EventStatus.PROCESSED, 3),
+        (1, EventStatus.FAILED, 3),
+        (1, EventStatus.DEAD_LETTERED, 2),
+        (2, EventStatus.FAILED, 3),
+    ]
+    assert await delivery_stats(session_maker, TimeBucket.HOUR) == [
+        (0, EventStatus.FAILED, 6),
+        (0, EventStatus.PROCESSED, 3),
+        (0, EventStatus.DEAD_LETTERED, 2),
+    ]
+
+
+async def test_compaction_folds_old_minutes_into_hours(session_maker):
+    maintainer = EventPartitionMaintainer(session_maker, PartitionSettings(STATS_COMPACT_AFTER_DAYS=7))
+    await maintainer.run_once(PUBLISHED_AT)
+    for topic in ("daily-digest", "weekly-digest"):
+        keys = await add_processing(session_maker, 6, topic)
+        async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+            await uow.events.finalise_many([EventOutcome(*key, EventStatus.PROCESSED) for key in keys])
+
+    # Not old enough yet.
+    assert (await maintainer.run_once(PUBLISHED_AT + timedelta(days=6))).stats_compacted == 0
+    assert (await maintainer.run_once(PUBLISHED_AT + timedelta(days=8))).stats_compacted == 2
+
+    async with session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(event_stats_table)) == 2
+    query = DeliveryStatsQuery(SqlAlchemyReadOnlyUnitOfWork(session_maker()))
+    counts = await query(TimeBucket.MINUTE, PUBLISHED_AT, PUBLISHED_AT + timedelta(hours=1), topic="weekly-digest")
+    assert counts == [DeliveryCount(PUBLISHED_AT, "weekly-digest", "DailyDigest", EventStatus.PROCESSED, 6)]
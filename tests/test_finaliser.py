@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import orjson
+import pytest
+from sqlalchemy import text
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.common.exceptions.email import EmailDeliveryError
+from app.application.common.ports.email_sender import EmailSender
+from app.domain.entities.pub_sub.entity import EventOutcome, PubSubMessage
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.batch_event_finaliser import BatchEventFinaliser
+from app.infrastructure.adapters.database.repositories.event_repository import EventRepository
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.setup.config.settings import PubSubSettings
+
+TOPIC = "daily-digest"
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+PAYLOAD = {"username": "den@hotmail.com", "incorrect_words": [{"Italian": "Fiore", "English": "Flower"}]}
+
+
+def make_message(message_id: str) -> PubSubMessage:
+    return PubSubMessage(SimpleNamespace(message_id=message_id), PAYLOAD, {}, "DailyDigest", PUBLISHED_AT, TOPIC)
+
+
+async def statuses(session_maker, *message_ids: str) -> dict[str, EventStatus]:
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        return {m: (await uow.events.get_by_id_and_topic(m, TOPIC)).status for m in message_ids}
+
+
+async def test_outcomes_are_flushed_together_before_handlers_return(session_maker):
+    finaliser = BatchEventFinaliser(session_maker, PubSubSettings(FINALISE_FLUSH_INTERVAL_S=0.05))
+    sender = Mock(spec=EmailSender)
+    sender.send = AsyncMock()
+    returned: dict[str, EventStatus] = {}
+
+    async def handle(message_id: str) -> None:
+        async with session_maker() as session:
+            await GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session), finaliser=finaliser)(
+                make_message(message_id)
+            )
+        # What the consumer would see at ack time.
+        returned.update(await statuses(session_maker, message_id))
+
+    finalise_many = EventRepository.finalise_many
+    with patch.object(EventRepository, "finalise_many", autospec=True, side_effect=finalise_many) as spy:
+        await asyncio.gather(*(handle(str(i)) for i in range(20)))
+    await finaliser.stop()
+
+    assert returned == {str(i): EventStatus.PROCESSED for i in range(20)}
+    assert spy.await_count < 20
+    assert sum(len(call.args[1]) for call in spy.await_args_list) == 20
+
+
+async def test_handler_raises_when_its_outcome_is_not_committed(session_maker):
+    finaliser = BatchEventFinaliser(session_maker, PubSubSettings())
+    sender = Mock(spec=EmailSender)
+    sender.send = AsyncMock()
+
+    with patch.object(EventRepository, "finalise_many", side_effect=RuntimeError("db down")):
+        with pytest.raises(RuntimeError, match="failed to flush"):
+            async with session_maker() as session:
+                await GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session), finaliser=finaliser)(
+                    make_message("1")
+                )
+    await finaliser.stop()
+
+    # Left for a redelivery or the reaper.
+    assert await statuses(session_maker, "1") == {"1": EventStatus.PROCESSING}
+
+
+async def test_failed_outcome_schedules_the_retry_and_keeps_the_payload(session_maker):
+    finaliser = BatchEventFinaliser(session_maker, PubSubSettings())
+    sender = Mock(spec=EmailSender)
+    sender.send = AsyncMock(side_effect=EmailDeliveryError)
+
+    with pytest.raises(EmailDeliveryError):
+        async with session_maker() as session:
+            await GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session), finaliser=finaliser)(make_message("1"))
+    await finaliser.stop()
+
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        event = await uow.events.get_by_id_and_topic("1", TOPIC)
+    assert event.status == EventStatus.FAILED
+    assert event.next_attempt_at > datetime.now(timezone.utc)
+    assert orjson.loads(event.payload) == PAYLOAD
+
+
+async def test_finalise_many_only_settles_processing_events(session_maker):
+    sender = Mock(spec=EmailSender)
+    sender.send = AsyncMock()
+    async with session_maker() as session:
+        await GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session))(make_message("1"))
+    async with session_maker() as session:
+        # As if its handler were still running.
+        await session.execute(text("UPDATE event SET status = 'PROCESSING' WHERE message_id = '1'"))
+        await session.commit()
+    async with session_maker() as session:
+        await GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session))(make_message("2"))
+
+    retry_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        updated = await uow.events.finalise_many(
+            [
+                EventOutcome("1", TOPIC, PUBLISHED_AT, EventStatus.FAILED, retry_at, b"{}"),
+                EventOutcome("2", TOPIC, PUBLISHED_AT, EventStatus.FAILED, retry_at, b"{}"),
+            ]
+        )
+    # "2" was PROCESSED already: nothing to settle.
+    assert updated == 1
+    assert await statuses(session_maker, "1", "2") == {"1": EventStatus.FAILED, "2": EventStatus.PROCESSED}
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        event = await uow.events.get_by_id_and_topic("1", TOPIC)
+    assert event.next_attempt_at == retry_at
+    # The payload stored on claim is kept.
+    assert orjson.loads(event.payload) == PAYLOAD
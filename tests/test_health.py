@@ -0,0 +1,111 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from app.application.common.ports.connection_pool import PoolMonitor, PoolStats
+from app.application.common.ports.event_subscriber import EventConsumer, SubscriberHealth, SubscriberState
+from app.infrastructure.observability.health import HealthProbe
+from app.infrastructure.observability.loop_lag import EVENT_LOOP_BLOCKED, BlockingCallDetector, LoopLagMonitor
+from app.setup.config.settings import HealthSettings
+
+SETTINGS = HealthSettings(LOOP_LAG_INTERVAL_S=0.02, BLOCKING_THRESHOLD_S=0.05, READY_MAX_BACKLOG=10)
+
+
+def pool_stats(checked_out: int, capacity: int = 10) -> PoolStats:
+    return PoolStats(
+        size=capacity,
+        capacity=capacity,
+        checked_out=checked_out,
+        overflow=0,
+        checkouts=0,
+        overflow_connects=0,
+        timeouts=0,
+        invalidated=0,
+        wait_buckets={"+Inf": 0},
+        wait_count=0,
+        wait_sum_s=0.0,
+    )
+
+
+def make_probe(subscriber: SubscriberHealth, checked_out: int = 0, lag_s: float = 0.0) -> HealthProbe:
+    consumer = MagicMock(spec=EventConsumer)
+    consumer.health.return_value = subscriber
+    pool = MagicMock(spec=PoolMonitor)
+    pool.stats.return_value = pool_stats(checked_out)
+    loop_lag = LoopLagMonitor(SETTINGS)
+    loop_lag.observe(lag_s)
+    return HealthProbe(consumer, pool, loop_lag, SETTINGS)
+
+
+def failing(report) -> set[str]:
+    return {check.name for check in report.checks if not check.ok}
+
+
+def test_a_healthy_pod_is_live_and_ready():
+    probe = make_probe(SubscriberHealth(SubscriberState.RUNNING, 0, backlog=3), checked_out=5, lag_s=0.01)
+
+    assert probe.liveness().ok
+    assert probe.readiness().ok
+
+
+def test_a_degraded_pod_is_taken_out_of_rotation_but_kept_alive():
+    probe = make_probe(SubscriberHealth(SubscriberState.BACKOFF, 2, backlog=11), checked_out=9, lag_s=0.3)
+
+    assert probe.liveness().ok
+    readiness = probe.readiness()
+    assert not readiness.ok
+    assert failing(readiness) == {"subscriber", "event_loop_lag_s", "database_pool", "email_backlog"}
+
+
+def test_a_failed_subscriber_or_a_stuck_loop_fails_liveness():
+    assert failing(make_probe(SubscriberHealth(SubscriberState.FAILED, 10)).liveness()) == {"subscriber"}
+    assert failing(make_probe(SubscriberHealth(SubscriberState.RUNNING, 0), lag_s=6.0).liveness()) == {
+        "event_loop_lag_s"
+    }
+
+
+async def test_loop_lag_monitor_sees_a_blocked_loop(caplog):
+    monitor = LoopLagMonitor(SETTINGS)
+    monitor.start(asyncio.get_running_loop())
+    try:
+        await asyncio.sleep(0.05)
+        assert monitor.lag_s < 0.05
+
+        time.sleep(0.1)  # blocks the loop, as a synchronous call in a handler would
+        await asyncio.sleep(0.05)
+        # Still reported after later, punctual samples.
+        assert monitor.lag_s >= 0.07
+        assert any("Event loop lagged" in record.getMessage() for record in caplog.records)
+    finally:
+        await monitor.stop()
+
+
+def slow_sync_call() -> None:
+    time.sleep(0.2)
+
+
+async def test_blocking_call_detector_logs_the_blocking_stack(caplog):
+    detector = BlockingCallDetector(HealthSettings(BLOCKING_DETECTOR=True, BLOCKING_THRESHOLD_S=0.05))
+    blocked = EVENT_LOOP_BLOCKED.labels("test_health.py:slow_sync_call")
+    before = blocked.value
+    detector.start(asyncio.get_running_loop())
+    try:
+        await asyncio.sleep(0.1)
+        assert not caplog.records
+
+        slow_sync_call()
+        await asyncio.sleep(0.1)
+    finally:
+        await detector.stop()
+
+    reports = [record.getMessage() for record in caplog.records if "Event loop blocked" in record.getMessage()]
+    assert len(reports) == 1  # one report per stall, however long it lasts
+    assert "in slow_sync_call\n    time.sleep(0.2)" in reports[0]
+    assert blocked.value == before + 1
+
+
+async def test_blocking_call_detector_is_off_by_default():
+    detector = BlockingCallDetector(HealthSettings())
+    detector.start(asyncio.get_running_loop())
+    assert detector._task is None
+    await detector.stop()
@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from googleapiclient.errors import HttpError
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.common.exceptions.email import EmailDeliveryError
+from app.application.common.exceptions.event import EventProcessedError
+from app.application.common.ports.connection_pool import PoolMonitor, PoolStats
+from app.application.common.ports.email_sender import EmailSender
+from app.config import Config
+from app.domain.entities.pub_sub.entity import PubSubMessage
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.adapters.email import smtp_email_sender
+from app.infrastructure.observability import pipeline_metrics
+from app.infrastructure.observability.metrics import MetricsRegistry
+from app.infrastructure.observability.pipeline_metrics import PipelineEventMetrics
+from app.presentation.common.http_api_routers.root import metrics
+
+
+def test_registry_renders_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    sends = registry.counter("sends", "Emails sent.", ("result",))
+    depth = registry.gauge("depth", "Queue depth.")
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    sends.labels("ok").inc()
+    sends.labels("ok").inc(2)
+    sends.labels('bad "quote"').inc()
+    depth.set_function(lambda: 7)
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP sends Emails sent.",
+        "# TYPE sends counter",
+        'sends_total{result="bad \\"quote\\""} 1',
+        'sends_total{result="ok"} 3',
+        "# HELP depth Queue depth.",
+        "# TYPE depth gauge",
+        "depth 7",
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+    with pytest.raises(ValueError):
+        registry.counter("sends", "Again.")
+
+
+async def test_interactor_records_claims_and_outcomes(db_session):
+    sender = Mock(spec=EmailSender)
+    sender.send = AsyncMock()
+    message = PubSubMessage(
+        SimpleNamespace(message_id="metrics-1"),
+        {"username": "den@hotmail.com", "incorrect_words": []},
+        {},
+        "DailyDigest",
+        datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc),
+        "daily-digest",
+    )
+    processed = pipeline_metrics.EVENT_OUTCOMES.labels("PROCESSED")
+    rejected = pipeline_metrics.EVENT_REJECTED.labels("PROCESSED")
+    outcomes_before, rejected_before = processed.value, rejected.value
+    claims_before = pipeline_metrics.EVENT_CLAIM_SECONDS.count
+    finalised_before = pipeline_metrics.EVENT_FINALISE_SECONDS.count
+
+    interactor = GameDigestInteractor(sender, SqlAlchemyUnitOfWork(db_session), metrics=PipelineEventMetrics())
+    await interactor(message)
+    with pytest.raises(EventProcessedError):
+        await interactor(message)
+
+    assert processed.value == outcomes_before + 1
+    assert rejected.value == rejected_before + 1
+    assert pipeline_metrics.EVENT_CLAIM_SECONDS.count == claims_before + 2
+    assert pipeline_metrics.EVENT_FINALISE_SECONDS.count == finalised_before + 1
+
+
+async def test_a_rejected_gmail_send_is_counted_and_raised():
+    service = MagicMock()
+    service.users().messages().send().execute.side_effect = HttpError(Mock(status=500, reason="boom"), b"")
+    errors = pipeline_metrics.EMAIL_SEND_ERRORS.labels(HttpError.__name__)
+    errors_before = errors.value
+
+    with (
+        patch.object(smtp_email_sender.Credentials, "from_authorized_user_file"),
+        patch.object(smtp_email_sender, "build", return_value=service),
+        pytest.raises(EmailDeliveryError),
+    ):
+        sender = smtp_email_sender.SmtpEmailSender(MagicMock(spec=Config, EMAIL_USERNAME="digest@hotmail.com"))
+        await sender.send("den@hotmail.com", "Digest", "<p>Hi</p>")
+
+    assert errors.value == errors_before + 1
+
+
+def test_metrics_endpoint_exports_the_pipeline_and_the_pool():
+    pool = MagicMock(spec=PoolMonitor)
+    pool.stats.return_value = PoolStats(
+        size=5,
+        capacity=6,
+        checked_out=2,
+        overflow=0,
+        checkouts=40,
+        overflow_connects=0,
+        timeouts=1,
+        invalidated=0,
+        wait_buckets={"0.001": 30, "+Inf": 40},
+        wait_count=40,
+        wait_sum_s=0.5,
+    )
+
+    class PoolProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def pool_monitor(self) -> PoolMonitor:
+            return pool
+
+    app = FastAPI()
+    app.get("/metrics")(metrics)
+    setup_dishka(make_async_container(PoolProvider()), app)
+    pipeline_metrics.MESSAGES_RECEIVED.inc()
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE pubsub_messages_received counter" in lines
+    assert any(line.startswith("pubsub_messages_received_total ") for line in lines)
+    assert "db_pool_checked_out 2" in lines
+    assert "db_pool_timeouts_total 1" in lines
+    assert 'db_pool_wait_seconds_bucket{le="+Inf"} 40' in lines
+    assert "db_pool_wait_seconds_count 40" in lines
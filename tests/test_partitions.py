@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, text
+
+from app.domain.entities.pub_sub.entity import Event
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.event_partition_maintainer import EventPartitionMaintainer
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.sqla_persistence.mappings.event import event_table, event_topics
+from app.setup.config.settings import PartitionSettings
+
+TOPIC = "daily-digest"
+NOW = datetime(2026, 10, 21, 15, 30, tzinfo=timezone.utc)  # a Wednesday
+
+
+async def attached(session_maker) -> list[str]:
+    async with session_maker() as session:
+        return [p.name for p in await EventPartitionMaintainer.partitions(session)]
+
+
+async def add_event(session_maker, message_id: str, published_at: datetime) -> None:
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        await uow.events.add(
+            Event(
+                message_id=message_id,
+                topic=TOPIC,
+                event_type="DailyDigest",
+                status=EventStatus.PROCESSED,
+                processing_started_at=published_at,
+                published_at=published_at,
+            )
+        )
+
+
+async def test_maintainer_premakes_weekly_partitions(session_maker):
+    maintainer = EventPartitionMaintainer(session_maker, PartitionSettings(INTERVAL="week", PREMAKE=2))
+
+    result = await maintainer.run_once(NOW)
+
+    assert result.created == ["event_p20261019", "event_p20261026", "event_p20261102"]
+    assert (await maintainer.run_once(NOW)).created == []
+
+    await add_event(session_maker, "1", NOW)
+    await add_event(session_maker, "2", NOW + timedelta(days=7))
+    await add_event(session_maker, "3", NOW + timedelta(days=60))
+    async with session_maker() as session:
+        rows = await session.execute(text("SELECT message_id, tableoid::regclass::text FROM event ORDER BY message_id"))
+    assert rows.all() == [("1", "event_p20261019"), ("2", "event_p20261026"), ("3", "event_default")]
+
+
+async def test_switching_to_daily_skips_ranges_already_covered(session_maker):
+    await EventPartitionMaintainer(session_maker, PartitionSettings(INTERVAL="week", PREMAKE=1)).run_once(NOW)
+    daily = EventPartitionMaintainer(session_maker, PartitionSettings(INTERVAL="day", PREMAKE=13))
+
+    result = await daily.run_once(NOW)
+
+    # Everything up to the 2nd of November sits in the two weekly partitions already.
+    assert result.created == ["event_p20261102", "event_p20261103"]
+
+
+@pytest.mark.parametrize("mode", ["drop", "detach"])
+async def test_maintainer_expires_partitions_past_retention(session_maker, mode):
+    maintainer = EventPartitionMaintainer(
+        session_maker, PartitionSettings(INTERVAL="day", PREMAKE=1, RETENTION_DAYS=2, EXPIRE_MODE=mode)
+    )
+    await maintainer.run_once(NOW)
+
+    result = await maintainer.run_once(NOW + timedelta(days=3))
+
+    assert result.expired == ["event_p20261021"]
+    assert await attached(session_maker) == ["event_p20261022", "event_p20261024", "event_p20261025"]
+    async with session_maker() as session:
+        leftover = await session.scalar(text("SELECT to_regclass('event_p20261021')::text"))
+        if leftover:
+            await session.execute(text(f"DROP TABLE {leftover}"))
+            await session.commit()
+    assert leftover == ("event_p20261021" if mode == "detach" else None)
+
+
+async def test_lookup_by_publish_time_is_pruned_to_one_partition(session_maker):
+    await EventPartitionMaintainer(session_maker, PartitionSettings(INTERVAL="day", PREMAKE=3)).run_once(NOW)
+    query = select(event_table).where(
+        event_table.c.message_id == "1",
+        event_table.c.topic_id == event_topics.id_of(TOPIC),
+        event_table.c.published_at == NOW + timedelta(days=1),
+    )
+
+    async with session_maker() as session:
+        compiled = query.compile(session.bind, compile_kwargs={"literal_binds": True})
+        plan = "\n".join((await session.execute(text(f"EXPLAIN {compiled}"))).scalars())
+
+    assert "event_p20261022" in plan
+    assert "event_p20261021" not in plan
+    assert "event_default" not in plan
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.infrastructure.adapters.database.pool_metrics import PoolMetrics
+from app.infrastructure.sqla_persistence.engine import build_async_engine
+from app.setup.config.settings import SqlaEngineSettings
+
+
+async def test_pool_metrics_track_occupancy_overflow_and_waits(dsn: str):
+    settings = SqlaEngineSettings(
+        ECHO=False,
+        ECHO_POOL=False,
+        POOL_SIZE=1,
+        MAX_OVERFLOW=1,
+        POOL_TIMEOUT_S=0.2,
+        STATEMENT_TIMEOUT_MS=1500,
+        APPLICATION_NAME="pool-metrics-test",
+    )
+    metrics = PoolMetrics()
+    engine = build_async_engine(dsn, settings, metrics)
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            held = metrics.stats()
+            assert (held.size, held.checked_out, held.overflow, held.overflow_connects) == (1, 2, 1, 1)
+
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+            # The per-connection settings reached the server.
+            assert await first.scalar(text("SHOW statement_timeout")) == "1500ms"
+            assert await second.scalar(text("SELECT current_setting('application_name')")) == "pool-metrics-test"
+
+        async def borrow() -> None:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT pg_sleep(0.05)"))
+
+        await asyncio.gather(*(borrow() for _ in range(4)))
+    finally:
+        await engine.dispose()
+
+    stats = metrics.stats()
+    assert stats.checked_out == 0
+    assert stats.timeouts == 1
+    assert stats.checkouts == 6
+    # Every checkout attempt is timed, including the one that gave up.
+    assert stats.wait_count == 7
+    assert stats.wait_buckets["+Inf"] == 7
+    # The timed-out checkout waited the full POOL_TIMEOUT_S, and two of the four borrowers queued behind the others.
+    assert stats.wait_buckets["0.1"] == 6
+    assert stats.wait_buckets["0.025"] <= 4
+    assert stats.wait_sum_s >= 0.2 + 2 * 0.05
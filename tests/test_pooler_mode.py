@@ -0,0 +1,286 @@
+"""
+A transaction-mode pooler stand-in, speaking the Postgres wire protocol like
+PgBouncer with `pool_mode = transaction`: clients are authenticated by the
+pooler itself, and each transaction borrows whichever server session is free,
+which goes back to the pool at the first ReadyForQuery reporting "idle".
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import struct
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from urllib.parse import urlparse
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.common.exceptions.event import EventProcessedError, EventProcessingError
+from app.application.common.ports.email_sender import EmailSender
+from app.domain.entities.pub_sub.entity import PubSubMessage
+from app.domain.entities.pub_sub.value_objects import EventStatus
+from app.infrastructure.adapters.database.pool_metrics import PoolMetrics
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.sqla_persistence.engine import build_async_engine
+from app.setup.config.settings import PostgresDsn, SqlaEngineSettings
+
+SSL_REQUEST = 80877103
+GSS_ENC_REQUEST = 80877104
+PROTOCOL_3 = 196608
+
+
+def message(kind: bytes, body: bytes = b"") -> bytes:
+    return kind + struct.pack("!I", len(body) + 4) + body
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes]:
+    kind = await reader.readexactly(1)
+    (length,) = struct.unpack("!I", await reader.readexactly(4))
+    return kind, await reader.readexactly(length - 4)
+
+
+class ServerSession:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, parameters: list[bytes]):
+        self.reader = reader
+        self.writer = writer
+        self.parameters = parameters
+
+    @classmethod
+    async def open(cls, host: str, port: int, user: str, password: str, database: str) -> "ServerSession":
+        reader, writer = await asyncio.open_connection(host, port)
+        startup = struct.pack("!I", PROTOCOL_3) + b"".join(
+            key + b"\0" + value.encode() + b"\0"
+            for key, value in ((b"user", user), (b"database", database), (b"client_encoding", "UTF8"))
+        )
+        writer.write(struct.pack("!I", len(startup) + 5) + startup + b"\0")
+        parameters: list[bytes] = []
+        scram: dict = {}
+        while True:
+            kind, body = await read_message(reader)
+            if kind == b"R":
+                await cls._authenticate(writer, body, user, password, scram)
+            elif kind == b"S":
+                parameters.append(body)
+            elif kind == b"E":
+                raise ConnectionError(body)
+            elif kind == b"Z":
+                return cls(reader, writer, parameters)
+
+    @staticmethod
+    async def _authenticate(writer: asyncio.StreamWriter, body: bytes, user: str, password: str, scram: dict) -> None:
+        (code,) = struct.unpack("!I", body[:4])
+        if code == 5:  # MD5
+            inner = hashlib.md5(password.encode() + user.encode()).hexdigest().encode()
+            digest = b"md5" + hashlib.md5(inner + body[4:8]).hexdigest().encode()
+            writer.write(message(b"p", digest + b"\0"))
+        elif code == 10:  # SASL: SCRAM-SHA-256
+            scram["bare"] = b"n=,r=" + base64.b64encode(os.urandom(18))
+            first = b"n,," + scram["bare"]
+            writer.write(message(b"p", b"SCRAM-SHA-256\0" + struct.pack("!I", len(first)) + first))
+        elif code == 11:
+            server_first = body[4:]
+            fields = dict(item.split(b"=", 1) for item in server_first.split(b","))
+            salted = hashlib.pbkdf2_hmac("sha256", password.encode(), base64.b64decode(fields[b"s"]), int(fields[b"i"]))
+            client_key = hmac.digest(salted, b"Client Key", "sha256")
+            without_proof = b"c=biws,r=" + fields[b"r"]
+            auth_message = scram["bare"] + b"," + server_first + b"," + without_proof
+            signature = hmac.digest(hashlib.sha256(client_key).digest(), auth_message, "sha256")
+            proof = bytes(a ^ b for a, b in zip(client_key, signature))
+            writer.write(message(b"p", without_proof + b",p=" + base64.b64encode(proof)))
+        elif code not in (0, 12):
+            raise ConnectionError(f"Unsupported authentication request {code}")
+        await writer.drain()
+
+
+class TransactionPooler:
+    def __init__(self, dsn: str, server_sessions: int):
+        url = urlparse(dsn)
+        self._target = (url.hostname, url.port or 5432, url.username, url.password, url.path.lstrip("/"))
+        self._size = server_sessions
+        self._idle: asyncio.Queue[ServerSession] = asyncio.Queue()
+        self._sessions: list[ServerSession] = []
+        self._server: asyncio.Server | None = None
+        self._clients: set[asyncio.Task] = set()
+        self.transactions = 0
+        self.sessions_used: set[int] = set()
+
+    async def start(self) -> int:
+        for _ in range(self._size):
+            session = await ServerSession.open(*self._target)
+            self._sessions.append(session)
+            self._idle.put_nowait(session)
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        for client in self._clients:
+            client.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        for session in self._sessions:
+            session.writer.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(asyncio.current_task())
+        try:
+            if not await self._startup(reader, writer):
+                return
+            # The server session this client's transaction holds, dropped by the relay once it is over.
+            client = SimpleNamespace(session=None, relays=[])
+            while True:
+                kind, body = await read_message(reader)
+                if kind == b"X":
+                    if client.session is not None:
+                        # Gone mid-transaction: roll it back so the session is clean for the next client.
+                        client.session.writer.write(message(b"Q", b"ROLLBACK\0"))
+                    break
+                if client.session is None:
+                    client.session = await self._idle.get()
+                    self.transactions += 1
+                    self.sessions_used.add(id(client.session))
+                    client.relays.append(asyncio.create_task(self._relay(client, writer)))
+                client.session.writer.write(message(kind, body))
+                await client.session.writer.drain()
+            await asyncio.gather(*client.relays)
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.discard(asyncio.current_task())
+            writer.close()
+
+    async def _startup(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        while True:
+            (length,) = struct.unpack("!I", await reader.readexactly(4))
+            body = await reader.readexactly(length - 4)
+            (code,) = struct.unpack("!I", body[:4])
+            if code in (SSL_REQUEST, GSS_ENC_REQUEST):
+                writer.write(b"N")
+                continue
+            if code != PROTOCOL_3:
+                return False
+            break
+        items = body[4:].split(b"\0")
+        parameters = dict(zip(items[0:-2:2], items[1:-2:2]))
+        unsupported = set(parameters) - {b"user", b"database", b"client_encoding", b"application_name"}
+        if unsupported:
+            error = b"SFATAL\0C08P01\0Munsupported startup parameter: " + b", ".join(sorted(unsupported)) + b"\0\0"
+            writer.write(message(b"E", error))
+            return False
+        writer.write(message(b"R", struct.pack("!I", 0)))
+        for parameter in self._sessions[0].parameters:
+            writer.write(message(b"S", parameter))
+        writer.write(message(b"K", struct.pack("!II", 0, 0)))
+        writer.write(message(b"Z", b"I"))
+        await writer.drain()
+        return True
+
+    async def _relay(self, client: SimpleNamespace, writer: asyncio.StreamWriter) -> None:
+        """Forwards the server's replies until the transaction is over, then frees the session."""
+        session = client.session
+        while True:
+            kind, body = await read_message(session.reader)
+            over = kind == b"Z" and body == b"I"
+            if over:
+                # Freed before the client hears about it, so its next message may land on another session.
+                client.session = None
+                self._idle.put_nowait(session)
+            if not writer.is_closing():
+                writer.write(message(kind, body))
+                with suppress(ConnectionError):
+                    await writer.drain()
+            if over:
+                return
+
+
+def engine_settings(**overrides) -> SqlaEngineSettings:
+    return SqlaEngineSettings(**{"ECHO": False, "ECHO_POOL": False, "POOL_SIZE": 20, "MAX_OVERFLOW": 0, **overrides})
+
+
+@asynccontextmanager
+async def transaction_pooler(dsn: str) -> AsyncIterator[TransactionPooler]:
+    """Started in the test's own loop: clients connect from there."""
+    pooler = TransactionPooler(dsn, server_sessions=3)
+    port = await pooler.start()
+    url = urlparse(dsn)
+    pooler.dsn = PostgresDsn(url._replace(netloc=f"{url.username}:{url.password}@127.0.0.1:{port}").geturl())
+    try:
+        yield pooler
+    finally:
+        await pooler.stop()
+
+
+async def test_session_mode_connections_break_behind_a_transaction_pooler(dsn: str):
+    async with transaction_pooler(dsn) as pooler:
+        # A startup option is refused outright, like PgBouncer does.
+        engine = build_async_engine(pooler.dsn, engine_settings(STATEMENT_TIMEOUT_MS=1000), PoolMetrics())
+        with pytest.raises(DBAPIError, match="unsupported startup parameter"):
+            async with engine.connect():
+                pass
+        await engine.dispose()
+
+        # A statement prepared in one transaction's server session is missing from the next one's.
+        engine = build_async_engine(pooler.dsn, engine_settings(PREPARE_THRESHOLD=0, POOL_SIZE=1), PoolMetrics())
+        try:
+            with pytest.raises(DBAPIError, match="prepared statement .* does not exist"):
+                async with engine.connect() as connection:
+                    for _ in range(6):
+                        await connection.execute(text("SELECT 1"))
+                        await connection.commit()
+        finally:
+            await engine.dispose()
+
+
+async def test_transaction_mode_keeps_claims_exclusive_under_concurrency(dsn: str, session_maker):
+    sender = Mock(spec=EmailSender)
+    sent: list[str] = []
+
+    async def send(email, *args, **kwargs) -> None:
+        await asyncio.sleep(0.01)
+        sent.append(email)
+
+    sender.send = AsyncMock(side_effect=send)
+    published_at = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+    async def deliver(pooled_session_maker: async_sessionmaker[AsyncSession], message_id: str) -> None:
+        message = PubSubMessage(
+            SimpleNamespace(message_id=message_id),
+            {"username": f"{message_id}@hotmail.com", "incorrect_words": []},
+            {},
+            "DailyDigest",
+            published_at,
+            "daily-digest",
+        )
+        async with pooled_session_maker() as session:
+            try:
+                await GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session))(message)
+            except (EventProcessingError, EventProcessedError):
+                pass  # a duplicate delivery, as the consumer would ack it
+
+    async with transaction_pooler(dsn) as pooler:
+        engine = build_async_engine(
+            pooler.dsn, engine_settings(POOLER_MODE="transaction", STATEMENT_TIMEOUT_MS=1500), PoolMetrics()
+        )
+        pooled_session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            # Every message is delivered three times at once: 20 client connections over 3 server sessions.
+            await asyncio.gather(*(deliver(pooled_session_maker, str(i % 10)) for i in range(30)))
+            async with pooled_session_maker() as session:
+                # The per-transaction timeout reaches whichever server session runs the transaction.
+                assert await session.scalar(text("SHOW statement_timeout")) == "1500ms"
+        finally:
+            await engine.dispose()
+
+    assert sorted(sent) == sorted(f"{i}@hotmail.com" for i in range(10))
+    assert len(pooler.sessions_used) == 3
+    async with session_maker() as session:
+        statuses = (await session.execute(text("SELECT status::text FROM event"))).scalars().all()
+    assert statuses == [EventStatus.PROCESSED.value] * 10
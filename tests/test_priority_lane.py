@@ -0,0 +1,209 @@
+import asyncio
+from contextlib import AsyncExitStack
+
+import httpx
+import pytest
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.common.exceptions.email import EmailDeliveryError
+from app.application.common.ports.email_sender import EmailSender
+from app.application.common.ports.event_finaliser import EventFinaliser
+from app.application.common.ports.event_metrics import EventMetrics
+from app.application.common.services.inline_event_finaliser import INLINE_EVENT_FINALISER
+from app.application.common.services.null_event_metrics import NULL_EVENT_METRICS
+from app.application.common.services.payload_storage_policy import (
+    DEFAULT_PAYLOAD_STORAGE_POLICY,
+    PayloadStoragePolicy,
+)
+from app.application.common.services.priority_slots import PrioritySlots, current_priority, priority_scope
+from app.application.common.services.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from app.application.events.event_dispatcher import EventDispatcher
+from app.domain.entities.pub_sub.value_objects import EventStatus, Priority
+from app.infrastructure.adapters.application.new_types import EmailSendSlots, SessionSlots
+from app.infrastructure.adapters.database.read_replica_router import ReadReplicaRouter
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.adapters.email.priority_email_sender import PriorityEmailSender
+from app.presentation.common.exception_handler import ExceptionHandler
+from app.presentation.common.fastapi_dependencies import Role
+from app.presentation.common.infrastructure_adapters.auth_context.jwt_access_token_processor import (
+    JwtAccessTokenProcessor,
+)
+from app.presentation.http_controllers.notifications import DIRECT_TOPIC, notifications_router
+from app.setup.config.settings import PrioritySettings
+from app.setup.ioc.di_providers.infrastructure import UserInfrastructureProvider
+
+
+async def test_bulk_callers_leave_the_reserved_slots_to_urgent_ones():
+    slots = PrioritySlots(capacity=3, reserved=1)
+    async with AsyncExitStack() as held:
+        for _ in range(2):
+            await held.enter_async_context(slots.acquire(Priority.BULK))
+
+        bulk = asyncio.create_task(held.enter_async_context(slots.acquire(Priority.BULK)))
+        await asyncio.sleep(0)
+        assert not bulk.done() and slots.waiting == 1
+
+        # The reserved slot, taken straight away by the current task's priority.
+        with priority_scope(Priority.URGENT):
+            await asyncio.wait_for(held.enter_async_context(slots.acquire()), timeout=1)
+        assert slots.in_use == 3
+
+        bulk.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await bulk
+    assert (slots.in_use, slots.waiting) == (0, 0)
+
+
+async def test_waiting_urgent_callers_are_served_first():
+    slots = PrioritySlots(capacity=2, reserved=1)
+    order: list[str] = []
+
+    async def take(name: str, priority: Priority):
+        async with slots.acquire(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async with slots.acquire(Priority.URGENT), slots.acquire(Priority.URGENT):
+        waiters = [asyncio.create_task(take(f"bulk-{n}", Priority.BULK)) for n in range(2)]
+        waiters += [asyncio.create_task(take(f"urgent-{n}", Priority.URGENT)) for n in range(2)]
+        await asyncio.sleep(0)
+        assert slots.waiting == 4
+    await asyncio.gather(*waiters)
+
+    assert order == ["urgent-0", "urgent-1", "bulk-0", "bulk-1"]
+    assert slots.in_use == 0
+
+
+def test_reserving_every_slot_is_refused():
+    with pytest.raises(ValueError):
+        PrioritySlots(capacity=2, reserved=2)
+
+
+class RecordingEmailSender(EmailSender):
+    def __init__(self):
+        self.sent: list[tuple[str, Priority]] = []
+        self.fail = False
+
+    async def send(self, to: str, subject: str, body: str):
+        if self.fail:
+            raise EmailDeliveryError
+        self.sent.append((to, current_priority.get()))
+
+
+def make_container(
+    engine: AsyncEngine,
+    session_maker: async_sessionmaker[AsyncSession],
+    sender: RecordingEmailSender,
+    session_slots: PrioritySlots,
+    email_slots: PrioritySlots,
+    access_token_processor: JwtAccessTokenProcessor,
+) -> AsyncContainer:
+    class PriorityLaneProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        def sessions(self) -> async_sessionmaker[AsyncSession]:
+            return session_maker
+
+        @provide
+        def replica_router(self) -> ReadReplicaRouter:
+            return ReadReplicaRouter([engine])
+
+        @provide
+        def session_slots(self) -> SessionSlots:
+            return SessionSlots(session_slots)
+
+        @provide
+        def email_send_slots(self) -> EmailSendSlots:
+            return EmailSendSlots(email_slots)
+
+        @provide
+        def retry_policy(self) -> RetryPolicy:
+            return DEFAULT_RETRY_POLICY
+
+        @provide
+        def payload_storage_policy(self) -> PayloadStoragePolicy:
+            return DEFAULT_PAYLOAD_STORAGE_POLICY
+
+        @provide
+        def event_finaliser(self) -> EventFinaliser:
+            return INLINE_EVENT_FINALISER
+
+        @provide
+        def event_metrics(self) -> EventMetrics:
+            return NULL_EVENT_METRICS
+
+        @provide(scope=Scope.REQUEST)
+        def email_sender(self, slots: EmailSendSlots) -> EmailSender:
+            return PriorityEmailSender(sender, slots)
+
+        @provide
+        def priority_settings(self) -> PrioritySettings:
+            return PrioritySettings(URGENT_EVENT_TYPES=["DailyDigest"])
+
+        @provide
+        def processor(self) -> JwtAccessTokenProcessor:
+            return access_token_processor
+
+        @provide(scope=Scope.REQUEST)
+        def dispatcher(self, container: AsyncContainer) -> EventDispatcher:
+            dispatcher = EventDispatcher(container)
+            dispatcher.register("DailyDigest", GameDigestInteractor)
+            return dispatcher
+
+    return make_async_container(UserInfrastructureProvider(), PriorityLaneProvider())
+
+
+async def test_urgent_send_runs_inline_on_the_reserved_slots(
+    engine, session_maker, access_token_processor, access_token
+):
+    sender = RecordingEmailSender()
+    session_slots, email_slots = PrioritySlots(capacity=2, reserved=1), PrioritySlots(capacity=2, reserved=1)
+    container = make_container(engine, session_maker, sender, session_slots, email_slots, access_token_processor)
+    app = FastAPI()
+    app.include_router(notifications_router)
+    ExceptionHandler(app).setup_handlers()
+    setup_dishka(container, app)
+
+    payload = {"event_type": "DailyDigest", "data": {"username": "den@hotmail.com", "incorrect_words": []}}
+    try:
+        async with (
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http,
+            # A digest backlog holding every session and mail slot bulk work may have.
+            session_slots.acquire(Priority.BULK),
+            email_slots.acquire(Priority.BULK),
+        ):
+            assert (await http.post("/notifications:send", json=payload)).status_code == 401
+            http.cookies.update(access_token(Role.PUBLISHER))
+
+            response = await asyncio.wait_for(http.post("/notifications:send", json=payload), timeout=5)
+            assert response.status_code == 200
+            sent = response.json()
+            assert sent["status"] == "PROCESSED"
+            assert sender.sent == [("den@hotmail.com", Priority.URGENT)]
+
+            sender.fail = True
+            response = await asyncio.wait_for(http.post("/notifications:send", json=payload), timeout=5)
+            assert response.status_code == 502
+            failed = response.json()
+            assert failed["status"] == "FAILED"
+
+            response = await http.post("/notifications:send", json={"event_type": "DailyDigest", "data": {}})
+            assert response.status_code == 422
+            response = await http.post("/notifications:send", json={"event_type": "WeeklyDigest", "data": {}})
+            assert response.status_code == 422
+            assert len(sender.sent) == 1
+            assert (session_slots.in_use, email_slots.in_use) == (1, 1)
+    finally:
+        await container.close()
+
+    async with SqlAlchemyUnitOfWork(session_maker()) as uow:
+        events = {event.message_id: event async for event in uow.events.list(topic=DIRECT_TOPIC)}
+    assert events[sent["message_id"]].status == EventStatus.PROCESSED
+    # Left to the retry worker.
+    assert events[failed["message_id"]].status == EventStatus.FAILED
+    assert events[failed["message_id"]].next_attempt_at is not None
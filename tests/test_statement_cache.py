@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import event, text
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.infrastructure.adapters.database.repositories.event_repository import (
+    EventRepository,
+    _insert_event,
+    _select_event,
+)
+
+TOPIC = "daily-digest"
+PUBLISHED_AT = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+async def test_hot_path_statements_are_built_once_and_compiled_once(dsn: str):
+    # Timings are in tests/performance/bench_statement_cache.py; this checks the mechanism.
+    lookup = _select_event(True, True)
+    assert lookup is _select_event(True, True)
+    assert _insert_event() is _insert_event()
+    # The cache key is memoized on the statement, so executions after the first skip the key walk too.
+    assert lookup._generate_cache_key() is lookup._generate_cache_key()
+
+    engine = create_async_engine(url=dsn)
+    cache_stats = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM event" in statement and "FOR UPDATE" in statement:
+            cache_stats.append(context.cache_hit)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSession(engine) as session:
+            for i in range(3):
+                await EventRepository(session).get_by_id_and_topic(str(i), TOPIC, PUBLISHED_AT, for_update=True)
+    finally:
+        await engine.dispose()
+
+    assert cache_stats == [CACHE_MISS, CACHE_HIT, CACHE_HIT]
+
+
+async def test_lookup_is_prepared_server_side(dsn: str):
+    threshold = 2
+    engine = create_async_engine(url=dsn, connect_args={"prepare_threshold": threshold})
+    try:
+        async with AsyncSession(engine) as session:
+            # One session keeps one connection, and prepared statements are per connection.
+            for i in range(threshold + 1):
+                await EventRepository(session).get_by_id_and_topic(str(i), TOPIC, PUBLISHED_AT, for_update=True)
+            prepared = (await session.execute(text("SELECT statement FROM pg_prepared_statements"))).scalars().all()
+    finally:
+        await engine.dispose()
+
+    assert any("FROM event" in statement and "FOR UPDATE" in statement for statement in prepared), prepared
@@ -0,0 +1,186 @@
+import asyncio
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, Mock, patch
+
+import orjson
+import pytest
+from dishka import Scope
+from google.cloud import pubsub_v1
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app.application.commands.game_digest import GameDigestInteractor
+from app.application.events.event_dispatcher import EventDispatcher
+from app.config import Config
+from app.infrastructure.adapters.database.sqlalc_unit_of_work import SqlAlchemyUnitOfWork
+from app.infrastructure.adapters.email.smtp_email_sender import SmtpEmailSender
+from app.infrastructure.adapters.pub_sub.pub_sub_event_consumer import PubSubEventConsumer
+from app.infrastructure.observability import tracing
+from app.infrastructure.observability.pipeline_metrics import PipelineEventMetrics
+from app.setup.config.settings import PubSubSettings, TracingSettings
+
+
+@pytest.fixture
+def spans() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    yield exporter
+    tracing.use_tracer(None)
+
+
+def install_tracer(exporter: InMemorySpanExporter, sample_ratio: float) -> None:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracing.use_tracer(provider.get_tracer("test"), sample_ratio)
+
+
+async def deliver(container, dead_letter_writer, session_maker, message_ids: list[str]) -> list[Mock]:
+    """Runs messages through the consumer, from the Pub/Sub callback thread to the ack."""
+
+    async def dispatch(self, message) -> None:
+        async with session_maker() as session:
+            sender = SmtpEmailSender(MagicMock(spec=Config))
+            interactor = GameDigestInteractor(sender, SqlAlchemyUnitOfWork(session), metrics=PipelineEventMetrics())
+            await interactor(message)
+
+    async with container(scope=Scope.REQUEST) as request_container:
+        config = await request_container.get(Config)
+    consumer = PubSubEventConsumer(container, config, PubSubSettings(), dead_letter_writer)
+    consumer.loop = asyncio.get_running_loop()
+    consumer._workers.start(consumer.loop)
+
+    messages = []
+    for message_id in message_ids:
+        message = MagicMock(spec=pubsub_v1.subscriber.message.Message)
+        message.data = orjson.dumps({"username": f"{message_id}@hotmail.com", "incorrect_words": []})
+        message.attributes = {"event_type": "DailyDigest"}
+        message.publish_time = datetime.now(timezone.utc) - timedelta(seconds=2)
+        message.message_id = message_id
+        message.ordering_key = ""
+        messages.append(message)
+
+    with (
+        patch.object(EventDispatcher, "dispatch", dispatch),
+        patch.object(SmtpEmailSender, "gmail_send_message", return_value={"id": "sent"}),
+    ):
+        for message in messages:
+            await asyncio.to_thread(consumer.callback, message)
+        async with asyncio.timeout(10):
+            while not all(message.ack.called for message in messages):
+                await asyncio.sleep(0.01)
+    await consumer._workers.stop()
+    return messages
+
+
+async def test_a_sampled_message_is_traced_from_callback_to_ack(
+    spans, container, dead_letter_writer, session_maker, mock_subscriber_client, mock_producer_client
+):
+    install_tracer(spans, sample_ratio=1.0)
+    with (
+        patch.object(pubsub_v1, "SubscriberClient", return_value=mock_subscriber_client),
+        patch.object(pubsub_v1, "PublisherClient", return_value=mock_producer_client),
+    ):
+        await deliver(container, dead_letter_writer, session_maker, ["traced-1"])
+
+    finished = {span.name: span for span in spans.get_finished_spans()}
+    assert set(finished) == {
+        "pubsub.message",
+        "pubsub.handle",
+        "event.dispatch",
+        "event.claim",
+        "event.process",
+        "email.send",
+        "event.finalise",
+    }
+    root = finished["pubsub.message"]
+    assert root.parent is None
+    assert root.attributes["broker_lag_s"] >= 2
+    assert {span.context.trace_id for span in finished.values()} == {root.context.trace_id}
+    assert finished["pubsub.handle"].parent.span_id == root.context.span_id
+    assert finished["pubsub.handle"].attributes["queue_wait_s"] >= 0
+    dispatch = finished["event.dispatch"]
+    for name in ("event.claim", "event.process", "email.send", "event.finalise"):
+        assert finished[name].parent.span_id == dispatch.context.span_id
+    assert dispatch.attributes["event.status"] == "PROCESSED"
+    # Reconstructed stage spans line up: claim, then process around the send, then finalise.
+    assert finished["event.claim"].end_time <= finished["event.process"].start_time
+    assert finished["event.process"].start_time <= finished["email.send"].start_time
+    assert finished["email.send"].end_time <= finished["event.process"].end_time
+    assert finished["event.process"].end_time <= finished["event.finalise"].start_time
+    # The root span covers everything up to the ack.
+    assert max(span.end_time for span in finished.values()) == root.end_time
+
+
+async def test_unsampled_messages_record_nothing(
+    spans, container, dead_letter_writer, session_maker, mock_subscriber_client, mock_producer_client
+):
+    install_tracer(spans, sample_ratio=0.0)
+    with (
+        patch.object(pubsub_v1, "SubscriberClient", return_value=mock_subscriber_client),
+        patch.object(pubsub_v1, "PublisherClient", return_value=mock_producer_client),
+    ):
+        messages = await deliver(container, dead_letter_writer, session_maker, ["untraced-1", "untraced-2"])
+
+    assert all(message.ack.called for message in messages)
+    assert spans.get_finished_spans() == ()
+
+
+async def test_root_span_is_ended_when_the_message_cannot_be_scheduled(
+    spans, container, dead_letter_writer, mock_subscriber_client, mock_producer_client
+):
+    install_tracer(spans, sample_ratio=1.0)
+    with (
+        patch.object(pubsub_v1, "SubscriberClient", return_value=mock_subscriber_client),
+        patch.object(pubsub_v1, "PublisherClient", return_value=mock_producer_client),
+    ):
+        async with container(scope=Scope.REQUEST) as request_container:
+            config = await request_container.get(Config)
+        consumer = PubSubEventConsumer(container, config, PubSubSettings(), dead_letter_writer)
+    # Shutting down: the loop the consumer hands messages to is gone.
+    consumer.loop = asyncio.new_event_loop()
+    consumer.loop.close()
+
+    message = MagicMock(spec=pubsub_v1.subscriber.message.Message)
+    message.data = orjson.dumps({"username": "den@hotmail.com", "incorrect_words": []})
+    message.attributes = {"event_type": "DailyDigest"}
+    message.publish_time = datetime.now(timezone.utc)
+    message.message_id = "closed-1"
+    message.ordering_key = ""
+    consumer.callback(message)
+
+    message.nack.assert_called_once()
+    [root] = spans.get_finished_spans()
+    assert root.name == "pubsub.message"
+    assert not root.status.is_ok
+
+
+def test_tracing_overhead_at_the_default_sampling_ratio(spans):
+    """
+    Every span helper a message goes through, timed in a loop. A message takes
+    milliseconds (a claim, a finalise and a Gmail call), so staying under 1% of
+    one means tens of microseconds at most.
+    """
+
+    def message() -> None:
+        root = tracing.start_root_span("pubsub.message", {"broker_lag_s": 0.1})
+        with tracing.span("pubsub.handle", {"queue_wait_s": 0.0}, context=tracing.context_of(root)):
+            with tracing.span("event.dispatch"):
+                tracing.record_span("event.claim", 0.001)
+                with tracing.span("email.send"):
+                    pass
+                tracing.record_span("event.process", 0.002, ended_s_ago=0.001)
+                tracing.record_span("event.finalise", 0.001)
+                tracing.set_attributes({"event.status": "PROCESSED"})
+        tracing.end_span(root)
+
+    install_tracer(spans, sample_ratio=TracingSettings().sample_ratio)
+    iterations = 5_000
+    started = time.perf_counter()
+    for _ in range(iterations):
+        message()
+    per_message_s = (time.perf_counter() - started) / iterations
+
+    assert per_message_s < 50e-6
+    assert 0 < len(spans.get_finished_spans()) < iterations
@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.domain.entities.pub_sub.value_objects import Priority
+from app.infrastructure.adapters.pub_sub.worker_pool import KeyedWorkerPool
+
+
+@asynccontextmanager
+async def started_pool() -> AsyncIterator[KeyedWorkerPool]:
+    worker_pool = KeyedWorkerPool(size=4)
+    worker_pool.start(asyncio.get_running_loop())
+    try:
+        yield worker_pool
+    finally:
+        await worker_pool.stop()
+
+
+async def test_same_key_jobs_are_serialised():
+    running: list[str] = []
+    finished: list[int] = []
+
+    async def job(n: int):
+        running.append("den@hotmail.com")
+        assert running.count("den@hotmail.com") == 1
+        await asyncio.sleep(0.01)
+        running.remove("den@hotmail.com")
+        finished.append(n)
+
+    async with started_pool() as pool:
+        await asyncio.gather(*(pool.run("den@hotmail.com", job, n) for n in range(5)))
+
+    assert finished == [0, 1, 2, 3, 4]
+
+
+async def test_different_keys_run_in_parallel():
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocking():
+        started.set()
+        await release.wait()
+        return "slow"
+
+    async def quick():
+        return "quick"
+
+    keys = ["a", "b", "c", "d", "e", "f"]
+    slow_key = keys[0]
+    other_key = next(key for key in keys if hash(key) % 4 != hash(slow_key) % 4)
+
+    async with started_pool() as pool:
+        slow = asyncio.create_task(pool.run(slow_key, blocking))
+        await started.wait()
+
+        assert await asyncio.wait_for(pool.run(other_key, quick), timeout=1) == "quick"
+        release.set()
+        assert await slow == "slow"
+
+
+async def test_keyless_job_does_not_wait_behind_a_busy_shard():
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocking():
+        started.set()
+        await release.wait()
+        return "slow"
+
+    async def quick():
+        return "quick"
+
+    async with started_pool() as pool:
+        slow = asyncio.create_task(pool.run(None, blocking))
+        await started.wait()
+
+        # The busy shard's queue is as empty as the idle ones'.
+        assert await asyncio.wait_for(pool.run(None, quick), timeout=1) == "quick"
+        release.set()
+        assert await slow == "slow"
+
+
+async def test_job_exception_is_propagated():
+    async def failing():
+        raise ValueError("poison")
+
+    async with started_pool() as pool:
+        with pytest.raises(ValueError):
+            await pool.run(None, failing)
+
+
+async def test_urgent_jobs_are_served_before_queued_bulk_jobs():
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def job(name: str):
+        if name == "running":
+            await release.wait()
+        order.append(name)
+
+    async with started_pool() as pool:
+        # All on one shard, queued behind the job it is running.
+        running = asyncio.create_task(pool.run("den@hotmail.com", job, "running"))
+        await asyncio.sleep(0)
+        queued = [asyncio.create_task(pool.run("den@hotmail.com", job, f"bulk-{n}")) for n in range(3)]
+        queued += [
+            asyncio.create_task(pool.run("den@hotmail.com", job, f"urgent-{n}", priority=Priority.URGENT))
+            for n in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(running, *queued)
+
+    assert order == ["running", "urgent-0", "urgent-1", "bulk-0", "bulk-1", "bulk-2"]
+
+
+async def test_keyless_urgent_job_skips_a_busy_shard():
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def job(name: str):
+        if name.startswith("bulk"):
+            await release.wait()
+        order.append(name)
+
+    async with started_pool() as pool:
+        bulk = asyncio.create_task(pool.run(None, job, "bulk"))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(pool.run(None, job, "urgent", priority=Priority.URGENT), timeout=1)
+        release.set()
+        await bulk
+
+    assert order == ["urgent", "bulk"]